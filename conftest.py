@@ -0,0 +1,18 @@
+import sys
+
+collect_ignore = []
+
+# Module ``validx.aio`` uses ``async def`` syntax of Python 3.5,
+# its tests run coroutines by ``asyncio.run()`` of Python 3.7,
+# and pools of parallel and streaming validation
+# are initialized by ``initializer`` parameter of Python 3.7 executors
+if sys.version_info < (3, 5):
+    collect_ignore += ["validx/aio.py"]
+if sys.version_info < (3, 7):
+    collect_ignore += [
+        "tests/test_aio.py",
+        "tests/test_parallel.py",
+        "tests/test_stream.py",
+        "tests/benchmarks/test_parallel.py",
+        "tests/benchmarks/test_stream.py",
+    ]
@@ -9,12 +9,19 @@ requirements = []
 
 if platform.python_implementation() == "CPython":
     try:
+        from Cython import __version__ as cython_version
         from Cython.Build import cythonize
     except ImportError:
         print("Unable to import Cython. Pure Python version will be used.")
     else:
         directives = {"language_level": sys.version_info[0]}
-        ext_modules = cythonize("validx/cy/*.pyx", compiler_directives=directives)
+        if tuple(map(int, cython_version.split(".")[:2])) >= (3, 1):
+            # Extensions guard their shared mutable state by locks,
+            # so free-threaded builds of CPython should not re-enable GIL
+            directives["freethreading_compatible"] = True
+        ext_modules = cythonize(
+            ["validx/cy/*.pyx", "validx/exc/cy/*.pyx"], compiler_directives=directives
+        )
 
 with open("validx/__init__.py") as f:
     version = next(line for line in f if line.startswith("__version__"))
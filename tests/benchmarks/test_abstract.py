@@ -0,0 +1,97 @@
+import pytest
+
+from validx import interning
+
+
+def schema(module):
+    return module.Dict(
+        {
+            u"id": module.Int(min=0),
+            u"name": module.Str(maxlen=100),
+            u"tags": module.List(module.Str()),
+        }
+    )
+
+
+records = [
+    {u"id": i, u"name": u"record %d" % i, u"tags": [u"a", u"b"]} for i in range(1000)
+]
+
+
+@pytest.mark.benchmark(group="Validate Many")
+def test_loop(module, benchmark):
+    v = schema(module)
+
+    def validate(values):
+        return [v(value) for value in values]
+
+    assert benchmark(validate, records) == records
+
+
+@pytest.mark.benchmark(group="Validate Many")
+def test_validate_many(module, benchmark):
+    v = schema(module)
+    assert benchmark(v.validate_many, records) == (records, [])
+
+
+@pytest.mark.benchmark(group="Validate Many")
+def test_validate_many_invalid(module, benchmark):
+    v = schema(module)
+    values = records + [{u"id": -1}] * 100
+    results, errors = benchmark(v.validate_many, values)
+    assert len(errors) == 300
+
+
+SCHEMA = {
+    "__class__": "Dict",
+    "schema": {
+        u"id": {"__class__": "Int", "min": 0},
+        u"name": {"__class__": "Str", "maxlen": 255},
+        u"email": {"__class__": "Str", "maxlen": 255},
+        u"tags": {"__class__": "List", "item": {"__class__": "Str", "maxlen": 255}},
+    },
+}
+
+
+@pytest.mark.benchmark(group="Load")
+def test_load(module, benchmark):
+    v = benchmark(module.Validator.load, SCHEMA)
+    assert v.dump() == SCHEMA
+
+
+@pytest.mark.benchmark(group="Load")
+def test_load_interned(module, benchmark):
+    interning.enable()
+    try:
+        v = benchmark(module.Validator.load, SCHEMA)
+    finally:
+        interning.disable()
+        interning.clear()
+    assert v.dump() == SCHEMA
+
+
+DOCUMENT = {
+    u"id": 1,
+    u"name": u"document",
+    u"tags": [u"tag %d" % i for i in range(1000)],
+}
+
+PATCH = [{"op": "add", "path": "/tags/-", "value": u"tag"}]
+
+
+@pytest.mark.benchmark(group="Revalidate")
+def test_full_validation(module, benchmark):
+    v = schema(module)
+    old = v(DOCUMENT)
+
+    def patch(value):
+        return v(dict(value, tags=value[u"tags"] + [u"tag"]))
+
+    assert len(benchmark(patch, old)[u"tags"]) == 1001
+
+
+@pytest.mark.benchmark(group="Revalidate")
+def test_revalidate(module, benchmark):
+    v = schema(module)
+    old = v(DOCUMENT)
+    assert len(benchmark(v.revalidate, old, PATCH)[u"tags"]) == 1001
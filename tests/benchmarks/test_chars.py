@@ -57,3 +57,56 @@ def test_bytes_nullable(module, benchmark):
 def test_bytes_minlen_maxlen(module, benchmark):
     v = module.Bytes(minlen=1, maxlen=10)
     assert benchmark(v, b"abc") == b"abc"
+
+
+@pytest.mark.benchmark(group="Bytes Buffers")
+def test_bytes_copy(module, benchmark):
+    v = module.Bytes(maxlen=1 << 22)
+    value = bytearray(1 << 22)
+    assert len(benchmark(lambda: v(bytes(value)))) == 1 << 22
+
+
+@pytest.mark.benchmark(group="Bytes Buffers")
+def test_bytes_buffer(module, benchmark):
+    v = module.Bytes(maxlen=1 << 22, buffer=True)
+    value = bytearray(1 << 22)
+    assert len(benchmark(v, value)) == 1 << 22
+
+
+@pytest.mark.benchmark(group="Str Patterns")
+def test_str_pattern_many(module, benchmark):
+    # Much more distinct patterns than the internal cache of ``re`` can hold
+    validators = [module.Str(pattern=u"^item%d-[a-z]+$" % i) for i in range(1500)]
+    values = [u"item%d-abc" % i for i in range(1500)]
+
+    def validate():
+        for v, value in zip(validators, values):
+            v(value)
+
+    benchmark(validate)
+
+
+@pytest.mark.benchmark(group="Str Patterns")
+def test_str_pattern_many_re_match(benchmark):
+    # Baseline: calling ``re.match()`` on each validation
+    import re
+
+    pairs = [(u"^item%d-[a-z]+$" % i, u"item%d-abc" % i) for i in range(1500)]
+
+    def validate():
+        for pattern, value in pairs:
+            re.match(pattern, value)
+
+    benchmark(validate)
+
+
+@pytest.mark.benchmark(group="Str Patterns")
+def test_str_pattern_many_init(module, benchmark):
+    # Loading thousands of schemas, which share the same set of patterns
+    pats = [u"^item%d-[a-z]+$" % i for i in range(1500)]
+
+    def load():
+        for pattern in pats:
+            module.Str(pattern=pattern)
+
+    benchmark(load)
@@ -0,0 +1,58 @@
+# coding: utf-8
+
+import pytest
+
+
+def city(module):
+    return module.Dict(
+        {
+            u"location": module.Dict(
+                {
+                    u"lat": module.Float(min=-90, max=90),
+                    u"lng": module.Float(min=-180, max=180),
+                }
+            ),
+            u"name": module.Str(),
+            u"alt_names": module.List(module.Str()),
+            u"population": module.Dict(
+                {u"city": module.Int(min=0), u"metro": module.Int(min=0)}
+            ),
+        }
+    )
+
+
+data = {
+    u"location": {u"lat": 50.0464284, u"lng": 19.7246942},
+    u"name": u"Kraków",
+    u"alt_names": [u"Krakow", u"Cracow"],
+    u"population": {u"city": 766739, u"metro": 1725894},
+}
+
+
+@pytest.mark.benchmark(group="Compiler")
+def test_interpreted(module, benchmark):
+    v = city(module)
+    assert benchmark(v, data) == data
+
+
+@pytest.mark.benchmark(group="Compiler")
+def test_compiled(module, benchmark):
+    v = city(module).compile()
+    assert benchmark(v, data) == data
+
+
+# =============================================================================
+
+
+@pytest.mark.benchmark(group="Compiler List")
+def test_list_interpreted(module, benchmark):
+    v = module.List(module.Int(min=0, max=1000))
+    value = list(range(1000))
+    assert benchmark(v, value) == value
+
+
+@pytest.mark.benchmark(group="Compiler List")
+def test_list_compiled(module, benchmark):
+    v = module.List(module.Int(min=0, max=1000)).compile()
+    value = list(range(1000))
+    assert benchmark(v, value) == value
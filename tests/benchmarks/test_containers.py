@@ -1,5 +1,7 @@
 import pytest
 
+from validx import exc
+
 
 @pytest.mark.benchmark(group="List")
 def test_list(module, benchmark):
@@ -25,6 +27,38 @@ def test_list_unique(module, benchmark):
     assert benchmark(v, [1, 2, 3, 3, 2, 1]) == [1, 2, 3]
 
 
+@pytest.mark.benchmark(group="List Streaming")
+def test_list_large(module, benchmark):
+    v = module.List(module.Int(min=0))
+    value = list(range(10000))
+    assert benchmark(v, value) == value
+
+
+@pytest.mark.benchmark(group="List Streaming")
+def test_list_iter_validate(module, benchmark):
+    v = module.List(module.Int(min=0))
+
+    def consume():
+        # Neither input, nor output is materialized
+        for item in v.iter_validate(i for i in range(10000)):
+            pass
+        return item
+
+    assert benchmark(consume) == 9999
+
+
+@pytest.mark.benchmark(group="List Streaming")
+def test_list_iter_validate_unique_window(module, benchmark):
+    v = module.List(module.Int(min=0), unique=True)
+
+    def consume():
+        for item in v.iter_validate((i % 1000 for i in range(10000)), 100):
+            pass
+        return item
+
+    assert benchmark(consume) == 999
+
+
 # =============================================================================
 
 
@@ -85,3 +119,169 @@ def test_dict_extra(module, benchmark):
 def test_dict_dispose(module, benchmark):
     v = module.Dict({u"x": module.Int(), u"y": module.Int()}, dispose=(u"z",))
     assert benchmark(v, {u"x": 1, u"y": 2, u"z": 3}) == {u"x": 1, u"y": 2}
+
+
+# =============================================================================
+
+
+@pytest.mark.benchmark(group="Dict Wide")
+@pytest.mark.parametrize("width", [50, 100, 200])
+def test_dict_wide(module, benchmark, width):
+    v = module.Dict(dict((u"key%d" % i, module.Int()) for i in range(width)))
+    value = dict((u"key%d" % i, i) for i in range(width))
+    assert benchmark(v, value) == value
+
+
+@pytest.mark.benchmark(group="Dict Wide")
+@pytest.mark.parametrize("width", [50, 100, 200])
+def test_dict_wide_generic(module, benchmark, width):
+    v = module.Dict(
+        dict((u"key%d" % i, module.Int()) for i in range(width)), dispose=[u"_"]
+    )
+    value = dict((u"key%d" % i, i) for i in range(width))
+    assert benchmark(v, value) == value
+
+
+@pytest.mark.benchmark(group="Dict Wide")
+def test_dict_wide_optional(module, benchmark):
+    v = module.Dict(
+        dict((u"key%d" % i, module.Int()) for i in range(150)),
+        optional=[u"key%d" % i for i in range(100, 150)],
+    )
+    value = dict((u"key%d" % i, i) for i in range(100))
+    assert benchmark(v, value) == value
+
+
+@pytest.mark.benchmark(group="Dict Defaults")
+@pytest.mark.parametrize(
+    "default",
+    [0, u"x", (1, 2), [1, 2], {u"x": [1, 2]}, list],
+    ids=["int", "str", "tuple", "list", "dict", "callable"],
+)
+def test_dict_many_defaults(module, benchmark, default):
+    keys = [u"key%d" % i for i in range(50)]
+    v = module.Dict(
+        dict((key, module.Any()) for key in keys),
+        defaults=dict((key, default) for key in keys),
+    )
+    assert len(benchmark(v, {})) == 50
+
+
+def columns_schema(module):
+    return module.Dict(
+        {
+            u"id": module.Int(min=0),
+            u"price": module.Float(min=0, max=1000),
+            u"qty": module.Int(min=1, max=100),
+        }
+    )
+
+
+@pytest.mark.benchmark(group="Dict Columns")
+def test_dict_rows(module, benchmark):
+    v = columns_schema(module)
+    rows = [{u"id": i, u"price": i / 100.0, u"qty": i % 100 + 1} for i in range(10000)]
+    results, errors = benchmark(v.validate_many, rows)
+    assert len(results) == 10000
+
+
+@pytest.mark.benchmark(group="Dict Columns")
+def test_dict_columns(module, benchmark):
+    v = columns_schema(module)
+    columns = {
+        u"id": list(range(10000)),
+        u"price": [i / 100.0 for i in range(10000)],
+        u"qty": [i % 100 + 1 for i in range(10000)],
+    }
+    results, errors = benchmark(v.validate_columns, columns)
+    assert len(results[u"id"]) == 10000
+
+
+@pytest.mark.benchmark(group="Dict Columns")
+def test_dict_columns_arrays(module, benchmark):
+    numpy = pytest.importorskip("numpy")
+    v = columns_schema(module)
+    columns = {
+        u"id": numpy.arange(10000),
+        u"price": numpy.arange(10000) / 100.0,
+        u"qty": numpy.arange(10000) % 100 + 1,
+    }
+    results, errors = benchmark(v.validate_columns, columns)
+    assert len(results[u"id"]) == 10000
+
+
+@pytest.mark.benchmark(group="Reject Path")
+def test_list_reject(module, benchmark):
+    v = module.List(module.Int())
+    value = [u"x"] * 10000
+
+    def reject():
+        try:
+            v(value)
+        except exc.SchemaError as e:
+            return len(e)
+
+    assert benchmark(reject) == 10000
+
+
+@pytest.mark.benchmark(group="Reject Path")
+def test_list_reject_fail_fast(module, benchmark):
+    v = module.List(module.Int(), fail_fast=True)
+    value = [u"x"] * 10000
+
+    def reject():
+        try:
+            v(value)
+        except exc.SchemaError as e:
+            return len(e)
+
+    assert benchmark(reject) == 1
+
+
+@pytest.mark.benchmark(group="Reject Path")
+def test_dict_reject(module, benchmark):
+    v = module.Dict({u"items": module.List(module.Dict({u"x": module.Int()}))})
+    value = {u"items": [{u"x": u"x", u"y": 1}] * 10000}
+
+    def reject():
+        try:
+            v(value)
+        except exc.SchemaError as e:
+            return len(e)
+
+    assert benchmark(reject) == 20000
+
+
+@pytest.mark.benchmark(group="Reject Path")
+def test_dict_reject_fail_fast(module, benchmark):
+    v = module.Dict(
+        {
+            u"items": module.List(
+                module.Dict({u"x": module.Int()}, fail_fast=True), fail_fast=True
+            )
+        },
+        fail_fast=True,
+    )
+    value = {u"items": [{u"x": u"x", u"y": 1}] * 10000}
+
+    def reject():
+        try:
+            v(value)
+        except exc.SchemaError as e:
+            return len(e)
+
+    assert benchmark(reject) == 1
+
+
+@pytest.mark.benchmark(group="Reject Path")
+def test_nested_reject(module, benchmark):
+    v = module.List(module.Dict({u"x": module.List(module.Tuple(module.Int()))}))
+    value = [{u"x": [(u"x",)] * 10}] * 1000
+
+    def reject():
+        try:
+            v(value)
+        except exc.SchemaError as e:
+            return len(e)
+
+    assert benchmark(reject) == 10000
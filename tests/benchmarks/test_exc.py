@@ -0,0 +1,45 @@
+import pytest
+
+
+@pytest.mark.benchmark(group="Errors")
+def test_construct(exc, benchmark):
+    def construct():
+        errors = []
+        for num in range(1000):
+            error = exc.MinValueError(expected=0, actual=-num)
+            error.add_context(u"x").add_context(num).add_context(u"items")
+            errors.append(error)
+        return exc.SchemaError(errors)
+
+    assert len(benchmark(construct)) == 1000
+
+
+@pytest.mark.benchmark(group="Errors")
+def test_nested(exc, benchmark):
+    def nested():
+        errors = []
+        for num in range(100):
+            step = [
+                exc.InvalidTypeError(expected=int, actual=str).add_context(exc.Step(i))
+                for i in range(10)
+            ]
+            errors.extend(exc.SchemaError(step).add_context(num))
+        return exc.SchemaError(errors).add_context(exc.EXTRA_VALUE)
+
+    assert len(benchmark(nested)) == 1000
+
+
+@pytest.mark.benchmark(group="Errors")
+def test_format(exc, benchmark):
+    error = exc.SchemaError(
+        [
+            exc.MaxLengthError(expected=10, actual=num).add_context(num)
+            for num in range(1000)
+        ]
+    )
+
+    def format():
+        error.sort(reverse=True)
+        return exc.format_error(error)
+
+    assert len(benchmark(format)) == 1000
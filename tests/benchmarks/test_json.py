@@ -0,0 +1,93 @@
+import json
+from importlib import import_module
+
+import pytest
+
+from validx import exc
+
+
+def schema(module):
+    return module.List(
+        module.Dict(
+            {
+                u"id": module.Int(min=0),
+                u"name": module.Str(maxlen=100),
+                u"email": module.Str(maxlen=100),
+                u"tags": module.List(module.Str(maxlen=100)),
+            }
+        )
+    )
+
+
+def document(size):
+    # About 90 bytes per record
+    records = [
+        {
+            u"id": i,
+            u"name": u"record %d" % i,
+            u"email": u"record%d@example.com" % i,
+            u"tags": [u"a", u"b"],
+        }
+        for i in range(size // 90)
+    ]
+    return json.dumps(records).encode("utf-8")
+
+
+SIZES = {"1KB": 2 ** 10, "1MB": 2 ** 20, "50MB": 50 * 2 ** 20}
+
+_documents = {}
+
+
+@pytest.fixture(params=sorted(SIZES, key=SIZES.get))
+def data(request, benchmark):
+    if SIZES[request.param] > 2 ** 20 and benchmark.disabled:
+        pytest.skip("Large documents are used only if benchmarks are enabled")
+    if request.param not in _documents:
+        _documents[request.param] = document(SIZES[request.param])
+    return _documents[request.param]
+
+
+@pytest.mark.benchmark(group="JSON")
+def test_json_loads(module, benchmark, data):
+    v = schema(module)
+
+    def validate(data):
+        return v(json.loads(data))
+
+    assert len(benchmark(validate, data)) == len(json.loads(data))
+
+
+@pytest.mark.benchmark(group="JSON")
+def test_loads(module, benchmark, data):
+    v = schema(module)
+    loads = import_module(module.__name__ + ".decoder").loads
+    assert len(benchmark(loads, v, data)) == len(json.loads(data))
+
+
+@pytest.mark.benchmark(group="JSON Invalid")
+def test_json_loads_invalid(module, benchmark):
+    v = module.Dict({u"id": module.Int()}, fail_fast=True)
+    data = document(2 ** 20).join([b'{"records": ', b', "id": 1}'])
+
+    def validate(data):
+        try:
+            v(json.loads(data))
+        except exc.ValidationError as e:
+            return e
+
+    assert isinstance(benchmark(validate, data), exc.SchemaError)
+
+
+@pytest.mark.benchmark(group="JSON Invalid")
+def test_loads_invalid(module, benchmark):
+    v = module.Dict({u"id": module.Int()}, fail_fast=True)
+    loads = import_module(module.__name__ + ".decoder").loads
+    data = document(2 ** 20).join([b'{"records": ', b', "id": 1}'])
+
+    def validate(data):
+        try:
+            loads(v, data)
+        except exc.ValidationError as e:
+            return e
+
+    assert isinstance(benchmark(validate, data), exc.SchemaError)
@@ -0,0 +1,35 @@
+import pytest
+
+from validx import metrics
+
+
+def schema(module, alias):
+    return module.Dict(
+        {
+            u"id": module.Int(min=0),
+            u"name": module.Str(minlen=1, maxlen=50),
+            u"tags": module.List(module.Str(), maxlen=10),
+            u"score": module.Float(min=0, max=1),
+        },
+        alias=alias,
+    )
+
+
+RECORD = {u"id": 1, u"name": u"item", u"tags": [u"a", u"b"], u"score": 0.5}
+
+
+@pytest.mark.benchmark(group="Metrics")
+def test_plain(module, benchmark):
+    v = schema(module, "record")
+    assert benchmark(v, RECORD) == RECORD
+
+
+@pytest.mark.benchmark(group="Metrics")
+def test_metered(module, benchmark):
+    schema(module, "record")
+    metrics.enable(metrics.Aggregator())
+    try:
+        v = module.instances.get("record")
+        assert benchmark(v, RECORD) == RECORD
+    finally:
+        metrics.disable()
@@ -83,3 +83,28 @@ def test_float_inf(module, benchmark):
 def test_float_min_max(module, benchmark):
     v = module.Float(min=1.0, max=10.0)
     assert benchmark(v, 5.5) == 5.5
+
+
+@pytest.mark.benchmark(group="Numeric Arrays")
+def test_float_list(module, benchmark):
+    v = module.List(module.Float(min=0, max=1))
+    values = [num / 100000.0 for num in range(100000)]
+    assert len(benchmark(v, values)) == 100000
+
+
+@pytest.mark.benchmark(group="Numeric Arrays")
+def test_float_array(module, benchmark):
+    numpy = pytest.importorskip("numpy")
+    v = module.List(module.Float(min=0, max=1))
+    values = numpy.linspace(0, 1, 100000)
+    assert len(benchmark(v, values)) == 100000
+
+
+@pytest.mark.benchmark(group="Numeric Arrays")
+def test_int_array_invalid(module, benchmark):
+    numpy = pytest.importorskip("numpy")
+    v = module.Int(min=0, max=1000)
+    values = numpy.arange(-50000, 50000)
+    results, errors = benchmark(v.validate_many, values)
+    assert len(results) == 1001
+    assert len(errors) == 98999
@@ -0,0 +1,68 @@
+import pytest
+
+from validx import parallel
+
+
+def schema(module):
+    return module.Dict(
+        {
+            u"id": module.Int(min=0),
+            u"name": module.Str(minlen=1, maxlen=50),
+            u"tags": module.List(module.Str(), maxlen=10),
+            u"score": module.Float(min=0, max=1),
+        }
+    )
+
+
+RECORDS = [
+    {u"id": i, u"name": u"item%d" % i, u"tags": [u"a", u"b"], u"score": i / 2e4}
+    for i in range(20000)
+]
+
+
+@pytest.mark.benchmark(group="Parallel")
+def test_sequential(module, benchmark):
+    v = schema(module)
+    results, errors = benchmark(v.validate_many, RECORDS)
+    assert len(results) == len(RECORDS)
+
+
+@pytest.mark.benchmark(group="Parallel")
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_process(module, benchmark, workers):
+    v = schema(module)
+    results, errors = benchmark.pedantic(
+        parallel.validate_many,
+        args=(v, RECORDS),
+        kwargs={"workers": workers, "chunksize": 1000},
+        rounds=3,
+    )
+    assert len(results) == len(RECORDS)
+
+
+@pytest.mark.benchmark(group="Parallel")
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_thread(module, benchmark, workers):
+    v = schema(module)
+    results, errors = benchmark.pedantic(
+        parallel.validate_many,
+        args=(v, RECORDS),
+        kwargs={"workers": workers, "backend": "thread", "chunksize": 1000},
+        rounds=3,
+    )
+    assert len(results) == len(RECORDS)
+
+
+@pytest.mark.benchmark(group="Parallel Arrays")
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_thread_arrays(module, benchmark, workers):
+    numpy = pytest.importorskip("numpy")
+    v = module.Float(min=0, max=1)
+    values = numpy.linspace(0, 1, 1000000)
+    results, errors = benchmark.pedantic(
+        parallel.validate_many,
+        args=(v, values),
+        kwargs={"workers": workers, "backend": "thread", "chunksize": 100000},
+        rounds=5,
+    )
+    assert len(results) == len(values)
@@ -1,3 +1,4 @@
+
 import pytest
 
 
@@ -14,3 +15,28 @@ def test_all_of(module, benchmark):
 def test_any_of(module, benchmark):
     v = module.OneOf(module.Int(min=0), module.Int(min=10))
     assert benchmark(v, 1) == 1
+
+
+def union(module, tag):
+    return module.OneOf(
+        *[
+            module.Dict({u"type": tag(module.Const(u"t%d" % num)), u"x": module.Int()})
+            for num in range(20)
+        ]
+    )
+
+
+@pytest.mark.benchmark(group="OneOf Union")
+def test_one_of_union(module, benchmark):
+    v = union(module, lambda const: const)
+    value = {u"type": u"t19", u"x": 1}
+    assert benchmark(v, value) == value
+
+
+@pytest.mark.benchmark(group="OneOf Union")
+def test_one_of_union_sequential(module, benchmark):
+    # Wrapped constant is not recognized as discriminator,
+    # so that all steps are tried sequentially
+    v = union(module, module.AllOf)
+    value = {u"type": u"t19", u"x": 1}
+    assert benchmark(v, value) == value
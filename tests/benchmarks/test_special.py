@@ -35,3 +35,97 @@ def test_const(module, benchmark):
 def test_any(module, benchmark):
     v = module.Any()
     assert benchmark(v, 1) == 1
+
+
+# =============================================================================
+
+
+def config(module):
+    return module.Dict(
+        {
+            "host": module.Str(pattern=r"^[a-z0-9.-]+$"),
+            "port": module.Int(min=1, max=65535),
+            "tags": module.List(module.Str(minlen=1), unique=True),
+            "options": module.Dict(extra=(module.Str(), module.Int())),
+        }
+    )
+
+
+CONFIG = {
+    "host": "localhost",
+    "port": 8080,
+    "tags": ["a", "b", "c"],
+    "options": {"x": 1, "y": 2, "z": 3},
+}
+
+
+@pytest.mark.benchmark(group="Cached Dict")
+def test_uncached(module, benchmark):
+    v = config(module)
+    assert benchmark(v, CONFIG) == CONFIG
+
+
+@pytest.mark.benchmark(group="Cached Dict")
+def test_cached(module, benchmark):
+    v = module.Cached(config(module))
+    assert benchmark(v, CONFIG) == CONFIG
+
+
+EMAIL = u"x" * 300 + u"@example.com"
+
+
+@pytest.mark.benchmark(group="Cached Pattern")
+def test_uncached_pattern(module, benchmark):
+    v = module.Str(pattern=r"^([a-z0-9]+[._-]?)+[a-z0-9]+@([a-z0-9-]+\.)+[a-z]{2,}$")
+    assert benchmark(v, EMAIL) == EMAIL
+
+
+@pytest.mark.benchmark(group="Cached Pattern")
+def test_cached_pattern(module, benchmark):
+    v = module.Cached(
+        module.Str(pattern=r"^([a-z0-9]+[._-]?)+[a-z0-9]+@([a-z0-9-]+\.)+[a-z]{2,}$")
+    )
+    assert benchmark(v, EMAIL) == EMAIL
+
+
+def event(module):
+    return module.Dict(
+        {
+            u"type": module.Str(),
+            u"user": module.Dict({u"id": module.Int(), u"name": module.Str()}),
+            u"items": module.List(
+                module.Dict({u"sku": module.Str(), u"qty": module.Int(min=1)})
+            ),
+            u"meta": module.Dict(extra=(module.Str(), module.Str())),
+        }
+    )
+
+
+EVENT = {
+    u"type": u"order",
+    u"user": {u"id": 1, u"name": u"x"},
+    u"items": [{u"sku": u"sku-%d" % num, u"qty": 1} for num in range(100)],
+    u"meta": {u"key-%d" % num: u"value" for num in range(100)},
+}
+
+
+@pytest.mark.benchmark(group="Lazy Dict")
+def test_eager(module, benchmark):
+    v = event(module)
+
+    def read(value):
+        result = v(value)
+        return result[u"type"], result[u"user"][u"id"]
+
+    assert benchmark(read, EVENT) == (u"order", 1)
+
+
+@pytest.mark.benchmark(group="Lazy Dict")
+def test_lazy(module, benchmark):
+    v = module.Lazy(event(module))
+
+    def read(value):
+        result = v(value)
+        return result[u"type"], result[u"user"][u"id"]
+
+    assert benchmark(read, EVENT) == (u"order", 1)
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from validx import exc, stream
+
+
+def schema(module):
+    return module.Dict(
+        {
+            u"id": module.Int(min=0),
+            u"name": module.Str(maxlen=100),
+            u"email": module.Str(maxlen=100),
+            u"tags": module.List(module.Str(maxlen=100)),
+        }
+    )
+
+
+SIZES = {"1MB": 2 ** 20, "2GB": 2 * 2 ** 30}
+
+
+@pytest.fixture(scope="module")
+def files(tmpdir_factory):
+    # Files are generated once per size, chunk by chunk
+    directory = tmpdir_factory.mktemp("stream")
+    paths = {}
+
+    def generate(size):
+        if size not in paths:
+            path = directory.join("%d.jsonl" % size)
+            with path.open("wb") as file:
+                written = 0
+                i = 0
+                while written < size:
+                    chunk = b"".join(
+                        json.dumps(
+                            {
+                                u"id": i + j if (i + j) % 100 else -1,
+                                u"name": u"record %d" % (i + j),
+                                u"email": u"record%d@example.com" % (i + j),
+                                u"tags": [u"a", u"b"],
+                            }
+                        ).encode("utf-8")
+                        + b"\n"
+                        for j in range(1000)
+                    )
+                    file.write(chunk)
+                    written += len(chunk)
+                    i += 1000
+            paths[size] = str(path)
+        return paths[size]
+
+    return generate
+
+
+@pytest.fixture(params=sorted(SIZES, key=SIZES.get))
+def path(request, benchmark, files):
+    if SIZES[request.param] > 2 ** 20 and benchmark.disabled:
+        pytest.skip("Large files are used only if benchmarks are enabled")
+    return files(SIZES[request.param])
+
+
+@pytest.mark.benchmark(group="JSON Lines")
+def test_json_loads(module, benchmark, path):
+    v = schema(module)
+
+    def validate(path):
+        counts = [0, 0]
+        with open(path, "rb") as file:
+            for line in file:
+                try:
+                    v(json.loads(line))
+                except exc.ValidationError:
+                    counts[1] += 1
+                else:
+                    counts[0] += 1
+        return tuple(counts)
+
+    valid, invalid = benchmark.pedantic(validate, (path,), rounds=3)
+    assert invalid == (valid + invalid) // 100
+
+
+@pytest.mark.benchmark(group="JSON Lines")
+@pytest.mark.parametrize("workers", [0, 4])
+def test_validate_lines(module, benchmark, path, workers):
+    v = schema(module)
+    valid, invalid = benchmark.pedantic(
+        stream.validate_lines, (v, path), {"workers": workers}, rounds=3
+    )
+    assert invalid == (valid + invalid) // 100
+
+
+@pytest.mark.benchmark(group="JSON Lines")
+def test_validate_lines_mmap(module, benchmark, path):
+    v = schema(module)
+    valid, invalid = benchmark.pedantic(
+        stream.validate_lines, (v, path), {"workers": 4, "mmap": True}, rounds=3
+    )
+    assert invalid == (valid + invalid) // 100
@@ -1,15 +1,26 @@
 import pytest
 
 from validx import py  # noqa
+from validx.exc import py as exc_py  # noqa
 
 try:
     from validx import cy  # noqa
 except ImportError:
     pass
 
+try:
+    from validx.exc import cy as exc_cy  # noqa
+except ImportError:
+    pass
+
 
 @pytest.fixture(params=[m for m in ("py", "cy") if m in globals()])
 def module(request):
     result = globals()[request.param]
     yield result
     result.instances.clear()
+
+
+@pytest.fixture(params=[m for m in ("py", "cy") if "exc_" + m in globals()])
+def exc(request):
+    return globals()["exc_" + request.param]
@@ -1,5 +1,13 @@
+from collections import deque
+
 import pytest
 
+from validx import exc
+from validx.compat.colabc import Mapping
+
+
+NoneType = type(None)
+
 
 def test_repr(module):
     v = module.Dict({"x": module.Int(min=0, max=100)}, nullable=True)
@@ -11,6 +19,17 @@ def test_repr(module):
     assert repr(v) == "<Dict(schema=frozendict({'x': <LazyRef(use='foo')>}))>"
 
 
+def test_hash(module):
+    v1 = module.Dict({"x": module.Int(min=0)}, defaults={"x": [1]})
+    v2 = module.Dict({"x": module.Int(min=0)}, defaults={"x": [1]})
+    v3 = module.Dict({"x": module.Int(min=1)}, defaults={"x": [1]})
+    assert v1 == v2
+    assert hash(v1) == hash(v2)
+    assert v1 != v3
+    assert len({v1, v2, v3}) == 2
+    assert hash(module.Int()) != hash(module.Float())
+
+
 def test_load_dump(module):
     data = {
         "__class__": "Dict",
@@ -128,3 +147,46 @@ def test_alias(module):
     assert v3 is not v2
     assert isinstance(v3, module.Str)
     assert v3.nullable is True
+
+
+def test_validate_many(module):
+    v = module.Dict({"x": module.Int(min=0), "y": module.Int(min=0)})
+    values = [{"x": 1, "y": 2}, {"x": -1, "y": "z"}, {"x": 3, "y": 4}, None]
+
+    results, errors = v.validate_many(values)
+    assert results == [{"x": 1, "y": 2}, {"x": 3, "y": 4}]
+    assert errors == [
+        exc.MinValueError(context=deque([1, "x"]), expected=0, actual=-1),
+        exc.InvalidTypeError(context=deque([1, "y"]), expected=int, actual=str),
+        exc.InvalidTypeError(context=deque([3]), expected=Mapping, actual=NoneType),
+    ]
+
+    results, errors = v.validate_many(iter(values), errors="skip")
+    assert results == [{"x": 1, "y": 2}, {"x": 3, "y": 4}]
+    assert errors == []
+
+    with pytest.raises(exc.SchemaError) as info:
+        v.validate_many(values, errors="raise")
+    assert info.value.errors == [
+        exc.MinValueError(context=deque([1, "x"]), expected=0, actual=-1),
+        exc.InvalidTypeError(context=deque([1, "y"]), expected=int, actual=str),
+    ]
+
+    assert v.validate_many([], errors="raise") == ([], [])
+
+    with pytest.raises(ValueError) as info:
+        v.validate_many(values, errors="ignore")
+    assert info.value.args == (
+        "Expected errors to be one of 'collect', 'raise' or 'skip', got 'ignore'",
+    )
+
+
+def test_validate_many_context(module):
+    class MarkContext(module.Validator):
+        def __call__(self, value, __context=None):
+            assert "marked" not in __context
+            __context["marked"] = True
+            return value
+
+    v = MarkContext()
+    assert v.validate_many([1, 2, 3]) == ([1, 2, 3], [])
@@ -0,0 +1,237 @@
+import asyncio
+from collections import deque
+
+import pytest
+
+from validx import exc, aio
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def assert_same(v, value, **kw):
+    """Assert asynchronous validation gives the same results as synchronous one"""
+    try:
+        expected = v(value)
+    except exc.ValidationError as e:
+        with pytest.raises(e.__class__) as info:
+            run(v.avalidate(value, **kw))
+        assert repr(info.value) == repr(e)
+    else:
+        assert repr(run(v.avalidate(value, **kw))) == repr(expected)
+
+
+def make_lookup(module, log=None):
+    class Lookup(module.Validator):
+        """Asynchronous step, that accepts even numbers only"""
+
+        __slots__ = ()
+
+        def __call__(self, value, __context=None):
+            if not isinstance(value, int) or value % 2:
+                raise exc.OptionsError(expected="even", actual=value)
+            return value
+
+        async def __acall__(self, value, __context=None):
+            if log is not None:
+                log.append(("start", value))
+            await asyncio.sleep(0)
+            if log is not None:
+                log.append(("stop", value))
+            return self(value, __context)
+
+    return Lookup()
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+@pytest.mark.parametrize(
+    "schema, values",
+    [
+        ("Int(min=0)", [1, -1, u"x"]),
+        ("List(Int(), minlen=1, maxlen=3)", [[1, 2], [], [1, 2, 3, 4], None, 1]),
+        ("List(Int(), nullable=True, unique=True)", [None, [1, 1, 2], [1, u"x"]]),
+        ("List(Int(), fail_fast=True)", [[1, u"x", u"y"]]),
+        ("List(Lookup())", [[2, 4], [1, 2, 3], u"x"]),
+        ("List(Lookup(), fail_fast=True, unique=True)", [[2, 2, 4], [2, 1, 3]]),
+        ("List(Lookup(), minlen=2)", [[2]]),
+        ("Tuple(Int(), Lookup())", [(1, 2), (1, 3), (u"x", 3), (1,), None, 1]),
+        ("Tuple(Lookup(), Lookup(), nullable=True, fail_fast=True)", [None, (1, 3)]),
+        ("AllOf(Int(min=0), Lookup())", [2, 3, -1]),
+        ("OneOf(Lookup(), Int(min=10))", [2, 11, 3, u"x"]),
+        ("OneOf(Lookup(), Int(min=10), fail_fast=True)", [3]),
+        ("OneOf(Int(), Str())", [1, u"x", None]),
+    ],
+)
+def test_avalidate(module, schema, values, concurrency):
+    namespace = dict(vars(module), Lookup=lambda: make_lookup(module))
+    v = eval(schema, namespace)
+    for value in values:
+        assert_same(v, value, concurrency=concurrency)
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_avalidate_dict(module, fail_fast):
+    lookup = make_lookup(module)
+    v = module.Dict(
+        {
+            "x": module.Int(min=0),
+            "y": lookup,
+            "d": module.List(module.Int()),
+            "o": module.Int(),
+        },
+        defaults={"d": [1]},
+        optional=["o"],
+        minlen=2,
+        maxlen=4,
+        fail_fast=fail_fast,
+    )
+    assert_same(v, {"x": 1, "y": 2})
+    assert_same(v, {"x": -1, "y": 3, "z": 1})
+    assert_same(v, {"x": 1})
+    assert_same(v, {"y": 2, "d": [u"x"]})
+    assert_same(v, [])
+
+    result = run(v.avalidate({"x": 1, "y": 2}))
+    assert result == {"x": 1, "y": 2, "d": [1]}
+    result["d"].append(2)
+    assert run(v.avalidate({"x": 1, "y": 2}))["d"] == [1]
+
+    v = module.Dict(
+        {"d": module.Int()},
+        defaults={"d": u"x"},
+        nullable=True,
+        minlen=2,
+        fail_fast=fail_fast,
+    )
+    assert_same(v, {})
+    assert_same(v, None)
+    assert_same(v, {"d": 1})
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_avalidate_dict_extra(module, fail_fast):
+    from webob.multidict import MultiDict
+
+    v = module.Dict(
+        {"x": module.List(module.Int())},
+        extra=(module.Str(minlen=2), make_lookup(module)),
+        dispose=["w"],
+        multikeys=["x"],
+        fail_fast=fail_fast,
+    )
+    assert_same(v, MultiDict([("x", 1), ("x", 2), (u"yy", 2), ("w", 1)]))
+    assert_same(v, {"x": [1], u"y": 3, u"zz": 3})
+    assert_same(v, {u"y": 2})
+    assert_same(v, {u"yy": 3, u"zz": 3})
+    assert_same(v, {1: 2})
+
+    v = module.Dict({"x": module.Int()}, fail_fast=fail_fast)
+    assert_same(v, {"y": 1, "z": 1})
+
+    v = module.Dict(extra=(module.Str(), make_lookup(module)), maxlen=1)
+    assert_same(v, {u"x": 2})
+    assert_same(v, {u"x": 2, u"y": 4})
+
+
+def test_avalidate_lazy_ref(module):
+    module.Dict(
+        {"x": module.Int(), "nodes": module.List(module.LazyRef("node", maxdepth=2))},
+        optional=["nodes"],
+        alias="node",
+    )
+    v = module.LazyRef("node", maxdepth=2)
+    assert_same(v, {"x": 1, "nodes": [{"x": 2}]})
+    assert_same(v, {"x": 1, "nodes": [{"x": 2, "nodes": [{"x": 3}]}]})
+
+
+def test_avalidate_arrays(module):
+    numpy = pytest.importorskip("numpy")
+    v = module.List(module.Int(min=0))
+    assert_same(v, numpy.array([1, 2, 3]))
+    assert_same(v, numpy.array([1, -2, 3]))
+    assert_same(module.List(make_lookup(module)), numpy.array([2, 4]))
+
+
+@pytest.mark.parametrize(
+    "schema, value",
+    [
+        (
+            lambda m: m.List(m.Dict({"x": m.Int()})),
+            [{"x": i} for i in range(100)],
+        ),
+        (
+            lambda m: m.Dict({"data": m.List(m.Int())}),
+            {"data": list(range(200))},
+        ),
+        (
+            lambda m: m.Tuple(m.Int(), m.Cached(m.Dict(extra=(m.Str(), m.Int())))),
+            (1, dict(("x%d" % i, i) for i in range(100))),
+        ),
+    ],
+)
+def test_avalidate_yields(module, schema, value):
+    # Items of nested containers are counted too
+    v = schema(module)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main(budget):
+        del ticks[:]
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        result = await v.avalidate(value, budget=budget)
+        task.cancel()
+        return result
+
+    assert run(main(10)) == v(value)
+    assert len(ticks) > 10
+    assert run(main(1000)) == v(value)
+    assert len(ticks) == 1
+
+
+def test_avalidate_concurrency(module):
+    log = []
+    v = module.List(make_lookup(module, log))
+
+    assert run(v.avalidate([2, 4, 6])) == [2, 4, 6]
+    assert log == [
+        ("start", 2),
+        ("stop", 2),
+        ("start", 4),
+        ("stop", 4),
+        ("start", 6),
+        ("stop", 6),
+    ]
+
+    del log[:]
+    assert run(v.avalidate([2, 4, 6], concurrency=2)) == [2, 4, 6]
+    assert log == [
+        ("start", 2),
+        ("start", 4),
+        ("stop", 2),
+        ("stop", 4),
+        ("start", 6),
+        ("stop", 6),
+    ]
+
+    with pytest.raises(exc.SchemaError) as info:
+        run(v.avalidate([1, 2, 3], concurrency=3))
+    assert info.value.errors == [
+        exc.OptionsError(context=deque([0]), expected="even", actual=1),
+        exc.OptionsError(context=deque([2]), expected="even", actual=3),
+    ]
+
+
+def test_invalid_params(module):
+    v = module.Int()
+    with pytest.raises(ValueError) as info:
+        run(aio.validate(v, 1, budget=0))
+    assert info.value.args == ("Expected budget to be positive, got 0",)
+    with pytest.raises(ValueError) as info:
+        run(v.avalidate(1, concurrency=0))
+    assert info.value.args == ("Expected concurrency to be positive, got 0",)
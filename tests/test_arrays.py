@@ -0,0 +1,153 @@
+from array import array
+
+import pytest
+
+from validx import arrays
+
+numpy = pytest.importorskip("numpy")
+
+
+def readonly(values):
+    values.setflags(write=False)
+    return values
+
+
+def assert_same(v, values, scalars, mode="collect"):
+    """Assert array is validated exactly as list of scalars"""
+    try:
+        expected = v.validate_many(scalars, mode)
+    except Exception as e:
+        with pytest.raises(e.__class__) as info:
+            v.validate_many(values, mode)
+        assert repr(info.value) == repr(e)
+        assert repr(list(info.value)) == repr(list(e))
+    else:
+        results, errors = v.validate_many(values, mode)
+        # Compare representations, since ``nan != nan``
+        assert repr(results) == repr(expected[0])
+        assert [type(result) for result in results] == [
+            type(result) for result in expected[0]
+        ]
+        assert repr(errors) == repr(expected[1])
+
+
+@pytest.mark.parametrize("mode", ["collect", "raise", "skip"])
+@pytest.mark.parametrize(
+    "schema, values",
+    [
+        ("Int()", numpy.array([1, 2, 3])),
+        ("Int()", numpy.array([1.0, 1.5, 2.0, float("nan"), float("inf")])),
+        ("Int(min=0, max=10)", numpy.array([-1, 0, 10, 11], dtype="int8")),
+        ("Int(min=0, max=10)", numpy.array([1, 20, 5], dtype="uint16")),
+        ("Int(min=0, options=[1, 2])", numpy.array([1, 3, -1, 2])),
+        ("Int(max=1)", numpy.array([0.5, 2.0])),
+        ("Int(max=1)", array("l", [0, 1, 2])),
+        ("Int(max=1)", memoryview(array("i", [0, 1, 2]))),
+        ("Int()", numpy.array([], dtype=int)),
+        ("Float()", numpy.array([1.5, float("nan"), float("inf"), -float("inf")])),
+        ("Float(nan=True, inf=True)", numpy.array([float("nan"), float("inf")])),
+        ("Float(nan=True, min=0, max=1)", numpy.array([float("nan"), -1, 2, 0.5])),
+        ("Float(min=0)", numpy.array([1, -2, 3])),
+        ("Float(max=1)", numpy.array([0.5, 1.5], dtype="float32")),
+        ("Float(min=0)", array("d", [1.0, -2.0])),
+        ("Float(min=0, max=5)", numpy.arange(-2.0, 8.0)[::3]),
+        ("Int(min=0, max=5)", readonly(numpy.arange(-2, 8))),
+    ],
+)
+def test_validate_many(module, schema, values, mode):
+    v = eval(schema, vars(module))
+    assert_same(v, values, values.tolist(), mode)
+
+
+@pytest.mark.parametrize(
+    "schema, values",
+    [
+        ("Int()", numpy.array([[1, 2], [3, 4]])),
+        ("Int()", numpy.array([1, "x", None], dtype=object)),
+        ("Int(coerce=True)", numpy.array([1.5, 2.0])),
+        ("Float()", numpy.array([u"1.5"])),
+        ("Int()", [1, 2.0, "x"]),
+    ],
+)
+def test_fallback(module, schema, values):
+    v = eval(schema, vars(module))
+    results, errors = v.validate_many(values)
+    expected = v.validate_many(list(values))
+    assert repr(results) == repr(expected[0])
+    assert repr(errors) == repr(expected[1])
+
+
+def test_invalid_mode(module):
+    with pytest.raises(ValueError):
+        module.Int().validate_many(numpy.array([1]), "ignore")
+    with pytest.raises(ValueError):
+        module.Float().validate_many(numpy.array([1.0]), "ignore")
+
+
+@pytest.mark.parametrize(
+    "schema, values",
+    [
+        ("List(Int())", numpy.array([1, 2, 3])),
+        ("List(Int(min=0))", numpy.array([1, -2, 3, -4])),
+        ("List(Int(min=0), fail_fast=True)", numpy.array([1, -2, 3, -4])),
+        ("List(Int(), unique=True)", numpy.array([3, 1, 3, 2, 1])),
+        ("List(Float(), minlen=3)", numpy.array([1.5, 2.5])),
+        ("List(Float(), maxlen=1)", array("d", [1.5, 2.5])),
+        ("List(Float(nan=True))", numpy.array([float("nan"), 1.0])),
+        ("List(Str())", numpy.array([u"x", u"y"], dtype=object)),
+        ("List(Int())", numpy.array([1, "x"], dtype=object)),
+    ],
+)
+def test_list(module, schema, values):
+    v = eval(schema, vars(module))
+    try:
+        expected = v(values.tolist())
+    except Exception as e:
+        with pytest.raises(e.__class__) as info:
+            v(values)
+        assert repr(info.value) == repr(e)
+        assert repr(list(info.value)) == repr(list(e))
+    else:
+        result = v(values)
+        assert repr(result) == repr(expected)
+        assert type(result) is list
+
+
+def test_list_context(module):
+    class MarkContext(module.Validator):
+        def __call__(self, value, __context=None):
+            __context["marked"] = True
+            return value
+
+    for values in (
+        memoryview(array("i", [1, 2])),
+        array("d", [1.5]),
+        numpy.array([1, 2]),
+        numpy.array([u"x"], dtype=object),
+    ):
+        context = {}
+        assert module.List(MarkContext())(values, context) == list(values)
+        assert context["marked"]
+
+    module.Int(max=1, alias="item")
+    v = module.List(module.LazyRef("item", maxdepth=1))
+    context = {}
+    assert v(memoryview(array("i", [0, 1])), context) == [0, 1]
+    assert context == {"item.recursion_depth": 0}
+
+
+def test_is_array():
+    assert arrays.is_array(numpy.array([1]))
+    assert arrays.is_array(array("d", [1.0]))
+    assert arrays.is_array(memoryview(b"x"))
+    assert not arrays.is_array([1])
+    assert not arrays.is_array(b"x")
+
+
+def test_numeric():
+    assert arrays.numeric(numpy.array([1])).dtype.kind == "i"
+    assert arrays.numeric(array("d", [1.0])).dtype.kind == "f"
+    assert arrays.numeric(memoryview(b"x")).dtype.kind == "u"
+    assert arrays.numeric(numpy.array([[1]])) is None
+    assert arrays.numeric(numpy.array([u"x"])) is None
+    assert arrays.numeric([1]) is None
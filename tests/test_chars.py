@@ -4,7 +4,7 @@ import pickle
 
 import pytest
 
-from validx import exc
+from validx import exc, patterns
 from validx.compat.types import string
 
 
@@ -98,6 +98,17 @@ def test_str_pattern(module, pattern):
         assert info.value.actual == u"123"
 
 
+def test_str_pattern_shared(module):
+    v1 = module.Str(pattern=u"^[0-9]+$")
+    info = patterns.cache_info()
+    v2 = module.Str(pattern=u"^[0-9]+$")
+    assert patterns.cache_info().hits == info.hits + 1
+    assert patterns.cache_info().misses == info.misses
+    assert v1 == v2
+    assert v1.dump() == v2.dump() == {"__class__": "Str", "pattern": u"^[0-9]+$"}
+    assert repr(v1) == "<Str(pattern=%r)>" % u"^[0-9]+$"
+
+
 @pytest.mark.parametrize("options", [None, [u"abc", u"xyz"]])
 def test_str_options(module, options):
     v = module.Str(options=options)
@@ -164,3 +175,55 @@ def test_bytes_minlen_maxlen(module, minlen, maxlen):
             v(b"abcdef")
         assert info.value.expected == maxlen
         assert info.value.actual == 6
+
+
+@pytest.mark.parametrize("buffer", [None, False, True])
+def test_bytes_buffer(module, buffer):
+    v = module.Bytes(buffer=buffer)
+    assert v(b"abc") == b"abc"
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    if buffer:
+        result = v(bytearray(b"abc"))
+        assert type(result) is memoryview
+        assert result == b"abc"
+
+        value = memoryview(b"abc")
+        assert v(value) is value
+
+        with pytest.raises(exc.InvalidTypeError) as info:
+            v(u"abc")
+        assert info.value.expected == bytes
+        assert info.value.actual == type(u"abc")
+    else:
+        with pytest.raises(exc.InvalidTypeError) as info:
+            v(bytearray(b"abc"))
+        assert info.value.expected == bytes
+        assert info.value.actual == bytearray
+
+
+def test_bytes_buffer_length(module):
+    from array import array
+    from mmap import mmap
+
+    v = module.Bytes(minlen=2, maxlen=8, buffer=True)
+
+    with pytest.raises(exc.MinLengthError) as info:
+        v(bytearray(b"a"))
+    assert info.value.expected == 2
+    assert info.value.actual == 1
+
+    # Length of buffer is measured in bytes
+    with pytest.raises(exc.MaxLengthError) as info:
+        v(array("i", [1, 2, 3]))
+    assert info.value.expected == 8
+    assert info.value.actual == 12
+
+    buf = mmap(-1, 4)
+    buf.write(b"abcd")
+    result = v(buf)
+    assert result.obj is buf
+    assert result == b"abcd"
+    result.release()
+    buf.close()
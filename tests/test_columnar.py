@@ -0,0 +1,164 @@
+from collections import deque
+
+import pytest
+
+from validx import exc
+from validx.compat.colabc import Mapping, Sequence
+from validx.compat.types import string
+
+
+def to_rows(columns):
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
+def assert_same(v, columns, mode="collect"):
+    """Assert columns are validated exactly as rows"""
+    rows = to_rows(columns)
+    try:
+        expected_rows, expected_errors = v.validate_many(rows, mode)
+    except exc.ValidationError as e:
+        with pytest.raises(e.__class__) as info:
+            v.validate_columns(columns, mode)
+        assert repr(list(info.value)) == repr(list(e))
+    else:
+        results, errors = v.validate_columns(columns, mode)
+        assert to_rows(results) == expected_rows
+        assert repr(errors) == repr(expected_errors)
+
+
+@pytest.mark.parametrize("mode", ["collect", "raise", "skip"])
+def test_validate_columns(module, mode):
+    v = module.Dict(
+        {
+            "x": module.Int(min=0),
+            "y": module.Str(),
+            "z": module.List(module.Int()),
+            "d": module.Int(),
+            "o": module.Int(),
+        },
+        defaults={"d": 1},
+        optional=["o"],
+    )
+    assert_same(
+        v, {"x": [1, 2, 3], "y": [u"a", u"b", u"c"], "z": [[], [1], [2]]}, mode
+    )
+    assert_same(
+        v,
+        {
+            "x": [1, -2, 3, u"4"],
+            "y": [u"a", u"b", 1, u"d"],
+            "z": [[], [u"x"], [2], [1, u"y"]],
+            "d": [1, 2, 3, u"4"],
+        },
+        mode,
+    )
+    assert_same(v, {"x": [], "y": [], "z": []}, mode)
+
+
+@pytest.mark.parametrize("mode", ["collect", "raise", "skip"])
+def test_validate_columns_fail_fast(module, mode):
+    v = module.Dict({"x": module.Int(), "y": module.Int()}, fail_fast=True)
+    assert_same(v, {"x": [1, u"x", 3, u"x"], "y": [u"y", u"y", 3, 4]}, mode)
+
+
+def test_validate_columns_extra(module):
+    v = module.Dict(
+        {"x": module.Int()},
+        extra=(module.Str(minlen=2), module.Int()),
+        dispose=["w"],
+    )
+    results, errors = v.validate_columns(
+        {"x": [1, 2], u"yy": [1, u"y"], "w": [u"w", u"w"]}
+    )
+    assert results == {"x": [1], u"yy": [1]}
+    assert errors == [
+        exc.InvalidTypeError(
+            context=deque([1, u"yy", exc.EXTRA_VALUE]), expected=int, actual=string
+        )
+    ]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v.validate_columns({"x": [1], u"y": [1]})
+    assert info.value.errors == [
+        exc.MinLengthError(context=deque([u"y", exc.EXTRA_KEY]), expected=2, actual=1)
+    ]
+
+
+def test_validate_columns_structure(module):
+    v = module.Dict({"x": module.Int(), "y": module.Int(), "z": module.Int()})
+
+    with pytest.raises(exc.SchemaError) as info:
+        v.validate_columns({"x": [1, 2], "y": [1], "z": u"ab", "w": [1, 2]})
+    assert info.value.errors == [
+        exc.MinLengthError(context=deque(["y"]), expected=2, actual=1),
+        exc.InvalidTypeError(context=deque(["z"]), expected=Sequence, actual=string),
+        exc.ForbiddenKeyError("w"),
+    ]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v.validate_columns({"x": [1], "y": [1, 2]})
+    assert info.value.errors == [
+        exc.MaxLengthError(context=deque(["y"]), expected=1, actual=2),
+        exc.MissingKeyError("z"),
+    ]
+
+    with pytest.raises(exc.InvalidTypeError) as info:
+        v.validate_columns([[1], [2], [3]])
+    assert info.value.expected == Mapping
+    assert info.value.actual == list
+
+    with pytest.raises(ValueError):
+        v.validate_columns({"x": [1], "y": [1], "z": [1]}, "ignore")
+
+
+def test_validate_columns_structure_fail_fast(module):
+    v = module.Dict({"x": module.Int(), "y": module.Int()}, fail_fast=True)
+    with pytest.raises(exc.SchemaError) as info:
+        v.validate_columns({"x": [1], "y": [1, 2]})
+    assert info.value.errors == [
+        exc.MaxLengthError(context=deque(["y"]), expected=1, actual=2)
+    ]
+    with pytest.raises(exc.SchemaError) as info:
+        v.validate_columns({"w": [1], "v": [1]})
+    assert info.value.errors == [exc.ForbiddenKeyError("w")]
+
+    v = module.Dict(
+        {"x": module.Int()}, extra=(module.Str(minlen=2), module.Int()), fail_fast=True
+    )
+    with pytest.raises(exc.SchemaError) as info:
+        v.validate_columns({u"y": [1], u"z": [1]})
+    assert info.value.errors == [
+        exc.MinLengthError(context=deque([u"y", exc.EXTRA_KEY]), expected=2, actual=1)
+    ]
+
+    v = module.Dict({"x": module.Int(), "y": module.Int()}, fail_fast=True)
+    with pytest.raises(exc.SchemaError) as info:
+        v.validate_columns({})
+    assert info.value.errors == [exc.MissingKeyError("x")]
+
+
+def test_validate_columns_length(module):
+    v = module.Dict(extra=(module.Str(), module.Int()), minlen=2, maxlen=3)
+    assert v.validate_columns({u"x": [1], u"y": [2]}) == ({u"x": [1], u"y": [2]}, [])
+    with pytest.raises(exc.MinLengthError) as info:
+        v.validate_columns({u"x": [1]})
+    assert info.value.expected == 2
+    assert info.value.actual == 1
+    with pytest.raises(exc.MaxLengthError) as info:
+        v.validate_columns({u"w": [], u"x": [], u"y": [], u"z": []})
+    assert info.value.expected == 3
+    assert info.value.actual == 4
+
+
+def test_validate_columns_arrays(module):
+    numpy = pytest.importorskip("numpy")
+    v = module.Dict({"x": module.Int(min=0), "y": module.Float(max=1)})
+    results, errors = v.validate_columns(
+        {"x": numpy.array([1, -2, 3]), "y": numpy.array([0.5, 0.5, 1.5])}
+    )
+    assert results == {"x": [1], "y": [0.5]}
+    assert errors == [
+        exc.MinValueError(context=deque([1, "x"]), expected=0, actual=-2),
+        exc.MaxValueError(context=deque([2, "y"]), expected=1, actual=1.5),
+    ]
@@ -9,6 +9,7 @@ def test_frozendict():
     assert "x" in d
     assert "y" not in d
     assert d == {"x": 1}
+    assert hash(d) == hash(frozendict(x=1))
     assert repr(d) == "frozendict({'x': 1})"
     assert len(d) == 1
     assert list(iter(d)) == ["x"]
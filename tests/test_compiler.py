@@ -0,0 +1,236 @@
+from datetime import date
+
+import pytest
+
+from validx import exc
+from validx.compiler import compile
+
+
+def assert_same(v, value):
+    """Assert compiled validator behaves exactly as interpreted one"""
+    f = compile(v)
+    try:
+        expected = v(value)
+    except exc.ValidationError as e:
+        with pytest.raises(e.__class__) as info:
+            f(value)
+        assert repr(info.value) == repr(e)
+        assert repr(list(info.value)) == repr(list(e))
+    else:
+        result = f(value)
+        # Compare representations, since ``nan != nan``
+        assert repr(result) == repr(expected)
+        assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "schema, values",
+    [
+        ("Int()", [1, 1.0, 1.5, "1", None, True]),
+        ("Int(nullable=True)", [None, 1, "x"]),
+        ("Int(coerce=True)", ["1", "x", [], 2.0]),
+        ("Int(min=0, max=10)", [-1, 0, 10, 11]),
+        ("Int(options=[1, 2])", [1, 3]),
+        ("Float()", [1, 1.5, "1.5", float("nan"), float("inf"), None]),
+        ("Float(coerce=True, nullable=True)", ["1.5", "x", None]),
+        ("Float(nan=True, inf=True)", [float("nan"), float("inf")]),
+        ("Float(nan=True, min=0, max=1)", [float("nan"), -1, 2, 0.5]),
+        ("Str()", [u"abc", b"abc", 1, None]),
+        ("Str(nullable=True, encoding='utf-8')", [None, b"abc", b"\xff", 1]),
+        ("Str(minlen=2, maxlen=3)", [u"a", u"ab", u"abcd"]),
+        ("Str(pattern=u'^[a-z]+$')", [u"abc", u"123"]),
+        ("Str(options=[u'x', u'y'])", [u"x", u"z"]),
+        ("Bytes()", [b"abc", "abc"]),
+        ("Bytes(nullable=True, minlen=1, maxlen=2)", [None, b"", b"ab", b"abc"]),
+        ("Bool()", [True, False, 1, "true", None]),
+        ("Bool(nullable=True, coerce_str=True)", [None, "Yes", "off", "x", 1]),
+        ("Bool(coerce_int=True)", [0, 1, "true"]),
+        ("Bool(coerce_str=True, coerce_int=True)", [1, "on", "x", 1.5]),
+        ("Const(1)", [1, 2]),
+        ("Const(date(2000, 1, 1))", [date(2000, 1, 1), 1]),
+        ("Any()", [object]),
+        ("Type(date)", [date(2000, 1, 1), 1]),
+        ("Type(int, nullable=True, coerce=True, min=0, max=5)", [None, "1", "x", 6]),
+        ("Type(list, minlen=1, maxlen=2, options=[[1], [1, 2]])", [[], [1], [2]]),
+        ("List(Int())", [[1, 2], (1,), [1, "x", None], "abc", 1, None]),
+        ("List(Int(), nullable=True, minlen=1, maxlen=2)", [None, [], [1, 2, 3]]),
+        ("List(Int(), unique=True)", [[1, 1, 2, 2, 1]]),
+        ("List(List(Int()))", [[[1], [2, "x"], "y"]]),
+        ("Tuple(Int(), Str())", [(1, u"x"), [1, u"x"], (1,), (u"x", 1), 1, None]),
+        ("Tuple(Int(), nullable=True)", [None, (1,)]),
+        ("AllOf(Int(min=0), Int(max=10))", [5, -1, 11, "x"]),
+        ("OneOf(Int(options=[1, 2]), Int(min=10))", [1, 10, 5, "x"]),
+        ("OneOf(Int(), Str())", [1, u"x", 1.5]),
+        ("OneOf(Str(encoding='utf-8'), Int())", [b"abc", 1, None]),
+        ("OneOf(Int(), Str(), fail_fast=True)", [1, u"x", 1.5]),
+        ("List(Int(min=0), fail_fast=True)", [[1, 2], [1, -1, "x"]]),
+        ("Tuple(Int(), Int(), fail_fast=True)", [(1, 2), ("x", "y")]),
+        ("List(Any())", [[1, u"x"], 1]),
+        ("Tuple(Any(), Int())", [(1, 2), (1, u"x")]),
+        ("AllOf(Any(), Int())", [1, u"x"]),
+        ("OneOf(Any(), Int())", [1, u"x"]),
+        ("OneOf(Int(), Any())", [1, u"x"]),
+    ],
+)
+def test_scalars(module, schema, values):
+    v = eval(schema, dict(vars(module), date=date))
+    for value in values:
+        assert_same(v, value)
+
+
+def test_dict(module):
+    v = module.Dict(
+        {
+            "x": module.Int(min=0),
+            "y": module.Str(encoding="utf-8"),
+            "z": module.List(module.Int()),
+            "d": module.Int(),
+            "c": module.List(module.Int()),
+            "o": module.Int(),
+        },
+        defaults={"d": 1, "c": list, "o": 0},
+        optional=["o"],
+        minlen=4,
+        maxlen=6,
+    )
+    assert_same(v, {"x": 1, "y": b"abc", "z": [1, 2]})
+    assert_same(v, {"x": -1, "y": b"\xff", "z": [1, "x"], "e": 1})
+    assert_same(v, {"x": 1, "y": u"abc", "z": [], "o": 1, "d": 2})
+    assert_same(v, {"x": 1})
+    assert_same(v, {"y": u"x", "z": []})
+    assert_same(v, [])
+    assert_same(v, None)
+
+    result = compile(v)({"x": 1, "y": u"abc", "z": []})
+    assert result["c"] == []
+    assert result["c"] is not compile(v)({"x": 1, "y": u"abc", "z": []})["c"]
+
+
+def test_dict_fail_fast(module):
+    v = module.Dict(
+        {"x": module.Int(), "y": module.Int(), "z": module.Int()},
+        defaults={"z": "z"},
+        fail_fast=True,
+    )
+    assert_same(v, {"x": 1, "y": 2, "z": 3})
+    assert_same(v, {"x": "x", "y": "y"})
+    assert_same(v, {"w": 1, "x": 1})
+    assert_same(v, {"x": 1})
+    assert_same(v, {"x": 1, "y": 2})
+
+    v = module.Dict(extra=(module.Str(minlen=2), module.Int()), fail_fast=True)
+    assert_same(v, {u"x": u"x", u"yy": 1})
+    assert_same(v, {u"xx": u"x", u"yy": u"y"})
+
+
+def test_dict_mutable_default(module):
+    default = [1, 2]
+    v = module.Dict({"x": module.List(module.Int())}, defaults={"x": default})
+    result = compile(v)({})
+    assert result == {"x": [1, 2]}
+    result["x"].append(3)
+    assert compile(v)({}) == {"x": [1, 2]}
+
+
+def test_dict_extra(module):
+    v = module.Dict(
+        {"x": module.Int()},
+        extra=(module.Str(minlen=2), module.Int(coerce=True)),
+        nullable=True,
+    )
+    assert_same(v, {"x": 1, "yy": "1"})
+    assert_same(v, {"x": 1, "y": "1"})
+    assert_same(v, {"x": 1, "yy": "a"})
+    assert_same(v, {"x": 1, 1: 1})
+    assert_same(v, None)
+
+    v = module.Dict(extra=(module.Str(), module.Int()))
+    assert_same(v, {"x": 1, "y": 2})
+    assert_same(v, {"x": 1, "y": "z"})
+
+    v = module.Dict({"x": module.Any()}, extra=(module.Str(), module.Any()))
+    assert_same(v, {"x": 1, "y": [2]})
+    assert_same(v, {"x": 1, 1: 2})
+
+
+def test_dict_dispose_multikeys(module):
+    from webob.multidict import MultiDict
+
+    v = module.Dict(
+        {"x": module.List(module.Int()), "y": module.Int()},
+        dispose=["z"],
+        multikeys=["x"],
+    )
+    value = MultiDict([("x", 1), ("x", 2), ("y", 3), ("z", 4)])
+    assert_same(v, value)
+    assert_same(v, {"x": [1], "y": 1, "z": 1})
+    assert_same(v, {"x": [1], "y": 1, "w": 1})
+
+
+def test_delegation(module):
+    class MarkContext(module.Validator):
+        def __call__(self, value, __context=None):
+            __context["marked"] = True
+            return value
+
+    v = module.List(module.Dict({"x": MarkContext(), "d": module.Date()}))
+    f = compile(v)
+    assert "validator" in f.__source__
+    context = {}
+    assert f([{"x": 1, "d": date(2000, 1, 1)}], context) == [
+        {"x": 1, "d": date(2000, 1, 1)}
+    ]
+    assert context["marked"]
+    assert_same(v, [{"x": 1, "d": 1}])
+
+    # Top level function without delegation does not set context up
+    assert "__context = {}" not in compile(module.Int()).__source__
+
+
+def test_lazy_ref(module):
+    module.Dict(
+        {"x": module.Int(), "nodes": module.List(module.LazyRef("node", maxdepth=2))},
+        optional=["nodes"],
+        alias="node",
+    )
+    v = module.LazyRef("node", maxdepth=2)
+    assert_same(v, {"x": 1, "nodes": [{"x": 2}]})
+    assert_same(v, {"x": 1, "nodes": [{"x": 2, "nodes": [{"x": 3}]}]})
+    assert_same(v, {"x": 1, "nodes": [{"x": "y"}]})
+    assert_same(module.instances.get("node"), {"x": 1, "nodes": [{"x": 2}]})
+
+
+def test_deep_nesting(module):
+    v = module.Int()
+    for _ in range(30):
+        v = module.List(v)
+    value = [1]
+    for _ in range(29):
+        value = [value]
+    assert_same(v, value)
+    assert_same(v, [[[[]]]])
+    assert_same(v, [[[["x"]]]])
+
+
+def test_traceback(module):
+    f = compile(module.Int())
+    try:
+        f("x")
+    except exc.InvalidTypeError as e:
+        import traceback
+
+        formatted = "".join(traceback.format_tb(e.__traceback__))
+        assert "raise InvalidTypeError" in formatted
+
+
+def test_method(module):
+    v = module.Dict({"x": module.Int()})
+    f = v.compile()
+    assert f({"x": 1}) == {"x": 1}
+    with pytest.raises(exc.SchemaError) as info:
+        f({"x": "y"})
+    assert repr(info.value) == repr(
+        exc.SchemaError(
+            [exc.InvalidTypeError(expected=int, actual=str).add_context("x")]
+        )
+    )
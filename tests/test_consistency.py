@@ -21,9 +21,17 @@ def test_public_names(module):
             assert issubclass(obj, module.Validator)
 
 
-@pytest.mark.skipif(not DEV_MODE, reason="Development mode test")
-def test_interfaces():
+def implementations():
     from validx import py, cy
+    from validx.exc import py as exc_py, cy as exc_cy
+
+    return [(py, cy), (exc_py, exc_cy)]
+
+
+@pytest.mark.skipif(not DEV_MODE, reason="Development mode test")
+@pytest.mark.parametrize("impl", [0, 1], ids=["validators", "exc"])
+def test_interfaces(impl):
+    py, cy = implementations()[impl]
 
     assert py.__all__ == cy.__all__
 
@@ -41,8 +49,9 @@ def test_interfaces():
 
 
 @pytest.mark.skipif(not DEV_MODE, reason="Development mode test")
-def test_docstrings():
-    from validx import py, cy
+@pytest.mark.parametrize("impl", [0, 1], ids=["validators", "exc"])
+def test_docstrings(impl):
+    py, cy = implementations()[impl]
 
     def walk(py_obj, cy_obj):
         for name in getattr(py_obj, "__all__", dir(py_obj)):
@@ -13,7 +13,7 @@ except ImportError:
 
 from validx import exc
 from validx.compat.types import string
-from validx.compat.colabc import Sequence, Mapping
+from validx.compat.colabc import Sequence, Mapping, Iterable
 
 
 NoneType = type(None)
@@ -185,6 +185,94 @@ def test_list_context(module):
     assert context["marked"]
 
 
+def test_list_fail_fast(module):
+    v = module.List(module.Int(min=0), fail_fast=True)
+    assert v([1, 2, 3]) == [1, 2, 3]
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+    assert v.dump() == {
+        "__class__": "List",
+        "item": {"__class__": "Int", "min": 0},
+        "fail_fast": True,
+    }
+
+    with pytest.raises(exc.SchemaError) as info:
+        v([1, -1, "x", -2])
+    assert info.value.errors == [
+        exc.MinValueError(context=deque([1]), expected=0, actual=-1)
+    ]
+
+
+def test_list_iter_validate(module):
+    v = module.List(module.Int(), minlen=2, maxlen=3)
+    assert list(v.iter_validate([1, 2.0])) == [1, 2]
+    assert list(v.iter_validate(i for i in range(3))) == [0, 1, 2]
+    assert list(v.iter_validate(CustomSequence(1, 2, 3))) == [1, 2, 3]
+
+    items = v.iter_validate(i for i in range(5))
+    assert next(items) == 0
+    assert next(items) == 1
+    assert next(items) == 2
+    with pytest.raises(exc.MaxLengthError) as info:
+        next(items)
+    assert info.value.expected == 3
+    assert info.value.actual == 4
+
+    with pytest.raises(exc.MinLengthError) as info:
+        list(v.iter_validate(iter([1])))
+    assert info.value.expected == 2
+    assert info.value.actual == 1
+
+    items = v.iter_validate(iter([1, "x", "y"]))
+    assert next(items) == 1
+    with pytest.raises(exc.SchemaError) as info:
+        next(items)
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([1]), expected=int, actual=str)
+    ]
+
+    with pytest.raises(exc.InvalidTypeError) as info:
+        v.iter_validate(u"abc")
+    assert info.value.expected == Iterable
+    assert info.value.actual == string
+
+    with pytest.raises(exc.InvalidTypeError) as info:
+        v.iter_validate(None)
+    assert info.value.expected == Iterable
+    assert info.value.actual == type(None)
+
+    v = module.List(module.Int(), nullable=True)
+    assert list(v.iter_validate(None)) == []
+
+
+def test_list_iter_validate_context(module):
+    class MarkContext(module.Validator):
+        def __call__(self, value, __context=None):
+            __context["marked"] = True
+            return value
+
+    v = module.List(MarkContext())
+    assert list(v.iter_validate([1, 2])) == [1, 2]
+
+
+def test_list_iter_validate_unique(module):
+    v = module.List(module.Int(), unique=True, maxlen=3)
+    assert list(v.iter_validate([1, 2, 1, 3, 2, 3])) == [1, 2, 3]
+    assert list(v.iter_validate([1, 2, 1, 3, 2, 3], unique_window=3)) == [1, 2, 3]
+
+    with pytest.raises(exc.MaxLengthError):
+        list(v.iter_validate([1, 2, 3, 1], unique_window=2))
+
+    v = module.List(module.Int(), unique=True)
+    values = [1, 2, 1, 3, 1, 4, 2]
+    # "1" is kept in the window, since it is seen frequently,
+    # while "2" is evicted by "3" and "4"
+    assert list(v.iter_validate(values, unique_window=2)) == [1, 2, 3, 4, 2]
+
+    with pytest.raises(ValueError):
+        v.iter_validate(values, unique_window=-1)
+
+
 # =============================================================================
 
 
@@ -251,6 +339,19 @@ def test_tuple_context(module):
     assert context["marked"]
 
 
+def test_tuple_fail_fast(module):
+    v = module.Tuple(module.Int(), module.Int(), module.Int(), fail_fast=True)
+    assert v((1, 2, 3)) == (1, 2, 3)
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    with pytest.raises(exc.SchemaError) as info:
+        v((1, "x", "y"))
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([1]), expected=int, actual=string)
+    ]
+
+
 # =============================================================================
 
 
@@ -520,3 +621,78 @@ def test_dict_context(module):
     context = {}
     v({u"x": None}, context)
     assert context["marked"]
+
+
+def test_dict_fail_fast(module):
+    v = module.Dict(
+        {u"x": module.Int(), u"y": module.Int(), u"z": module.Int()},
+        defaults={u"z": u"z"},
+        fail_fast=True,
+    )
+    assert v({u"x": 1, u"y": 2, u"z": 3}) == {u"x": 1, u"y": 2, u"z": 3}
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"x": u"x", u"y": u"y"})
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([u"x"]), expected=int, actual=string)
+    ]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"w": 1, u"x": 1})
+    assert info.value.errors == [exc.ForbiddenKeyError(u"w")]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"x": 1})
+    assert info.value.errors == [exc.MissingKeyError(u"y")]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"x": 1, u"y": 2})
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([u"z"]), expected=int, actual=string)
+    ]
+
+    v = module.Dict(extra=(module.Str(minlen=2), module.Int()), fail_fast=True)
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"x": u"x", u"yy": 1})
+    assert info.value.errors == [
+        exc.MinLengthError(
+            context=deque([u"x", exc.EXTRA_KEY]), expected=2, actual=1
+        )
+    ]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"xx": u"x", u"yy": u"y"})
+    assert info.value.errors == [
+        exc.InvalidTypeError(
+            context=deque([u"xx", exc.EXTRA_VALUE]), expected=int, actual=string
+        )
+    ]
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_dict_strategies(module, fail_fast):
+    schema = {u"x": module.Int(), u"y": module.Int(), u"z": module.Int()}
+    simple = module.Dict(schema, fail_fast=fail_fast)
+    generic = module.Dict(schema, dispose=[u"d"], fail_fast=fail_fast)
+
+    for value in [
+        {u"x": 1, u"y": 2, u"z": 3},
+        {u"z": 3, u"y": 2, u"x": 1},
+        {u"x": u"x", u"w": 1, u"y": u"y"},
+        {u"w": 1, u"x": u"x"},
+        {u"x": 1, u"y": 2, u"w": 3},
+        {u"x": 1},
+        {},
+    ]:
+        try:
+            expected = generic(value)
+        except exc.ValidationError as e:
+            with pytest.raises(exc.SchemaError) as info:
+                simple(value)
+            assert info.value == e
+        else:
+            result = simple(value)
+            assert result == expected
+            assert list(result) == list(expected)
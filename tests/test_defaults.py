@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from validx import defaults
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, True, 1, 1.5, u"x", b"x", Decimal("1"), date(2000, 1, 1), (1, u"x")],
+)
+def test_immutable(value):
+    assert defaults.immutable(value)
+    assert defaults.factory(value)() is value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [1, 2],
+        [[1], {u"x": [2]}],
+        {u"x": 1},
+        {u"x": [1], u"y": (2, [3])},
+        ([1], 2),
+        set([1, 2]),
+        bytearray(b"x"),
+        OrderedDict([(u"x", [1])]),
+    ],
+)
+def test_mutable(value):
+    assert not defaults.immutable(value)
+    make = defaults.factory(value)
+    copy_1 = make()
+    copy_2 = make()
+    assert copy_1 == value
+    assert type(copy_1) is type(value)
+    assert copy_1 is not value
+    assert copy_2 is not copy_1
+
+
+def test_nested_copies():
+    value = {u"x": [1, [2]], u"y": ([3],)}
+    result = defaults.factory(value)()
+    result[u"x"][1].append(3)
+    result[u"y"][0].append(4)
+    assert value == {u"x": [1, [2]], u"y": ([3],)}
+
+
+def test_callable():
+    assert defaults.factory(list) is list
+
+
+def test_recursive():
+    value = [1]
+    value.append(value)
+    result = defaults.factory(value)()
+    assert result is not value
+    assert result[1] is result
@@ -0,0 +1,137 @@
+from array import array
+from collections import OrderedDict, defaultdict
+
+import pytest
+
+from validx import dispatch
+
+
+def test_build(module):
+    assert dispatch.build([module.Int(), module.Int(min=10)]) is None
+    assert dispatch.build([module.Int(), module.Any()]) is not None
+    assert dispatch.build([module.Int()], discriminator=u"x") is None
+
+    table = dispatch.build([module.Dict({u"x": module.Const(1)})], u"x")
+    assert table.key == u"x"
+    assert table({u"x": 1}) == (0,)
+    assert table({u"x": 2}) == ()
+
+
+def test_detect(module):
+    point = module.Dict({u"type": module.Const(u"point"), u"x": module.Int()})
+    circle = module.Dict({u"type": module.Const(u"circle"), u"r": module.Int()})
+    assert dispatch.detect([point, circle]) == u"type"
+    assert dispatch.detect([module.Int(), point, module.Str(), circle]) == u"type"
+    assert dispatch.detect([point]) is None
+    assert dispatch.detect([point, point]) is None
+    assert dispatch.detect([point, module.Dict({u"x": module.Int()})]) is None
+    extra = module.Dict(extra=(module.Str(), module.Int()))
+    assert dispatch.detect([extra, point]) is None
+
+
+def test_types(module):
+    table = dispatch.Table(
+        [
+            module.Int(),
+            module.Float(nullable=True),
+            module.Str(),
+            module.Str(encoding="utf-8"),
+            module.Bytes(),
+            module.Bool(),
+            module.Bool(coerce_str=True, coerce_int=True),
+            module.List(module.Int()),
+            module.Tuple(module.Int()),
+            module.Dict(),
+            module.Type(OrderedDict),
+            module.AllOf(module.Int(), module.Int(min=0)),
+            module.Cached(module.Bytes()),
+        ]
+    )
+    assert table(1) == (0, 1, 6, 11)
+    assert table(1.5) == (0, 1, 11)
+    assert table(True) == (0, 1, 5, 6, 11)
+    assert table(None) == (1,)
+    assert table(u"x") == (2, 3, 6)
+    assert table(b"x") == (3, 4, 12)
+    assert table([1]) == (7, 8)
+    assert table((1,)) == (7, 8)
+    assert table({}) == (9,)
+    assert table(OrderedDict()) == (9, 10)
+    assert table(object()) == ()
+
+
+def test_types_any(module):
+    class Custom(module.Int):
+        pass
+
+    steps = [
+        module.Int(coerce=True),
+        module.Float(coerce=True),
+        module.Bytes(buffer=True),
+        module.Type(int, coerce=True),
+        module.Const(1),
+        module.Any(),
+        module.LazyRef(u"x"),
+        Custom(),
+    ]
+    table = dispatch.Table(steps)
+    assert table(object()) == tuple(range(len(steps)))
+
+
+def test_types_arrays(module):
+    numpy = pytest.importorskip("numpy")
+    table = dispatch.Table([module.List(module.Int()), module.Tuple(module.Int())])
+    assert table(numpy.array([1])) == (0,)
+    assert table(array("l", [1])) == (0, 1)
+
+
+def test_types_cache(module, monkeypatch):
+    monkeypatch.setattr(dispatch, "MAX_TYPES", 1)
+    table = dispatch.Table([module.Int(), module.Str()])
+    assert table(1) == (0,)
+    assert table(u"x") == (1,)
+    assert table(u"y") == (1,)
+    assert list(table._types) == [int]
+
+
+def test_tags(module):
+    table = dispatch.Table(
+        [
+            module.Dict({u"type": module.Const(u"a")}),
+            module.Dict({u"type": module.Str(options=[u"b", u"c"], nullable=True)}),
+            module.Dict({u"type": module.Int(options=[1, 2])}),
+            module.Dict({u"type": module.Type(int, options=[2, 3])}),
+            module.Dict({u"type": module.Cached(module.Const(u"a"))}),
+            module.Dict({u"x": module.Int()}),
+            module.Int(),
+        ],
+        key=u"type",
+    )
+    assert table.tags[5] is None
+    assert table.tags[6] is None
+    assert table({u"type": u"a"}) == (0, 4, 5)
+    assert table({u"type": u"c"}) == (1, 5)
+    assert table({u"type": None}) == (1, 5)
+    assert table({u"type": 2}) == (2, 3, 5)
+    assert table({u"type": True}) == (2, 5)
+    assert table({u"type": u"x"}) == (5,)
+    assert table({u"type": [u"a"]}) == (0, 1, 2, 3, 4, 5)
+    assert table({}) == (0, 1, 2, 3, 4, 5)
+    assert table(defaultdict(int)) == (0, 1, 2, 3, 4, 5)
+    assert table(1) == (6,)
+
+
+def test_tags_unconstrained(module):
+    steps = [
+        module.Dict(),
+        module.Dict({u"x": module.Int()}),
+        module.Dict({u"type": module.Int()}),
+        module.Dict({u"type": module.Int(options=[1], coerce=True)}),
+        module.Dict({u"type": module.Type(int, options=[1], coerce=True)}),
+        module.Dict({u"type": module.Str(options=[u"a"], encoding="utf-8")}),
+        module.Dict({u"type": module.Const([1])}),
+        module.Dict({u"type": module.Const(1)}, dispose=[u"type"]),
+        module.Dict({u"type": module.Const(1)}, multikeys=[u"type"]),
+    ]
+    table = dispatch.Table(steps, key=u"type")
+    assert table.tags == (None,) * len(steps)
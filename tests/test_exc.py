@@ -9,10 +9,8 @@ import pytest
 from dateutil.parser import isoparse
 from pytz import UTC
 
-from validx import exc
 
-
-def test_validation_error():
+def test_validation_error(exc):
     te = exc.InvalidTypeError(expected=int, actual=str)
     assert te.context == deque([])
     assert te.format_context() == ""
@@ -52,7 +50,43 @@ def test_validation_error():
     assert pickle.loads(pickle.dumps(te)) == te
 
 
-def test_mapping_key_error():
+def test_validation_error_lazy_context(exc):
+    te = exc.InvalidTypeError(expected=int, actual=str)
+    te.add_context("x").add_context(1)
+    assert te == exc.InvalidTypeError(deque([1, "x"]), expected=int, actual=str)
+    assert te != exc.InvalidTypeError(deque(["x"]), expected=int, actual=str)
+    assert pickle.loads(pickle.dumps(te.add_context("y"))) == te
+
+    # Materialized context is kept, and updated in place
+    context = te.context
+    assert context == deque(["y", 1, "x"])
+    te.add_context("z")
+    assert te.context is context
+    assert context == deque(["z", "y", 1, "x"])
+
+    te.context = deque(["a"])
+    assert repr(te) == "<a: InvalidTypeError(expected=%r, actual=%r)>" % (int, str)
+
+    # Tuples of nodes are not mistaken for the internal chain
+    te = exc.InvalidTypeError(("a", "b"), expected=int, actual=str)
+    assert te.context == deque(["a", "b"])
+    assert exc.ValidationError(("a", "b")).add_context("c").context == deque(
+        ["c", "a", "b"]
+    )
+    te.context = ("c",)
+    assert te.context == deque(["c"])
+
+
+def test_validation_error_args(exc):
+    e = exc.MinValueError(expected=1, actual=0)
+    assert e.args == (deque(), 1, 0)
+    assert e.add_context("x").args == (deque(["x"]), 1, 0)
+    assert exc.MissingKeyError("x").args == (deque(["x"]),)
+    se = exc.SchemaError([e])
+    assert se.args == (deque(), [e])
+
+
+def test_mapping_key_error(exc):
     mke = exc.MissingKeyError("x")
     fke = exc.ForbiddenKeyError("y")
     assert mke.context == deque(["x"])
@@ -65,7 +99,7 @@ def test_mapping_key_error():
     assert pickle.loads(pickle.dumps(fke)) == fke
 
 
-def test_schema_error():
+def test_schema_error(exc):
     mve_1 = exc.MaxValueError(context=deque(["y"]), expected=100, actual=200)
     mve_2 = exc.MaxValueError(context=deque(["x"]), expected=100, actual=300)
 
@@ -113,7 +147,7 @@ def test_schema_error():
     assert pickle.loads(pickle.dumps(se)) == se
 
 
-def test_extra():
+def test_extra(exc):
     assert exc.EXTRA_KEY == exc.Extra("KEY")
     assert exc.EXTRA_VALUE == exc.Extra("VALUE")
     assert exc.EXTRA_KEY != exc.EXTRA_VALUE
@@ -124,7 +158,7 @@ def test_extra():
     assert pickle.loads(pickle.dumps(exc.EXTRA_VALUE)) == exc.EXTRA_VALUE
 
 
-def test_step():
+def test_step(exc):
     step_1 = exc.Step(1)
     step_2 = exc.Step(2)
     assert step_1 != step_2
@@ -136,7 +170,7 @@ def test_step():
     assert pickle.loads(pickle.dumps(step_2)) == step_2
 
 
-def test_format_error():
+def test_format_error(exc):
     assert exc.format_error(exc.InvalidTypeError(expected=int, actual=type(None))) == [
         ("", u"Value should not be null.")
     ]
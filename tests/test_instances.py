@@ -17,3 +17,9 @@ def test_instances(module):
     with pytest.raises(KeyError) as info:
         module.instances.get("unknown")
     assert info.value.args == ("Instance 'unknown' is not registered",)
+
+
+def test_instances_items(module):
+    assert module.instances.items() == []
+    v = module.instances.add("foo", module.Int())
+    assert module.instances.items() == [("foo", v)]
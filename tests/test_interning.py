@@ -0,0 +1,102 @@
+import pytest
+
+from validx import interning
+
+
+@pytest.fixture
+def table():
+    interning.clear()
+    interning.enable()
+    yield
+    interning.disable()
+    interning.clear()
+
+
+def test_intern(module, table):
+    data = {
+        "__class__": "Dict",
+        "schema": {
+            u"x": {"__class__": "Int", "min": 0},
+            u"y": {"__class__": "List", "item": {"__class__": "Int", "min": 0}},
+            u"z": {"__class__": "Str", "options": [u"a", u"b"]},
+        },
+    }
+    v1 = module.Validator.load(data)
+    v2 = module.Validator.load(data)
+    assert v1 is v2
+    assert v1.schema[u"x"] is v1.schema[u"y"].item
+    info = interning.report()
+    assert info.lookups == 10
+    assert info.hits == 6
+    assert info.currsize == 4
+    assert info.saved > 0
+
+    v3 = v1.clone({"schema.x.min": 1})
+    assert v3 is not v1
+    assert v3.schema[u"y"] is v1.schema[u"y"]
+
+    interning.clear()
+    assert interning.report() == interning.InternInfo(0, 0, 0, 0)
+    assert module.Validator.load(data) is not v1
+
+
+def test_intern_disabled(module, table):
+    interning.disable()
+    assert not interning.enabled()
+    data = {"__class__": "Int", "min": 0}
+    assert module.Validator.load(data) is not module.Validator.load(data)
+    assert interning.report().lookups == 0
+
+
+def test_intern_skipped(module, table):
+    data = {"__class__": "Cached", "validator": {"__class__": "Int"}}
+    v1 = module.Validator.load(data)
+    v2 = module.Validator.load(data)
+    assert v1 == v2
+    assert v1 is not v2
+    assert v1.validator is v2.validator
+
+    v1 = module.Validator.load({"__class__": "Int", "alias": "x"})
+    v2 = module.Validator.load({"__class__": "Int", "alias": "y", "replace": True})
+    assert v1 is not v2
+    assert module.instances.get("x") is v1
+    assert module.instances.get("y") is v2
+
+
+def test_intern_types(module, table):
+    # Equal parameters of different types are not shared
+    v1 = module.Validator.load({"__class__": "Const", "value": 1})
+    v2 = module.Validator.load({"__class__": "Const", "value": True})
+    assert v1 == v2
+    assert v2 is not v1
+    assert v2.value is True
+
+    v1 = module.Validator.load({"__class__": "Int", "options": [1]})
+    v2 = module.Validator.load({"__class__": "Int", "options": [True]})
+    assert v2 is not v1
+    assert list(v2.options) == [True]
+    assert type(list(v2.options)[0]) is bool
+
+    data = {
+        "__class__": "Dict",
+        "schema": {u"x": {"__class__": "Const", "value": [1.0, {1: u"y"}]}},
+    }
+    v1 = module.Validator.load(data)
+    data["schema"][u"x"]["value"] = [1, {True: u"y"}]
+    v2 = module.Validator.load(data)
+    assert v2 is not v1
+    assert v2.schema[u"x"].value == [1, {True: u"y"}]
+    assert type(v2.schema[u"x"].value[0]) is int
+    assert module.Validator.load(data) is v2
+
+    # Validators with unhashable parameters are not interned
+    v = module.Const(bytearray(b"x"))
+    assert interning.intern(v) is v
+    assert interning.intern(module.Const(bytearray(b"x"))) is not v
+
+
+def test_intern_implementations(table):
+    from validx import py, cy
+
+    assert interning.intern(py.Int()) is not interning.intern(cy.Int())
+    assert interning.report().currsize == 2
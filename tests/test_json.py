@@ -0,0 +1,308 @@
+import json
+from collections import deque
+from importlib import import_module
+
+import pytest
+
+from validx import exc, py
+from validx import json as validx_json
+
+
+@pytest.fixture()
+def loads(module):
+    return import_module(module.__name__ + ".decoder").loads
+
+
+def assert_same(loads, validator, data):
+    try:
+        expected = validator(json.loads(data))
+    except exc.ValidationError as e:
+        with pytest.raises(exc.ValidationError) as info:
+            loads(validator, data)
+        assert type(info.value) is type(e)
+        assert list(map(repr, info.value)) == list(map(repr, e))
+        return None
+    result = loads(validator, data)
+    assert repr(result) == repr(expected)
+    return result
+
+
+def test_entry_point():
+    assert validx_json.loads.__module__ in ("validx.cy.decoder", "validx.py.decoder")
+
+
+def test_scalars(module, loads):
+    v = module.Any()
+    for data in [
+        u"1",
+        u"-1",
+        u"0",
+        u"-0",
+        u"12345678901234567",
+        u"123456789012345678901234567890",
+        u"-123456789012345678901234567890",
+        u"1.5",
+        u"1e3",
+        u"-0.5E-2",
+        u"NaN",
+        u"Infinity",
+        u"true",
+        u"false",
+        u"null",
+        u'"x"',
+        u'"\\u0078\\n\\"y\\""',
+        u'"привет"',
+        u" \t\n\r 1 \t\n\r ",
+    ]:
+        assert_same(loads, v, data)
+
+
+def test_leaves(module, loads):
+    for validator, data in [
+        (module.Int(), u"1"),
+        (module.Int(), u"1.0"),
+        (module.Int(), u"1.5"),
+        (module.Int(), u'"1"'),
+        (module.Int(min=0, max=10), u"-1"),
+        (module.Int(min=0, max=10), u"11"),
+        (module.Int(min=0, max=10), u"10"),
+        (py.Int(min=-(10 ** 20)), u"1"),
+        (py.Int(max=10 ** 20), u"1"),
+        (module.Int(options=[1, 2]), u"3"),
+        (module.Int(options=[1, 2]), u"2"),
+        (module.Int(nullable=True), u"null"),
+        (module.Str(), u'"abc"'),
+        (module.Str(), u"1"),
+        (module.Str(minlen=2, maxlen=3), u'"a"'),
+        (module.Str(minlen=2, maxlen=3), u'"abc"'),
+        (module.Str(minlen=2, maxlen=3), u'"abcd"'),
+        (module.Str(maxlen=3), u'"a\\nbcd"'),
+        (module.Str(maxlen=3), u'"a\\nb"'),
+        (module.Str(pattern=u"^a"), u'"bc"'),
+        (module.Str(options=[u"a"]), u'"a"'),
+        (module.Float(), u"1"),
+        (module.Bool(), u"true"),
+        (module.Bool(), u"1"),
+    ]:
+        assert_same(loads, validator, data)
+
+
+def test_containers(module, loads):
+    v = module.Dict(
+        {
+            u"id": module.Int(min=0),
+            u"name": module.Str(maxlen=8),
+            u"tags": module.List(module.Str(), minlen=1, unique=True),
+            u"extra": module.Dict(extra=(module.Str(maxlen=3), module.Int())),
+            u"any": module.Any(),
+            u"pair": module.Tuple(module.Int(), module.Int()),
+        },
+        defaults={u"tags": [u"x"]},
+        optional=[u"extra", u"any", u"pair"],
+        dispose=[u"junk"],
+    )
+    for data in [
+        u'{"id": 1, "name": "a", "tags": ["a", "b", "a"]}',
+        u'{"id": 1, "name": "a"}',
+        u'{"id": 1, "name": "a", "junk": 1.5e3, "junk": "x"}',
+        u'{ "id" : 1 , "name" : "a" , "extra" : { } , "junk" : [[{"]": 1}]] }',
+        u'{"id": -1, "name": "abcdefghi", "tags": [], "x": {"a": [1]}, "y": 1}',
+        u'{"id": 1, "name": "a", "tags": [1, "a", 2]}',
+        u'{"id": 1, "name": "a", "extra": {"abc": 1, "abcd": "x", "abce": 1}}',
+        u'{"id": 1, "name": "a", "any": {"a": [1, {"b": null}]}}',
+        u'{"id": 1, "name": "a", "pair": [1, 2]}',
+        u'{"id": 1, "name": "a", "pair": {"a": 1}}',
+        u'{"tags": []}',
+        u'{"id": [1, 2], "name": {"a": "b"}, "tags": {}, "extra": []}',
+        u"[]",
+        u"[1]",
+        u"{}",
+        u"1",
+    ]:
+        assert_same(loads, v, data)
+
+    v = module.Dict(extra=(module.Str(), module.Int()), minlen=2)
+    assert_same(loads, v, u'{"a": 1}')
+    assert_same(loads, v, u'{"a": 1, "b": 2}')
+
+
+def test_nested_lists(module, loads):
+    v = module.List(module.List(module.Int(), maxlen=2), minlen=2)
+    for data in [
+        u"[]",
+        u"[[]]",
+        u"[[1, 2], [3]]",
+        u"[[1, 2, 3], [4]]",
+        u'[[1, "2", 3], [4]]',
+        u"[[1], {}]",
+        u"[1, 2]",
+    ]:
+        assert_same(loads, v, data)
+
+
+def test_defaults(module, loads):
+    v = module.Dict(
+        {u"a": module.Int(), u"b": module.List(module.Int()), u"c": module.Int()},
+        defaults={u"a": 1, u"b": [], u"c": u"x"},
+    )
+    assert_same(loads, v, u"{}")
+    assert_same(loads, v, u'{"c": 2}')
+    result = loads(v, u'{"c": 1}')
+    assert result[u"b"] == []
+    assert result[u"b"] is not loads(v, u'{"c": 1}')[u"b"]
+
+
+def test_fail_fast(module, loads):
+    item = module.Dict({u"a": module.Int(), u"b": module.Int()}, fail_fast=True)
+    v = module.List(item)
+    assert_same(loads, v, u'[{"a": 1, "b": 2}, {"a": "x", "b": {"c": [1]}}, {"a": 2}]')
+    assert_same(loads, v, u'[{"a": 1, "c": [1, 2]}, {"b": 1}]')
+    assert_same(loads, v, u'[{"b": 1}]')
+    assert_same(loads, v, u'[{"a": 1, "b": 2, "c": [{"d": "]"}]}, {"a": 1}]')
+
+    v = module.Dict(
+        {u"a": module.Int()},
+        defaults={u"a": u"x"},
+        extra=(module.Str(maxlen=1), module.Int()),
+        fail_fast=True,
+    )
+    assert_same(loads, v, u"{}")
+    assert_same(loads, v, u'{"ab": 1, "b": 1}')
+    assert_same(loads, v, u'{"a": 1, "b": "x", "c": 1}')
+
+    v = module.Dict({u"a": module.Int(), u"b": module.Int()}, fail_fast=True)
+    assert_same(loads, v, u'{"a": 1}')
+
+    v = module.List(module.List(module.Int(), fail_fast=True), fail_fast=True)
+    assert_same(loads, v, u'[[1, [2, "]"], 3], [4]]')
+    assert_same(loads, v, u'[[1, "x", {"[": [1]}], [4]]')
+    assert_same(loads, v, u'[[1], ["x"]] ')
+    with pytest.raises(exc.SchemaError):
+        loads(v, u'[[1, "x"], [2]] 1')
+
+
+def test_maxlen(module, loads):
+    v = module.Dict({u"a": module.List(module.Int(), maxlen=2)})
+    with pytest.raises(exc.SchemaError) as info:
+        loads(v, u'{"a": [1, 2, 3, 4, "x"]}')
+    assert repr(info.value.errors) == repr(
+        [exc.MaxLengthError(deque([u"a"]), expected=2, actual=3)]
+    )
+    assert_same(loads, v, u'{"a": [1, "x", 2, 3]}')
+    assert_same(loads, v, u'{"a": [1, 2]}')
+
+    v = module.Dict(extra=(module.Str(), module.Int()), maxlen=1)
+    with pytest.raises(exc.MaxLengthError) as info:
+        loads(v, u'{"a": 1, "b": 2, "c": [3, 4]}')
+    assert info.value.expected == 1
+    assert info.value.actual == 2
+    assert_same(loads, v, u'{"a": "x", "b": 2, "c": 3}')
+    assert_same(loads, v, u'{"a": 1}')
+
+    v = module.List(module.Int(), maxlen=1, unique=True)
+    assert_same(loads, v, u"[1, 1, 1]")
+
+    with pytest.raises(ValueError) as info:
+        loads(module.Str(maxlen=2), u'"abc" x')
+    assert str(info.value).startswith("Extra data")
+
+
+def test_lazyref(module, loads):
+    module.Dict(
+        {u"x": module.Int(), u"next": module.LazyRef(u"node", maxdepth=2)},
+        optional=[u"next"],
+        alias=u"node",
+    )
+    v = module.LazyRef(u"node")
+    assert_same(loads, v, u'{"x": 1, "next": {"x": 2}}')
+    assert_same(loads, v, u'{"x": 1, "next": {"x": 2, "next": {"x": 3}}}')
+    assert_same(loads, v, u'{"x": 1, "next": {"x": 2, "next": {"next": [1]}}}')
+    assert_same(loads, v, u'{"x": 1, "next": {"x": 2, "next": "abc"}}')
+    assert_same(loads, v, u'{"x": 1, "next": {"x": 2, "next": 1}}')
+    assert_same(loads, v, u'{"x": 1, "next": {"x": "y"}}')
+
+    module.Int(alias=u"node", replace=True)
+    assert_same(loads, v, u"1")
+    assert_same(loads, module.LazyRef(u"node", maxdepth=1), u"1")
+
+
+def test_threads(module, loads):
+    ThreadPoolExecutor = pytest.importorskip("concurrent.futures").ThreadPoolExecutor
+
+    module.List(module.LazyRef(u"node"), alias=u"node")
+    validators = [
+        module.LazyRef(u"node", maxdepth=3),
+        module.Dict({u"x": module.Int(), u"y": module.List(module.Str())}),
+    ]
+    documents = [u"[[[]], []]", u'{"x": 1, "y": ["a", "b"]}']
+
+    def parse(i):
+        return loads(validators[i % 2], documents[i % 2])
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(parse, range(1000)))
+    assert results == [[[[]], []], {u"x": 1, u"y": [u"a", u"b"]}] * 500
+
+
+def test_context(module, loads):
+    context = {}
+    v = module.LazyRef(u"node", maxdepth=1)
+    module.List(module.Int(), alias=u"node")
+    assert loads(v, u"[1]", context) == [1]
+    assert context == {u"node.recursion_depth": 0}
+
+
+def test_bytes(module, loads):
+    v = module.Dict({u"a": module.Str()})
+    text = u'{"a": "привет"}'
+    for encoding in ("utf-8", "utf-16", "utf-16-le", "utf-32-be"):
+        assert loads(v, text.encode(encoding)) == {u"a": u"привет"}
+    assert loads(v, bytearray(text.encode("utf-8"))) == {u"a": u"привет"}
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (u"", "Expecting value"),
+        (u"[", "Unterminated container"),
+        (u"{", "Expecting property name enclosed in double quotes"),
+        (u"{1: 2}", "Expecting property name enclosed in double quotes"),
+        (u'{"a" 1}', "Expecting ':' delimiter"),
+        (u'{"a": 1 "b": 2}', "Expecting ',' delimiter"),
+        (u'{"a": tru}', "Expecting value"),
+        (u'{"a": "x}', "Unterminated string"),
+        (u'{"a": 1} 1', "Extra data"),
+        (u'{"b": "x}', "Unterminated string"),
+        (u'{"b": [1, 2', "Unterminated container"),
+        (u'{"b": [1, 2}', "Expecting ',' delimiter"),
+        (u'{"b": 1, "a": 1', "Expecting ',' delimiter"),
+        (u'{"c": [1, [2', "Unterminated container"),
+        (u'{"c": [[1]]} 1', "Extra data"),
+        (u'{"c": [1]} 1', "Extra data"),
+        (u'{"d": [', "Expecting value"),
+        (u'{"d": [1', "Expecting ',' delimiter"),
+        (u'{"d": [1 2]}', "Expecting ',' delimiter"),
+        (u'{"d": [1,]}', "Expecting value"),
+        (u"\ufeff{}", "Unexpected UTF-8 BOM"),
+    ],
+)
+def test_malformed(module, loads, data, message):
+    v = module.Dict(
+        {
+            u"a": module.Int(),
+            u"c": module.List(module.Int(), maxlen=0),
+            u"d": module.List(module.Int()),
+        },
+        optional=[u"a", u"c", u"d"],
+    )
+    with pytest.raises(ValueError) as info:
+        loads(v, data)
+    assert str(info.value).startswith(message)
+
+
+def test_invalid_data(module, loads):
+    with pytest.raises(TypeError) as info:
+        loads(module.Any(), 1)
+    assert str(info.value) == (
+        "Expected data to be str, bytes or bytearray, got %r" % (int,)
+    )
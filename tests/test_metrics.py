@@ -0,0 +1,172 @@
+import threading
+
+import pytest
+
+from validx import exc, metrics
+
+
+class ListSink(metrics.Sink):
+    def __init__(self):
+        self.log = []
+
+    def observe(self, alias, duration, error):
+        assert duration >= 0
+        self.log.append((alias, None if error is None else list(error)))
+
+
+@pytest.fixture(autouse=True)
+def disable():
+    yield
+    metrics.disable()
+
+
+def test_enable(module):
+    v = module.Dict({"x": module.Int(min=0)}, alias="point")
+    w = module.List(module.LazyRef("point"), alias="points")
+    sink = ListSink()
+    assert metrics.enable(sink, aliases=["point"]) == ["point"]
+
+    point = module.instances.get("point")
+    assert point is not v
+    assert isinstance(point, module.Validator)
+    assert repr(point) == repr(v)
+    assert point.dump() == v.dump()
+    assert point.clone() == v
+    assert point({"x": 1}) == {"x": 1}
+    with pytest.raises(exc.SchemaError):
+        point({"x": -1})
+    assert w([{"x": 2}]) == [{"x": 2}]
+    assert module.instances.get("points") is w
+    assert sink.log == [
+        ("point", None),
+        ("point", [exc.MinValueError(expected=0, actual=-1).add_context("x")]),
+        ("point", None),
+    ]
+
+    # Enabling again switches metered validators to the new sink
+    other = ListSink()
+    assert metrics.enable(other) == ["point", "points"]
+    module.instances.get("points")([{"x": 3}])
+    assert other.log == [("point", None), ("points", None)]
+    assert len(sink.log) == 3
+
+    metrics.disable()
+    assert module.instances.get("point") is v
+    assert module.instances.get("points") is w
+    w([{"x": 4}])
+    assert len(other.log) == 2
+
+
+def test_enable_references(module):
+    module.Int(min=0, alias="x")
+    sink = ListSink()
+    metrics.enable(sink)
+    v = module.Validator.load({"__class__": "List", "item": {"__use__": "x"}})
+    assert v([1]) == [1]
+    assert sink.log == [("x", None)]
+
+    # References to proxies follow ``disable()`` and ``enable()``
+    metrics.disable()
+    assert v([2]) == [2]
+    assert len(sink.log) == 1
+    other = ListSink()
+    metrics.enable(other)
+    assert v([3]) == [3]
+    assert len(sink.log) == 1
+    assert other.log == [("x", None)]
+
+    # Validators registered after ``enable()`` are not metered
+    module.Int(alias="y")
+    module.instances.get("y")(1)
+    assert other.log == [("x", None)]
+
+
+def test_enable_equality(module):
+    v = module.Int(min=0, alias="x")
+    w = module.Int(min=1, alias="y")
+    metrics.enable(ListSink())
+    x = module.instances.get("x")
+    y = module.instances.get("y")
+    assert x != y
+    assert x != v
+    assert x.clone() == v
+    assert len({x, y}) == 2
+
+    metrics.disable()
+    module.Int(min=1, alias="x", replace=True)
+    metrics.enable(ListSink())
+    assert module.instances.get("x") == module.instances.get("y")
+    assert hash(module.instances.get("x")) == hash(module.instances.get("y"))
+    assert module.instances.get("y")._validator is w
+
+
+def test_aggregator(module):
+    module.Dict({"x": module.Int(min=0), "y": module.Int()}, alias="point")
+    module.Int(alias='a"b')
+    sink = metrics.Aggregator(buckets=[1.0, 0.5])
+    metrics.enable(sink)
+
+    point = module.instances.get("point")
+    for value in [{"x": 1, "y": 1}, {"x": -1}, {"x": -1, "y": 1}]:
+        try:
+            point(value)
+        except exc.ValidationError:
+            pass
+    module.instances.get('a"b')(1)
+
+    result = sink.collect()
+    assert list(result) == ['a"b', "point"]
+    assert result["point"]["count"] == 3
+    assert result["point"]["errors"] == {"MinValueError": 2, "MissingKeyError": 1}
+    assert result["point"]["buckets"] == [(0.5, 3), (1.0, 3), (float("inf"), 3)]
+    assert 0 < result["point"]["sum"] < 1
+
+    lines = sink.expose(prefix="app").splitlines()
+    assert lines[:9] == [
+        "# HELP app_validations_total Number of validations.",
+        "# TYPE app_validations_total counter",
+        'app_validations_total{alias="a\\"b"} 1',
+        'app_validations_total{alias="point"} 3',
+        "# HELP app_errors_total Number of validation errors by class.",
+        "# TYPE app_errors_total counter",
+        'app_errors_total{alias="point",error="MinValueError"} 2',
+        'app_errors_total{alias="point",error="MissingKeyError"} 1',
+        "# HELP app_duration_seconds Duration of validation.",
+    ]
+    assert 'app_duration_seconds_bucket{alias="point",le="0.5"} 3' in lines
+    assert 'app_duration_seconds_bucket{alias="point",le="+Inf"} 3' in lines
+    assert 'app_duration_seconds_count{alias="point"} 3' in lines
+
+
+def test_aggregator_buckets():
+    sink = metrics.Aggregator()
+    assert sink.buckets == metrics.DEFAULT_BUCKETS
+    for duration in [0.00001, 0.00002, 0.3, 5.0]:
+        sink.observe("x", duration, None)
+    buckets = dict(sink.collect()["x"]["buckets"])
+    assert buckets[0.00001] == 1
+    assert buckets[0.000025] == 2
+    assert buckets[0.25] == 2
+    assert buckets[0.5] == 3
+    assert buckets[1.0] == 3
+    assert buckets[float("inf")] == 4
+
+
+def test_aggregator_threads():
+    sink = metrics.Aggregator()
+
+    def work():
+        for _ in range(1000):
+            sink.observe("x", 0.001, None)
+        sink.observe("y", 0.001, exc.MinValueError(expected=0, actual=-1))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    result = sink.collect()
+    assert result["x"]["count"] == 4000
+    assert result["y"]["count"] == 4
+    assert result["y"]["errors"] == {"MinValueError": 4}
@@ -0,0 +1,100 @@
+import pytest
+
+from validx import exc, parallel
+
+
+@pytest.fixture(params=["process", "thread"])
+def backend(request):
+    return request.param
+
+
+def assert_same(v, values, **kw):
+    """Assert parallel validation gives the same results as sequential one"""
+    mode = kw.get("errors", "collect")
+    try:
+        expected = v.validate_many(values, mode)
+    except exc.SchemaError as e:
+        with pytest.raises(exc.SchemaError) as info:
+            parallel.validate_many(v, values, **kw)
+        assert repr(list(info.value)) == repr(list(e))
+    else:
+        assert repr(parallel.validate_many(v, values, **kw)) == repr(expected)
+
+
+@pytest.mark.parametrize("mode", ["collect", "raise", "skip"])
+def test_validate_many(module, backend, mode):
+    v = module.Dict({"x": module.Int(min=0), "y": module.List(module.Int())})
+    values = [
+        {"x": i if i % 7 else -i, "y": [i] if i % 5 else [u"y"]} for i in range(50)
+    ]
+    assert_same(v, values, workers=2, backend=backend, chunksize=8, errors=mode)
+    assert_same(v, values[1:4], workers=2, backend=backend, chunksize=8, errors=mode)
+    assert_same(v, [], workers=2, backend=backend, errors=mode)
+
+
+def test_chunks(module):
+    v = module.Int(min=0)
+    values = [1, -2, 3, -4, 5]
+    for chunksize in (1, 2, 5, 10):
+        assert_same(v, values, workers=3, backend="thread", chunksize=chunksize)
+        assert parallel.validate_many(
+            v, iter(values), workers=3, backend="thread", chunksize=chunksize
+        ) == v.validate_many(values)
+
+
+def test_arrays(module):
+    numpy = pytest.importorskip("numpy")
+    v = module.Float(max=10)
+    values = numpy.arange(20, dtype=float)
+    assert_same(v, values, workers=2, chunksize=6)
+    assert_same(v, values, workers=2, backend="thread", chunksize=6)
+
+
+def test_default_workers(module):
+    v = module.Int()
+    assert parallel.validate_many(v, [1, 2, u"3"], backend="thread") == (
+        [1, 2],
+        [exc.InvalidTypeError(expected=int, actual=type(u"3")).add_context(2)],
+    )
+
+
+def test_bounded_chunks(module):
+    consumed = []
+    observed = []
+
+    class Observe(module.Validator):
+        def __call__(self, value, __context=None):
+            observed.append((value, len(consumed)))
+            return value
+
+    def values():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    results, errors = parallel.validate_many(
+        Observe(), values(), workers=2, backend="thread", chunksize=1
+    )
+    assert results == list(range(100))
+    # Chunks are consumed only a few ahead of the validated ones
+    assert all(count <= value + 1 + 2 * 2 for value, count in observed)
+
+
+def test_invalid_params(module):
+    v = module.Int()
+    with pytest.raises(ValueError) as info:
+        parallel.validate_many(v, [], errors="ignore")
+    assert info.value.args == (
+        "Expected errors to be one of 'collect', 'raise' or 'skip', got 'ignore'",
+    )
+    with pytest.raises(ValueError) as info:
+        parallel.validate_many(v, [], backend="fiber")
+    assert info.value.args == (
+        "Expected backend to be one of 'process' or 'thread', got 'fiber'",
+    )
+    with pytest.raises(ValueError) as info:
+        parallel.validate_many(v, [], workers=0)
+    assert info.value.args == ("Expected workers to be positive, got 0",)
+    with pytest.raises(ValueError) as info:
+        parallel.validate_many(v, [], chunksize=0)
+    assert info.value.args == ("Expected chunksize to be positive, got 0",)
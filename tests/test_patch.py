@@ -0,0 +1,394 @@
+from collections import OrderedDict, deque
+from copy import deepcopy
+
+import pytest
+
+from validx import exc
+from validx.patch import parse_pointer
+
+
+def apply_patch(value, patch):
+    # Naive JSON Patch, that is used as a reference
+    value = deepcopy(value)
+    for operation in patch:
+        if operation["op"] in ("move", "copy"):
+            item = deepcopy(resolve(value, operation["from"]))
+            if operation["op"] == "move":
+                remove = {"op": "remove", "path": operation["from"]}
+                value = apply_patch(value, [remove])
+            operation = {"op": "add", "path": operation["path"], "value": item}
+        path = parse_pointer(operation["path"])
+        if not path:
+            value = deepcopy(operation["value"])
+            continue
+        parent = resolve(value, path[:-1])
+        key = path[-1]
+        if isinstance(parent, list) and key != "-":
+            key = int(key)
+        if operation["op"] == "add" and isinstance(parent, list):
+            index = len(parent) if key == "-" else key
+            parent.insert(index, deepcopy(operation["value"]))
+        elif operation["op"] == "remove":
+            del parent[key]
+        else:
+            parent[key] = deepcopy(operation["value"])
+    return value
+
+
+def resolve(value, path):
+    if not isinstance(path, tuple):
+        path = parse_pointer(path)
+    for key in path:
+        value = value[int(key) if isinstance(value, list) else key]
+    return value
+
+
+def assert_same(validator, value, patch):
+    old = validator(value)
+    snapshot = deepcopy(old)
+    try:
+        expected = validator(apply_patch(value, patch))
+    except exc.ValidationError as e:
+        with pytest.raises(exc.SchemaError) as info:
+            validator.revalidate(old, patch)
+        assert sorted(map(repr, info.value)) == sorted(map(repr, e))
+        result = None
+    else:
+        result = validator.revalidate(old, patch)
+        assert result == expected
+        assert type(result) is type(expected)
+    assert old == snapshot
+    return old, result
+
+
+def document(module):
+    return module.Dict(
+        {
+            u"name": module.Str(),
+            u"size": module.Int(min=0),
+            u"tags": module.List(module.Str(), unique=True, maxlen=3),
+            u"point": module.Tuple(module.Int(), module.Int()),
+            u"meta": module.Dict(extra=(module.Str(maxlen=3), module.Int())),
+            u"items": module.List(
+                module.Dict({u"sku": module.Str(), u"qty": module.Int(min=1)}),
+                minlen=1,
+            ),
+        },
+        defaults={u"size": 0},
+        optional=[u"meta"],
+    )
+
+
+DOCUMENT = {
+    u"name": u"x",
+    u"size": 1,
+    u"tags": [u"a", u"b"],
+    u"point": [1, 2],
+    u"meta": {u"k": 1},
+    u"items": [{u"sku": u"a", u"qty": 1}, {u"sku": u"b", u"qty": 2}],
+}
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        [],
+        [{"op": "replace", "path": "/name", "value": u"y"}],
+        [{"op": "replace", "path": "/name", "value": 1}],
+        [{"op": "remove", "path": "/name"}],
+        [{"op": "remove", "path": "/size"}],
+        [{"op": "remove", "path": "/meta"}],
+        [{"op": "add", "path": "/extra", "value": 1}],
+        [{"op": "add", "path": "/tags/-", "value": u"c"}],
+        [{"op": "add", "path": "/tags/0", "value": u"b"}],
+        [{"op": "add", "path": "/tags/-", "value": u"c"}] * 2,
+        [{"op": "replace", "path": "/point/1", "value": 3}],
+        [{"op": "add", "path": "/point/1", "value": 3}],
+        [{"op": "add", "path": "/meta/abc", "value": 1}],
+        [{"op": "add", "path": "/meta/abcd", "value": 1}],
+        [{"op": "add", "path": "/meta/abc", "value": u"x"}],
+        [{"op": "replace", "path": "/items/1/qty", "value": 0}],
+        [{"op": "remove", "path": "/items/0/qty"}],
+        [{"op": "remove", "path": "/items/0"}, {"op": "remove", "path": "/items/0"}],
+        [
+            {"op": "add", "path": "/items/0", "value": {u"sku": u"c", u"qty": 3}},
+            {"op": "replace", "path": "/items/0/qty", "value": 4},
+            {"op": "add", "path": "/items/0/x", "value": 1},
+        ],
+        [
+            {"op": "replace", "path": "/items/0/qty", "value": 3},
+            {"op": "remove", "path": "/tags/1"},
+            {"op": "replace", "path": "/size", "value": -1},
+        ],
+        [
+            {"op": "replace", "path": "/items/1/qty", "value": 0},
+            {"op": "add", "path": "/items/0", "value": {u"sku": u"c", u"qty": 3}},
+            {"op": "remove", "path": "/items/1"},
+        ],
+        [{"op": "replace", "path": "", "value": {u"name": u"z"}}],
+        [{"op": "add", "path": "", "value": []}],
+    ],
+)
+def test_revalidate(module, patch):
+    assert_same(document(module), DOCUMENT, patch)
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+@pytest.mark.parametrize(
+    "patch",
+    [
+        [{"op": "add", "path": "/m/xy", "value": u"z"}],
+        [
+            {"op": "replace", "path": "/b/1", "value": u"x"},
+            {"op": "replace", "path": "/a", "value": u"x"},
+            {"op": "add", "path": "/m/xy", "value": u"z"},
+        ],
+        [
+            {"op": "replace", "path": "/b/1", "value": u"x"},
+            {"op": "replace", "path": "/b/0", "value": u"y"},
+        ],
+        [
+            {"op": "replace", "path": "/c/1", "value": u"x"},
+            {"op": "replace", "path": "/c/0", "value": u"y"},
+        ],
+        [{"op": "remove", "path": "/a"}, {"op": "replace", "path": "/b/0", "value": 0}],
+        [{"op": "remove", "path": "/d"}, {"op": "remove", "path": "/a"}],
+        [
+            {"op": "add", "path": "/m/x", "value": u"z"},
+            {"op": "add", "path": "/m/y", "value": u"z"},
+        ],
+        [
+            {"op": "add", "path": "/x", "value": 1},
+            {"op": "add", "path": "/y", "value": 1},
+        ],
+    ],
+)
+def test_revalidate_errors(module, patch, fail_fast):
+    # Errors are the same and in the same order,
+    # as if the patched value is validated as a whole
+    v = module.Dict(
+        {
+            u"a": module.Int(),
+            u"b": module.List(module.Int(min=1), fail_fast=fail_fast),
+            u"c": module.Tuple(module.Int(), module.Int(), fail_fast=fail_fast),
+            u"d": module.Int(),
+            u"m": module.Dict(
+                extra=(module.Str(maxlen=1), module.Int()), fail_fast=fail_fast
+            ),
+        },
+        defaults={u"d": u"x"},
+        fail_fast=fail_fast,
+    )
+    value = {u"a": 1, u"b": [1, 2], u"c": [1, 2], u"d": 1, u"m": {u"k": 1}}
+    with pytest.raises(exc.SchemaError) as expected:
+        v(apply_patch(value, patch))
+    with pytest.raises(exc.SchemaError) as info:
+        v.revalidate(v(value), patch)
+    assert list(map(repr, info.value)) == list(map(repr, expected.value))
+
+
+def test_revalidate_sharing(module):
+    v = document(module)
+    old = v(DOCUMENT)
+    new = v.revalidate(old, [{"op": "replace", "path": "/items/1/qty", "value": 3}])
+    assert new[u"items"][1] == {u"sku": u"b", u"qty": 3}
+    assert new is not old
+    assert new[u"items"] is not old[u"items"]
+    assert new[u"items"][0] is old[u"items"][0]
+    assert new[u"meta"] is old[u"meta"]
+    assert new[u"tags"] is old[u"tags"]
+    assert v.revalidate(old, []) is old
+
+
+def test_revalidate_move_copy(module):
+    v = document(module)
+    old = v(DOCUMENT)
+    new = v.revalidate(
+        old,
+        [
+            {"op": "copy", "from": "/items/0", "path": "/items/-"},
+            {"op": "replace", "path": "/items/2/qty", "value": 5},
+            {"op": "move", "from": "/meta/k", "path": "/meta/m"},
+            {"op": "test", "path": "/items/0/qty", "value": 1},
+        ],
+    )
+    assert new[u"items"] == [
+        {u"sku": u"a", u"qty": 1},
+        {u"sku": u"b", u"qty": 2},
+        {u"sku": u"a", u"qty": 5},
+    ]
+    assert new[u"meta"] == {u"m": 1}
+    assert old == v(DOCUMENT)
+
+    assert_same(v, DOCUMENT, [{"op": "move", "from": "/size", "path": "/meta/size"}])
+    assert_same(v, DOCUMENT, [{"op": "move", "from": "/size", "path": "/meta/siz"}])
+
+
+def test_revalidate_lazyref(module):
+    v = module.Dict(
+        {u"name": module.Str(), u"children": module.List(module.LazyRef(u"node"))},
+        alias=u"node",
+    )
+    value = {u"name": u"a", u"children": [{u"name": u"b", u"children": []}]}
+    old, new = assert_same(
+        v,
+        value,
+        [
+            {
+                "op": "add",
+                "path": "/children/0/children/-",
+                "value": {u"name": u"c", u"children": []},
+            }
+        ],
+    )
+    assert new[u"children"][0][u"name"] == u"b"
+    assert_same(v, value, [{"op": "remove", "path": "/children/0/name"}])
+
+    v = module.Dict(
+        {u"children": module.List(module.LazyRef(u"tree", maxdepth=2))},
+        alias=u"tree",
+    )
+    value = {u"children": [{u"children": []}]}
+    assert_same(
+        v, value, [{"op": "add", "path": "/children/0/children/-", "value": {}}]
+    )
+    assert_same(
+        v,
+        value,
+        [
+            {
+                "op": "add",
+                "path": "/children/0/children/-",
+                "value": {u"children": [{u"children": []}]},
+            }
+        ],
+    )
+    assert_same(
+        v,
+        {u"children": [{u"children": [{u"children": []}]}]},
+        [{"op": "add", "path": "/children/0/children/0/children/-", "value": {}}],
+    )
+
+    # Depth of changed containers is checked as well
+    with pytest.raises(exc.SchemaError) as info:
+        v.revalidate(
+            {u"children": [{u"children": [{u"children": [{u"children": []}]}]}]},
+            [{"op": "add", "path": "/children/0/children/0/children/0/x", "value": 1}],
+        )
+    assert len(info.value) == 1
+    assert isinstance(info.value[0], exc.RecursionMaxDepthError)
+    assert info.value[0].context == deque(
+        [u"children", 0, u"children", 0, u"children", 0]
+    )
+    assert info.value[0].expected == 2
+    assert info.value[0].actual == 3
+
+
+def test_revalidate_walkthrough(module):
+    # Cached is walked through, other validators validate the whole value
+    v = module.Dict(
+        {
+            u"cached": module.Cached(module.Dict({u"x": module.Int()})),
+            u"all": module.AllOf(
+                module.List(module.Int()), module.List(module.Any(), maxlen=2)
+            ),
+        }
+    )
+    value = {u"cached": {u"x": 1}, u"all": [1]}
+    assert_same(v, value, [{"op": "replace", "path": "/cached/x", "value": 2}])
+    assert_same(v, value, [{"op": "replace", "path": "/cached/x", "value": u"2"}])
+    assert_same(v, value, [{"op": "add", "path": "/all/-", "value": 2}])
+    assert_same(v, value, [{"op": "add", "path": "/all/-", "value": u"2"}])
+    assert_same(v, value, [{"op": "add", "path": "/all/-", "value": 2}] * 2)
+
+
+def test_revalidate_dispose(module):
+    v = module.Dict({u"x": module.Int()}, dispose=[u"y"])
+    assert_same(v, {u"x": 1}, [{"op": "add", "path": "/y", "value": u"z"}])
+
+
+def test_revalidate_length(module):
+    v = module.Dict(extra=(module.Str(), module.Int()), minlen=1, maxlen=2)
+    assert_same(v, {u"x": 1}, [{"op": "remove", "path": "/x"}])
+    assert_same(v, {u"x": 1}, [{"op": "add", "path": "/y", "value": 2}])
+    assert_same(v, {u"x": 1}, [{"op": "add", "path": "/y", "value": 2}] * 2)
+    assert_same(
+        v,
+        {u"x": 1},
+        [
+            {"op": "add", "path": "/y", "value": 2},
+            {"op": "add", "path": "/z", "value": 3},
+        ],
+    )
+
+    v = module.List(module.List(module.Int()), maxlen=2)
+    assert_same(v, [[1]], [{"op": "add", "path": "/0/-", "value": 2}])
+    assert_same(v, [[1]], [{"op": "copy", "from": "/0", "path": "/-"}])
+    assert_same(
+        v,
+        [[1]],
+        [
+            {"op": "add", "path": "/0/-", "value": 2},
+            {"op": "copy", "from": "/0", "path": "/-"},
+            {"op": "copy", "from": "/0", "path": "/-"},
+        ],
+    )
+
+
+def test_revalidate_mappings(module):
+    v = module.Dict({u"x": module.Dict({u"y": module.Int()})})
+    old = {u"x": OrderedDict([(u"y", 1)])}
+    new = v.revalidate(old, [{"op": "replace", "path": "/x/y", "value": 2}])
+    assert new == {u"x": {u"y": 2}}
+    assert type(new[u"x"]) is dict
+
+
+@pytest.mark.parametrize(
+    "patch, message",
+    [
+        ([1], "Expected operation to be a dict, got 1"),
+        (
+            [{"op": "add", "value": 1}],
+            "Operation {'op': 'add', 'value': 1} has no 'path'",
+        ),
+        (
+            [{"op": "add", "path": "/x"}],
+            "Operation {'op': 'add', 'path': '/x'} has no 'value'",
+        ),
+        ([{"op": "x", "path": ""}], "Unsupported operation 'x'"),
+        ([{"op": "remove", "path": ""}], "Cannot remove the root value"),
+        (
+            [{"op": "remove", "path": "x"}],
+            "Expected pointer to start with '/', got 'x'",
+        ),
+        ([{"op": "remove", "path": 1}], "Expected pointer to be a string, got 1"),
+        ([{"op": "remove", "path": "/y"}], "Path '/y' does not exist"),
+        (
+            [{"op": "remove", "path": "/a~1b~0c/0"}],
+            "Path '/a~1b~0c' does not exist",
+        ),
+        ([{"op": "add", "path": "/x/0", "value": 1}], "Path '/x' does not exist"),
+        ([{"op": "remove", "path": "/l/2"}], "Path '/l/2' does not exist"),
+        ([{"op": "remove", "path": "/l/01"}], "Path '/l/01' does not exist"),
+        ([{"op": "remove", "path": "/l/-"}], "Path '/l/-' does not exist"),
+        ([{"op": "add", "path": "/l/3", "value": 1}], "Path '/l/3' does not exist"),
+        ([{"op": "test", "path": "/x", "value": 2}], "Test of '/x' failed"),
+        ([{"op": "copy", "from": "/y", "path": "/z"}], "Path '/y' does not exist"),
+        (
+            [{"op": "move", "from": "/l", "path": "/l/0"}],
+            "Cannot move '/l' into itself",
+        ),
+    ],
+)
+def test_revalidate_invalid_patch(module, patch, message):
+    v = module.Dict({u"x": module.Int(), u"l": module.List(module.Int())})
+    with pytest.raises(ValueError) as info:
+        v.revalidate({u"x": 1, u"l": [1, 2]}, patch)
+    assert info.value.args == (message,)
+
+
+def test_parse_pointer():
+    assert parse_pointer(u"") == ()
+    assert parse_pointer(u"/") == (u"",)
+    assert parse_pointer(u"/a/0") == (u"a", u"0")
+    assert parse_pointer(u"/a~1b/c~0d/~01") == (u"a/b", u"c~d", u"~1")
@@ -0,0 +1,52 @@
+import pytest
+
+from validx import patterns
+
+
+@pytest.fixture
+def cache():
+    info = patterns.cache_info()
+    patterns.cache_clear()
+    yield
+    patterns.cache_clear()
+    patterns.cache_resize(info.maxsize)
+
+
+def test_compile(cache):
+    p = patterns.compile(u"^[a-z]+$")
+    assert p.pattern == u"^[a-z]+$"
+    assert p.match(u"abc")
+    assert patterns.compile(u"^[a-z]+$") is p
+    assert patterns.cache_info() == patterns.CacheInfo(
+        hits=1, misses=1, maxsize=4096, currsize=1
+    )
+
+    patterns.cache_clear()
+    assert patterns.cache_info() == patterns.CacheInfo(
+        hits=0, misses=0, maxsize=4096, currsize=0
+    )
+
+
+def test_eviction(cache):
+    patterns.cache_resize(2)
+    a = patterns.compile(u"a")
+    patterns.compile(u"b")
+    assert patterns.compile(u"a") is a  # Now "b" is least recently used
+    patterns.compile(u"c")
+    assert patterns.cache_info() == patterns.CacheInfo(
+        hits=1, misses=3, maxsize=2, currsize=2
+    )
+    assert patterns.compile(u"a") is a
+    patterns.compile(u"b")
+    assert patterns.cache_info() == patterns.CacheInfo(
+        hits=2, misses=4, maxsize=2, currsize=2
+    )
+
+    patterns.cache_resize(1)
+    assert patterns.cache_info().currsize == 1
+    patterns.compile(u"b")
+    assert patterns.cache_info().hits == 3
+
+    with pytest.raises(ValueError) as info:
+        patterns.cache_resize(0)
+    assert info.value.args == ("Cache size should be positive, got 0",)
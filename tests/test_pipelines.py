@@ -4,6 +4,7 @@ from collections import deque
 import pytest
 
 from validx import exc
+from validx.profiler import profile
 
 
 def test_all_of(module):
@@ -88,3 +89,127 @@ def test_one_of_context(module):
     context = {}
     v(None, context)
     assert context["marked"]
+
+
+def test_one_of_fail_fast(module):
+    v = module.OneOf(
+        module.Int(options=[1, 2, 3]), module.Int(min=10), fail_fast=True
+    )
+    assert v(1) == 1
+    assert v(10) == 10
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    with pytest.raises(exc.SchemaError) as info:
+        v(9)
+    assert info.value.errors == [
+        exc.MinValueError(context=deque([exc.Step(1)]), expected=10, actual=9)
+    ]
+
+
+def test_one_of_dispatch(module):
+    point = module.Dict({u"type": module.Const(u"point"), u"x": module.Int()})
+    circle = module.Dict({u"type": module.Const(u"circle"), u"r": module.Int()})
+    v = module.OneOf(module.Int(), point, circle, module.Str())
+    assert v.discriminator is None
+    assert v(1) == 1
+    assert v(u"x") == u"x"
+    assert v({u"type": u"point", u"x": 1}) == {u"type": u"point", u"x": 1}
+    assert v({u"type": u"circle", u"r": 1}) == {u"type": u"circle", u"r": 1}
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"type": u"circle", u"x": 1})
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([exc.Step(0)]), expected=int, actual=dict),
+        exc.OptionsError(
+            context=deque([exc.Step(1), u"type"]),
+            expected=[u"point"],
+            actual=u"circle",
+        ),
+        exc.ForbiddenKeyError(context=deque([exc.Step(2), u"x"])),
+        exc.MissingKeyError(context=deque([exc.Step(2), u"r"])),
+        exc.InvalidTypeError(context=deque([exc.Step(3)]), expected=str, actual=dict),
+    ]
+
+
+def test_one_of_dispatch_calls(module):
+    # Steps, which cannot accept the value, are not called
+    point = module.Dict({u"type": module.Const(u"point"), u"x": module.Int()})
+    circle = module.Dict({u"type": module.Const(u"circle"), u"r": module.Int()})
+    p = profile(module.OneOf(module.Int(), point, circle, module.Str()))
+    p({u"type": u"circle", u"r": 1})
+    p(u"x")
+    assert [(row["path"], row["calls"]) for row in p.as_list()] == [
+        (u"", 2),
+        (u"#0", 0),
+        (u"#1", 0),
+        (u"#1.type", 0),
+        (u"#1.x", 0),
+        (u"#2", 1),
+        (u"#2.type", 1),
+        (u"#2.r", 1),
+        (u"#3", 1),
+    ]
+
+
+def test_one_of_dispatch_discriminator(module):
+    v = module.OneOf(
+        module.Dict({u"kind": module.Const(1), u"type": module.Str(options=[u"x"])}),
+        module.Dict({u"kind": module.Const(2), u"type": module.Str(options=[u"y"])}),
+        discriminator=u"type",
+    )
+    assert v.dump() == {
+        "__class__": "OneOf",
+        "steps": [step.dump() for step in v.steps],
+        "discriminator": u"type",
+    }
+    assert v.clone() == v
+    assert v({u"kind": 2, u"type": u"y"}) == {u"kind": 2, u"type": u"y"}
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"kind": 2, u"type": u"x"})
+    assert len(info.value) == 2
+
+    with pytest.raises(TypeError) as info:
+        module.OneOf(module.Int(), discriminator=1)
+    assert info.value.args == (
+        "%s.OneOf.discriminator should be of type %r" % (module.OneOf.__module__, str),
+    )
+
+
+def test_one_of_dispatch_order(module):
+    # The first succeeded step wins, as if steps are tried sequentially
+    v = module.OneOf(module.Int(min=10), module.Str(), module.Float(), module.Any())
+    assert v(10) == 10
+    assert type(v(1)) is float
+    assert v(u"x") == u"x"
+    assert v(None) is None
+
+
+def test_one_of_dispatch_fail_fast(module):
+    v = module.OneOf(module.Int(), module.Str(), fail_fast=True)
+    with pytest.raises(exc.SchemaError) as info:
+        v([])
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([exc.Step(1)]), expected=str, actual=list)
+    ]
+    with pytest.raises(exc.SchemaError) as info:
+        v(1.5)
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([exc.Step(1)]), expected=str, actual=float)
+    ]
+
+
+def test_one_of_dispatch_non_mappings(module):
+    # Discriminator is not looked up in values, which are not mappings
+    v = module.OneOf(
+        module.Dict({u"t": module.Const(u"a")}, nullable=True),
+        module.Dict({u"t": module.Const(u"b")}),
+        module.Any(),
+    )
+    assert v(None) is None
+    assert v({u"t": u"b"}) == {u"t": u"b"}
+    assert v([u"t"]) == [u"t"]
+    assert v(u"t") == u"t"
@@ -0,0 +1,140 @@
+import json
+from collections import deque
+
+import pytest
+
+from validx import exc
+from validx.profiler import profile
+
+
+def assert_same(v, value):
+    """Assert instrumented validator gives the same results as original one"""
+    p = profile(v)
+    try:
+        expected = v(value)
+    except exc.ValidationError as e:
+        with pytest.raises(e.__class__) as info:
+            p(value)
+        assert repr(info.value) == repr(e)
+    else:
+        assert p(value) == expected
+    return p
+
+
+def stats(p):
+    return [(row["path"], row["calls"], row["failures"]) for row in p.as_list()]
+
+
+def test_profile(module):
+    v = module.Dict(
+        {
+            "x": module.Int(min=0),
+            "y": module.List(module.OneOf(module.Str(maxlen=3), module.Int())),
+            "a.b": module.Tuple(module.Int(), module.AllOf(module.Int(), module.Any())),
+        },
+        extra=(module.Str(), module.Int()),
+    )
+    p = assert_same(v, {"x": 1, "y": [u"a", 1], "a.b": (1, 2), u"z": 3})
+    assert stats(p) == [
+        ("", 1, 0),
+        ("x", 1, 0),
+        ("y", 1, 0),
+        ("y.*", 2, 0),
+        ("y.*.#0", 1, 0),  # OneOf doesn't try Str step on int item
+        ("y.*.#1", 1, 0),
+        ("[a.b]", 1, 0),
+        ("[a.b].0", 1, 0),
+        ("[a.b].1", 1, 0),
+        ("[a.b].1.#0", 1, 0),
+        ("[a.b].1.#1", 1, 0),
+        ("*.@KEY", 1, 0),
+        ("*.@VALUE", 1, 0),
+    ]
+
+    p = assert_same(v, {"x": -1, "y": [u"abcd"], "a.b": (1, 2)})
+    assert stats(p)[:5] == [
+        ("", 1, 1),
+        ("x", 1, 1),
+        ("y", 1, 1),
+        ("y.*", 1, 1),
+        ("y.*.#0", 1, 1),
+    ]
+
+    p.reset()
+    assert all(row["calls"] == 0 for row in p.as_list())
+
+
+def test_profile_times(module):
+    v = module.List(module.List(module.Int()))
+    p = profile(v)
+    p.validator.validate_many([[[1, 2, 3]] * 10] * 10)
+    outer, inner, item = p.as_list()
+    assert outer["calls"] == 10
+    assert inner["calls"] == 100
+    assert item["calls"] == 300
+    assert outer["total"] >= inner["total"] >= item["total"] > 0
+    assert item["self"] == pytest.approx(item["total"])
+    assert outer["self"] == pytest.approx(outer["total"] - inner["total"])
+    assert inner["self"] == pytest.approx(inner["total"] - item["total"])
+    assert json.loads(json.dumps(p.as_list())) == p.as_list()
+
+
+def test_profile_leaves(module):
+    class Custom(module.Validator):
+        __slots__ = ("item",)
+
+        def __init__(self, item, alias=None, replace=False):
+            object.__setattr__(self, "item", item)
+
+        def __call__(self, value, __context=None):
+            return self.item(value, __context)
+
+    module.Dict({"x": module.Int(), "y": module.Int()}, alias="point")
+    v = module.Tuple(Custom(module.Int()), module.LazyRef("point"))
+    p = assert_same(v, (1, {"x": 1, "y": 2}))
+    assert stats(p) == [("", 1, 0), ("0", 1, 0), ("1", 1, 0)]
+    assert isinstance(p.validator, module.Validator)
+    assert repr(p.validator).startswith("<Probe('': <Tuple(")
+
+
+def test_profile_original(module):
+    v = module.Dict({"x": module.List(module.Int())})
+    p = profile(v)
+    assert v.schema["x"].item.__class__ is module.Int
+    assert p.validator is not v
+    assert p({"x": [1]}) == {"x": [1]}
+    with pytest.raises(exc.SchemaError) as info:
+        p({"x": [u"x"]})
+    assert info.value.errors[0].context == deque(["x", 0])
+
+
+def test_profile_equality(module):
+    # Probes are compared by original validators
+    v = module.Dict({"x": module.List(module.Int(min=0))})
+    w = module.Dict({"x": module.List(module.Int(min=1))})
+    assert profile(v).validator == profile(v.clone()).validator
+    assert hash(profile(v).validator) == hash(profile(v.clone()).validator)
+    assert profile(v).validator != profile(w).validator
+    assert profile(v).validator != v
+
+
+def test_report(module):
+    v = module.Dict({"x": module.Int(), "y": module.List(module.Int())})
+    p = profile(v)
+    p({"x": 1, "y": [1, 2, 3]})
+    lines = p.report(sort="calls").splitlines()
+    assert lines[0].split() == ["path", "calls", "failures", "total,", "s", "self,", "s"]
+    assert [line.split()[:3] for line in lines[1:]] == [
+        ["y.*", "3", "0"],
+        ["''", "1", "0"],
+        ["x", "1", "0"],
+        ["y", "1", "0"],
+    ]
+    assert len(p.report(limit=2).splitlines()) == 3
+
+    with pytest.raises(ValueError) as info:
+        p.report(sort="path")
+    assert info.value.args == (
+        "Expected sort to be one of 'calls', 'failures', 'total' or 'self', "
+        "got 'path'",
+    )
@@ -4,6 +4,7 @@ from collections import deque
 import pytest
 
 from validx import exc
+from validx.compat.colabc import Mapping
 
 
 NoneType = type(None)
@@ -216,3 +217,363 @@ def test_any(module):
     assert v([1, "x"]) == [1, "x"]
     assert v.clone() == v
     assert pickle.loads(pickle.dumps(v)) == v
+
+
+# =============================================================================
+
+
+def test_cached(module):
+    v = module.Cached(module.Dict({"x": module.List(module.Int(min=0))}))
+    assert v.maxsize == 1024
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    result = v({"x": [1]})
+    assert result == {"x": [1]}
+    result["x"].append(2)  # Cached result is not affected
+    assert v({"x": [1]}) == {"x": [1]}
+    assert v({"x": (1,)}) == {"x": [1]}  # Tuple is another key
+    assert v.cache_info() == (1, 2, 0, 1024, 2)
+
+    for _ in range(2):
+        with pytest.raises(exc.SchemaError):
+            v({"x": [-1]})
+    assert v.cache_info() == (1, 4, 0, 1024, 2)
+
+    v.cache_clear()
+    assert v.cache_info() == (0, 0, 0, 1024, 0)
+
+
+def test_cached_keys(module):
+    v = module.Cached(module.Any())
+    for value in [1, 1.0, True, u"1", (1,), [1], {1: 1}, {1}, frozenset([1])]:
+        assert v(value) == value
+        assert type(v(value)) is type(value)
+    assert v.cache_info() == (9, 9, 0, 1024, 9)
+
+    class Value(object):
+        pass
+
+    value = Value()
+    assert v(value) is value
+    assert v([value]) == [value]
+    assert v.cache_info().bypasses == 2
+
+    class Function(module.Validator):
+        __slots__ = ()
+
+        def __call__(self, value, __context=None):
+            return {u"len": len}[value]
+
+    v = module.Cached(Function())
+    assert v(u"len") is len
+    assert v(u"len") is len
+
+
+def test_cached_errors(module):
+    v = module.Cached(module.List(module.Int(min=0)), cache_errors=True)
+    for _ in range(2):
+        with pytest.raises(exc.SchemaError) as info:
+            v([1, -1])
+        # Context added by parent validators does not leak into cache
+        info.value.add_context("x")
+        assert info.value.errors == [
+            exc.MinValueError(context=deque(["x", 1]), expected=0, actual=-1)
+        ]
+    assert v.cache_info() == (1, 1, 0, 1024, 1)
+
+
+def test_cached_lru(module):
+    v = module.Cached(module.Int(), maxsize=2)
+    v(1)
+    v(2)
+    v(1)
+    v(3)  # Evicts 2
+    v(1)
+    v(2)
+    assert v.cache_info() == (2, 4, 0, 2, 2)
+
+
+def test_cached_threads(module):
+    ThreadPoolExecutor = pytest.importorskip("concurrent.futures").ThreadPoolExecutor
+
+    v = module.Cached(module.OneOf(module.Int(), module.Str()), maxsize=4)
+    values = [i % 8 for i in range(2000)] + [object() for i in range(100)]
+
+    def validate(value):
+        try:
+            return v(value)
+        except exc.ValidationError:
+            return None
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(validate, values))
+    assert results == [i % 8 for i in range(2000)] + [None] * 100
+    hits, misses, bypasses, maxsize, currsize = v.cache_info()
+    assert hits + misses == 2000
+    assert bypasses == 100
+    assert currsize == 4
+
+
+def test_cached_ttl(module, monkeypatch):
+    from validx import memo
+
+    now = [0.0]
+    monkeypatch.setattr(memo, "clock", lambda: now[0])
+    v = module.Cached(module.Int(), ttl=10)
+    v(1)
+    now[0] = 9.0
+    v(1)
+    now[0] = 10.0
+    v(1)
+    assert v.cache_info() == (1, 2, 0, 1024, 1)
+
+
+def test_cached_time(module):
+    from datetime import date, timedelta
+
+    v = module.Cached(
+        module.OneOf(
+            module.Dict({"x": module.Date(relmin=timedelta(days=-1))}),
+            module.Int(),
+        )
+    )
+    today = date.today()
+    assert v({"x": today}) == {"x": today}
+    assert v({"x": today}) == {"x": today}
+    assert v.cache_info() == (0, 0, 2, 1024, 0)
+
+
+def test_cached_contracts(module):
+    with pytest.raises(TypeError):
+        module.Cached(1)
+    with pytest.raises(TypeError):
+        module.Cached(module.Int(), maxsize=None)
+    with pytest.raises(TypeError):
+        module.Cached(module.Int(), ttl=True)
+    assert module.Cached(module.Int(), ttl=0.5).ttl == 0.5
+
+
+# =============================================================================
+
+
+def make_lazy(module, **kw):
+    return module.Lazy(
+        module.Dict(
+            {
+                u"id": module.Int(),
+                u"user": module.Dict({u"name": module.Str(), u"age": module.Int()}),
+                u"tags": module.List(module.Str()),
+                u"size": module.Int(),
+            },
+            defaults={u"size": 0},
+            optional=[u"tags"],
+            **kw
+        )
+    )
+
+
+def test_lazy(module):
+    v = make_lazy(module)
+    assert v.clone() == v
+    assert pickle.loads(pickle.dumps(v)) == v
+
+    data = {u"id": 1, u"user": {u"name": u"x", u"age": 2}, u"tags": [u"a"]}
+    result = v(data)
+    assert len(result) == 4
+    assert list(result) == [u"id", u"user", u"tags", u"size"]
+    assert u"id" in result
+    assert u"x" not in result
+    assert repr(result) == (
+        "<LazyDict({'id': ..., 'user': ..., 'tags': ..., 'size': ...})>"
+    )
+    assert result[u"id"] == 1
+    assert result[u"id"] is result[u"id"]
+    assert result[u"user"][u"name"] == u"x"
+    assert result[u"user"] is result[u"user"]
+    assert repr(result) == (
+        "<LazyDict({'id': 1, 'user': <LazyDict({'name': 'x', 'age': ...})>, "
+        "'tags': ..., 'size': ...})>"
+    )
+    assert result == dict(data, size=0)
+    assert result.resolve() == dict(data, size=0)
+    assert type(result.resolve()[u"user"]) is dict
+    assert result.get(u"x") is None
+
+    with pytest.raises(TypeError):
+        result[u"id"] = 2
+
+    assert module.Lazy(module.Dict(nullable=True))(None) is None
+
+    with pytest.raises(TypeError) as info:
+        module.Lazy(module.Int())
+    assert info.value.args == (
+        "%s.Lazy.validator should be of type %r"
+        % (module.Lazy.__module__, module.Dict),
+    )
+
+
+def test_lazy_context(module):
+    class MarkContext(module.Validator):
+        def __call__(self, value, __context=None):
+            __context["marked"] = True
+            return value
+
+    v = module.Lazy(module.Dict({u"x": MarkContext()}))
+    context = {}
+    result = v({u"x": 1}, context)
+    assert not context
+    assert result[u"x"] == 1
+    assert context["marked"]
+
+
+def test_lazy_errors(module):
+    v = make_lazy(module)
+    result = v({u"id": u"1", u"user": {u"name": u"x", u"age": u"2"}, u"size": None})
+    assert result[u"user"][u"name"] == u"x"
+
+    with pytest.raises(exc.SchemaError) as info:
+        result[u"id"]
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([u"id"]), expected=int, actual=str)
+    ]
+
+    with pytest.raises(exc.SchemaError) as info:
+        result[u"user"][u"age"]
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([u"user", u"age"]), expected=int, actual=str)
+    ]
+
+    # Errors are not memoized
+    with pytest.raises(exc.SchemaError):
+        result[u"id"]
+
+    with pytest.raises(exc.SchemaError) as info:
+        result.resolve()
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([u"id"]), expected=int, actual=str),
+        exc.InvalidTypeError(
+            context=deque([u"user", u"age"]), expected=int, actual=str
+        ),
+        exc.InvalidTypeError(context=deque([u"size"]), expected=int, actual=NoneType),
+    ]
+
+    with pytest.raises(KeyError):
+        result[u"x"]
+
+
+def test_lazy_nested_errors(module):
+    v = make_lazy(module)
+    result = v({u"id": 1, u"user": {u"name": u"x"}})
+
+    with pytest.raises(exc.SchemaError) as info:
+        result[u"user"]
+    assert info.value.errors == [
+        exc.MissingKeyError(context=deque([u"user", u"age"])),
+    ]
+
+    v = module.Lazy(module.Dict({u"x": module.Lazy(module.Dict({u"y": module.Int()}))}))
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"x": {u"y": None}})[u"x"][u"y"]
+    assert info.value.errors == [
+        exc.InvalidTypeError(context=deque([u"x", u"y"]), expected=int, actual=NoneType)
+    ]
+
+
+def test_lazy_shape(module):
+    v = make_lazy(module)
+
+    with pytest.raises(exc.InvalidTypeError) as info:
+        v([])
+    assert info.value.expected == Mapping
+    assert info.value.actual == list
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"id": None, u"x": 1})
+    assert info.value.errors == [
+        exc.ForbiddenKeyError(context=deque([u"x"])),
+        exc.MissingKeyError(context=deque([u"user"])),
+    ]
+
+    with pytest.raises(exc.SchemaError) as info:
+        make_lazy(module, fail_fast=True)({u"id": None, u"x": 1})
+    assert info.value.errors == [exc.ForbiddenKeyError(context=deque([u"x"]))]
+
+    with pytest.raises(exc.SchemaError) as info:
+        make_lazy(module, fail_fast=True)({u"id": None})
+    assert info.value.errors == [exc.MissingKeyError(context=deque([u"user"]))]
+
+    with pytest.raises(exc.MinLengthError):
+        module.Lazy(module.Dict(extra=(module.Str(), module.Int()), minlen=1))({})
+    with pytest.raises(exc.MaxLengthError):
+        module.Lazy(module.Dict(extra=(module.Str(), module.Int()), maxlen=1))(
+            {u"x": 1, u"y": 2}
+        )
+
+
+def test_lazy_extra(module):
+    v = module.Lazy(
+        module.Dict(
+            extra=(module.Str(maxlen=1), module.Int()),
+            dispose=[u"z"],
+            multikeys=[u"x"],
+        )
+    )
+    result = v({u"x": 1, u"y": u"2", u"z": None})
+    assert list(result) == [u"x", u"y"]
+    assert result[u"x"] == 1
+
+    with pytest.raises(exc.SchemaError) as info:
+        result[u"y"]
+    assert info.value.errors == [
+        exc.InvalidTypeError(
+            context=deque([u"y", exc.EXTRA_VALUE]), expected=int, actual=str
+        )
+    ]
+
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"xx": 1})
+    assert info.value.errors == [
+        exc.MaxLengthError(context=deque([u"xx", exc.EXTRA_KEY]), expected=1, actual=2)
+    ]
+
+    v = module.Lazy(
+        module.Dict(extra=(module.Str(maxlen=1), module.Int()), fail_fast=True)
+    )
+    with pytest.raises(exc.SchemaError) as info:
+        v({u"xx": 1, u"yy": 1})
+    assert len(info.value) == 1
+
+
+def test_lazy_extra_nested(module):
+    # Errors of nested dicts have the same context, as errors of eager ``Dict``
+    nested = module.Dict({u"x": module.Int(), u"y": module.Dict({u"z": module.Int()})})
+    v = module.Dict(extra=(module.Str(), nested))
+    value = {u"k": {u"x": u"a", u"y": {u"z": u"b"}}}
+    with pytest.raises(exc.SchemaError) as info:
+        v(value)
+    expected = [error.context for error in info.value]
+    assert expected == [
+        deque([u"k", exc.EXTRA_VALUE, u"x"]),
+        deque([u"k", exc.EXTRA_VALUE, u"y", u"z"]),
+    ]
+
+    result = module.Lazy(v)(value)
+    with pytest.raises(exc.SchemaError) as info:
+        result[u"k"][u"x"]
+    assert [error.context for error in info.value] == expected[:1]
+    with pytest.raises(exc.SchemaError) as info:
+        result[u"k"][u"y"][u"z"]
+    assert [error.context for error in info.value] == expected[1:]
+    with pytest.raises(exc.SchemaError) as info:
+        result.resolve()
+    assert [error.context for error in info.value] == expected
+
+
+def test_lazy_multikeys(module):
+    class MultiDict(dict):
+        def getall(self, key):
+            return [self[key]]
+
+    v = module.Lazy(module.Dict({u"x": module.List(module.Int())}, multikeys=[u"x"]))
+    assert v(MultiDict(x=1))[u"x"] == [1]
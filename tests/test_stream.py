@@ -0,0 +1,164 @@
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from validx import exc, stream
+
+
+@pytest.fixture(params=["process", "thread"])
+def backend(request):
+    return request.param
+
+
+def schema(module):
+    return module.Dict({u"id": module.Int(min=0), u"tags": module.List(module.Str())})
+
+
+def records(count):
+    for i in range(count):
+        if i % 7 == 3:
+            yield {u"id": -i, u"tags": [i]}
+        else:
+            yield {u"id": i, u"tags": [u"tag %d" % i]}
+
+
+def lines(count):
+    return b"".join(json.dumps(record).encode() + b"\n" for record in records(count))
+
+
+def expected(v, count):
+    # Results of validation of the same records one by one
+    valid = []
+    invalid = []
+    for number, record in enumerate(records(count), 1):
+        try:
+            valid.append(v(record))
+        except exc.ValidationError as e:
+            for error in e:
+                invalid.append(
+                    {
+                        "line": number,
+                        "context": error.format_context(),
+                        "error": error.format_error(),
+                    }
+                )
+    return valid, invalid
+
+
+def validate(v, source, **kw):
+    valid = []
+    invalid = []
+    counts = stream.validate_lines(
+        v, source, valid=valid.append, invalid=invalid.append, **kw
+    )
+    assert counts == (len(valid), len(set(item["line"] for item in invalid)))
+    return valid, invalid
+
+
+def test_validate_lines(module, backend):
+    v = schema(module)
+    for count in (0, 1, 30):
+        source = io.BytesIO(lines(count))
+        result = validate(v, source, workers=2, backend=backend, chunksize=4)
+        assert result == expected(v, count)
+
+
+def test_calling_thread(module):
+    v = schema(module)
+    for chunksize in (1, 3, 100):
+        source = io.BytesIO(lines(20))
+        result = validate(v, source, workers=0, chunksize=chunksize)
+        assert result == expected(v, 20)
+
+
+def test_default_workers(module):
+    v = schema(module)
+    result = validate(v, io.BytesIO(lines(10)), backend="thread")
+    assert result == expected(v, 10)
+
+
+def test_files(module, tmpdir):
+    v = schema(module)
+    path = tmpdir.join("records.jsonl")
+    path.write_binary(lines(20))
+    for mmap in (False, True):
+        result = validate(v, str(path), workers=0, mmap=mmap)
+        assert result == expected(v, 20)
+
+
+def test_blank_and_malformed_lines(module):
+    v = schema(module)
+    source = io.BytesIO(
+        b'\n  \r\n{"id": 1, "tags": []}\r\n{"id": 2, "tags": [}\n'
+        b'{"id": 3, "tags": []} {}\n\xff\n{"id": 4, "tags": []}'
+    )
+    valid, invalid = validate(v, source, workers=0)
+    assert valid == [{u"id": 1, u"tags": []}, {u"id": 4, u"tags": []}]
+    assert [(item["line"], item["context"]) for item in invalid] == [
+        (4, u""),
+        (5, u""),
+        (6, u""),
+    ]
+    assert invalid[0]["error"].startswith("Expecting value")
+    assert invalid[1]["error"].startswith("Extra data")
+    assert "can't decode" in invalid[2]["error"]
+
+
+def test_sinks(module):
+    v = schema(module)
+    assert stream.validate_lines(v, io.BytesIO(lines(10)), workers=0) == (9, 1)
+
+    output = io.StringIO()
+    stream.validate_lines(
+        v, io.BytesIO(lines(10)), valid=stream.writer(output), workers=0
+    )
+    assert output.getvalue() == u"".join(
+        json.dumps(record) + u"\n" for record in expected(v, 10)[0]
+    )
+
+
+def test_sink_error(module, backend):
+    v = schema(module)
+
+    def sink(record):
+        raise RuntimeError("Sink failed")
+
+    with pytest.raises(RuntimeError):
+        stream.validate_lines(
+            v, io.BytesIO(lines(100)), sink, workers=1, backend=backend, chunksize=1
+        )
+
+
+def test_memory(module):
+    v = schema(module)
+
+    def peak(count):
+        data = lines(count)
+        tracemalloc.start()
+        try:
+            stream.validate_lines(
+                v, io.BytesIO(data), workers=2, backend="thread", chunksize=100
+            )
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    assert peak(40000) < peak(5000) * 1.5
+
+
+def test_invalid_params(module):
+    v = schema(module)
+    source = io.BytesIO(b"")
+    with pytest.raises(ValueError) as info:
+        stream.validate_lines(v, source, backend="fiber")
+    assert str(info.value) == (
+        "Expected backend to be one of 'process' or 'thread', got 'fiber'"
+    )
+    with pytest.raises(ValueError) as info:
+        stream.validate_lines(v, source, workers=-1)
+    assert str(info.value) == "Expected workers to be non-negative, got -1"
+    with pytest.raises(ValueError) as info:
+        stream.validate_lines(v, source, chunksize=0)
+    assert str(info.value) == "Expected chunksize to be positive, got 0"
@@ -21,6 +21,8 @@ try:
         Type,
         Const,
         Any,
+        Cached,
+        Lazy,
         classes,
         instances,
     )
@@ -45,6 +47,8 @@ except ImportError:  # pragma: no cover
         Type,
         Const,
         Any,
+        Cached,
+        Lazy,
         classes,
         instances,
     )
@@ -70,6 +74,8 @@ __all__ = [
     "Type",
     "Const",
     "Any",
+    "Cached",
+    "Lazy",
     "classes",
     "instances",
 ]
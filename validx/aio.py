@@ -0,0 +1,359 @@
+"""
+Asynchronous Validation
+
+Method ``avalidate()`` of validators walks the tree of validators
+in a coroutine, so that validation of large payloads
+does not block event loop:
+
+*   items of :class:`validx.py.List` and :class:`validx.py.Tuple`,
+    and keys of :class:`validx.py.Dict` validators
+    are counted during the walk,
+    and control is yielded to event loop each ``budget`` items;
+*   custom validators can implement coroutine method
+    ``__acall__(value, __context=None)``,
+    which is awaited instead of calling the validator,
+    e.g. to look a value up in a database;
+*   items of lists are validated concurrently,
+    if their validator has asynchronous steps,
+    and ``concurrency`` limit is greater than one.
+
+Nested containers are walked as well,
+so that their items are counted at any level of nesting,
+:class:`validx.py.Cached` validator of a container is walked
+without its cache.
+Other nested validators without asynchronous steps
+are called as usual, as a single item.
+So are lazy references and :class:`validx.py.Lazy` validator,
+i.e. asynchronous steps behind :class:`validx.py.LazyRef` are not awaited,
+and values of lazy dicts are validated on access.
+
+..  testsetup:: aio
+
+    import asyncio
+    from validx import Validator, List, AllOf, Int
+    from validx.exc import OptionsError
+
+..  doctest:: aio
+
+    >>> class Exists(Validator):
+    ...     __slots__ = ()
+    ...
+    ...     def __call__(self, value, __context=None):
+    ...         raise NotImplementedError("Use avalidate() instead")
+    ...
+    ...     async def __acall__(self, value, __context=None):
+    ...         await asyncio.sleep(0)  # Lookup the value in a database
+    ...         if value % 2:
+    ...             raise OptionsError(expected="even", actual=value)
+    ...         return value
+
+    >>> v = List(AllOf(Int(min=0), Exists()))
+    >>> asyncio.run(v.avalidate([2, 4, 6], concurrency=10))
+    [2, 4, 6]
+    >>> asyncio.run(v.avalidate([2, 3, 4]))
+    Traceback (most recent call last):
+        ...
+    validx.exc.SchemaError: <SchemaError(errors=[
+        <1.1: OptionsError(expected='even', actual=3)>
+    ])>
+
+"""
+
+import asyncio
+
+from . import arrays
+from . import exc
+from .compat.colabc import Sequence, Mapping
+from .compat.types import chars
+from .compiler import _kind
+from .memo import _validators
+
+__all__ = ["validate"]
+
+
+# Validators, which items are counted by the walker
+_CONTAINERS = ("List", "Tuple", "Dict")
+
+
+async def validate(validator, value, budget=1000, concurrency=1):
+    """
+    Validate value asynchronously
+
+    :param Validator validator:
+        validator to apply.
+
+    :param value:
+        value to validate.
+
+    :param int budget:
+        number of items to validate between yields to event loop.
+
+    :param int concurrency:
+        maximum number of list items validated concurrently,
+        if item validator has asynchronous steps.
+
+    :returns:
+        validated value.
+
+    """
+    if budget < 1:
+        raise ValueError("Expected budget to be positive, got %r" % (budget,))
+    if concurrency < 1:
+        raise ValueError("Expected concurrency to be positive, got %r" % (concurrency,))
+    return await _Walker(budget, concurrency).call(validator, value, {})
+
+
+class _Walker(object):
+    def __init__(self, budget, concurrency):
+        self.budget = budget
+        self.concurrency = concurrency
+        self.count = 0
+        self.cache = {}
+
+    def tick(self):
+        # Returns ``True``, when it's time to yield to event loop
+        self.count += 1
+        if self.count < self.budget:
+            return False
+        self.count = 0
+        return True
+
+    def is_async(self, validator):
+        # Whether the validator or any of its nested ones has ``__acall__``
+        key = id(validator)
+        result = self.cache.get(key)
+        if result is None:
+            result = hasattr(validator, "__acall__") or any(
+                self.is_async(item)
+                for name, value in validator.params()
+                for item in _validators(value)
+            )
+            self.cache[key] = result
+        return result
+
+    def is_container(self, validator):
+        # Whether the validator is walked item by item
+        kind = _kind(validator)
+        if kind == "Cached":
+            return self.is_container(validator.validator)
+        return kind in _CONTAINERS
+
+    async def call(self, validator, value, context):
+        kind = _kind(validator)
+        if kind == "List":
+            return await self.walk_list(validator, value, context)
+        if kind == "Tuple":
+            return await self.walk_tuple(validator, value, context)
+        if kind == "Dict":
+            return await self.walk_dict(validator, value, context)
+        if kind == "Cached" and (
+            self.is_async(validator) or self.is_container(validator)
+        ):
+            return await self.call(validator.validator, value, context)
+        if kind == "AllOf" and self.is_async(validator):
+            return await self.walk_all_of(validator, value, context)
+        if kind == "OneOf" and self.is_async(validator):
+            return await self.walk_one_of(validator, value, context)
+        acall = getattr(validator, "__acall__", None)
+        if acall is not None:
+            return await acall(value, context)
+        return validator(value, context)
+
+    async def item(self, validator, value, context):
+        # Nested scalar validators without asynchronous steps
+        # are called as usual
+        if self.tick():
+            await asyncio.sleep(0)
+        if self.is_async(validator) or self.is_container(validator):
+            return await self.call(validator, value, context)
+        return validator(value, context)
+
+    async def walk_list(self, validator, value, context):
+        if value is None and validator.nullable:
+            return value
+        if not isinstance(value, (list, tuple)):
+            if arrays.is_array(value):
+                if not self.is_async(validator):
+                    return validator(value, context)
+            elif not isinstance(value, Sequence) or isinstance(value, chars):
+                raise exc.InvalidTypeError(expected=Sequence, actual=type(value))
+
+        if self.concurrency > 1 and self.is_async(validator.item):
+            outcomes = await self.gather(validator, value, context)
+        else:
+            outcomes = []
+            for num, val in enumerate(value):
+                try:
+                    val = await self.item(validator.item, val, context)
+                except exc.ValidationError as e:
+                    outcomes.append((None, e.add_context(num)))
+                    if validator.fail_fast:
+                        break
+                    continue
+                outcomes.append((val, None))
+
+        result = []
+        errors = []
+        if validator.unique:
+            unique = set()
+        for val, error in outcomes:
+            if error is not None:
+                errors.extend(error)
+                if validator.fail_fast:
+                    break
+                continue
+            if validator.unique:
+                if val in unique:
+                    continue
+                unique.add(val)
+            result.append(val)
+
+        if errors:
+            raise exc.SchemaError(errors)
+
+        length = len(result)
+        if validator.minlen is not None and length < validator.minlen:
+            raise exc.MinLengthError(expected=validator.minlen, actual=length)
+        if validator.maxlen is not None and length > validator.maxlen:
+            raise exc.MaxLengthError(expected=validator.maxlen, actual=length)
+
+        return result
+
+    async def gather(self, validator, value, context):
+        # Returns ``(result, error)`` pair for each item
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(num, val):
+            async with semaphore:
+                try:
+                    return await self.call(validator.item, val, context), None
+                except exc.ValidationError as e:
+                    return None, e.add_context(num)
+
+        return await asyncio.gather(*[run(num, val) for num, val in enumerate(value)])
+
+    async def walk_tuple(self, validator, value, context):
+        if value is None and validator.nullable:
+            return value
+        if not isinstance(value, (list, tuple)):
+            if not isinstance(value, Sequence) or isinstance(value, chars):
+                raise exc.InvalidTypeError(expected=Sequence, actual=type(value))
+        if len(validator.items) != len(value):
+            raise exc.TupleLengthError(expected=len(validator.items), actual=len(value))
+
+        result = []
+        errors = []
+
+        for num, val in enumerate(value):
+            try:
+                val = await self.item(validator.items[num], val, context)
+            except exc.ValidationError as e:
+                errors.extend(e.add_context(num))
+                if validator.fail_fast:
+                    break
+                continue
+            result.append(val)
+
+        if errors:
+            raise exc.SchemaError(errors)
+        return tuple(result)
+
+    async def walk_dict(self, validator, value, context):
+        if value is None and validator.nullable:
+            return value
+        if not isinstance(value, (dict, Mapping)):
+            raise exc.InvalidTypeError(expected=Mapping, actual=type(value))
+
+        schema = validator.schema
+        extra = validator.extra
+        dispose = validator.dispose
+        multikeys = validator.multikeys
+        fail_fast = validator.fail_fast
+
+        result = {}
+        errors = []
+        getall = None
+        if multikeys is not None:
+            # See ``Dict.__call__`` for supported multidict interfaces
+            getall = getattr(value, "getall", None) or getattr(value, "getlist", None)
+
+        for key, val in value.items():
+            if dispose is not None and key in dispose:
+                continue
+            if getall is not None and key in multikeys:
+                val = getall(key)
+            if schema is not None and key in schema:
+                try:
+                    val = await self.item(schema[key], val, context)
+                except exc.ValidationError as e:
+                    errors.extend(e.add_context(key))
+                    if fail_fast:
+                        break
+            elif extra is not None:
+                try:
+                    key = await self.item(extra[0], key, context)
+                except exc.ValidationError as e:
+                    errors.extend(e.add_context(exc.EXTRA_KEY).add_context(key))
+                    if fail_fast:
+                        break
+                try:
+                    val = await self.item(extra[1], val, context)
+                except exc.ValidationError as e:
+                    errors.extend(e.add_context(exc.EXTRA_VALUE).add_context(key))
+                    if fail_fast:
+                        break
+            else:
+                errors.append(exc.ForbiddenKeyError(key))
+                if fail_fast:
+                    break
+            result[key] = val
+
+        if not (errors and fail_fast):
+            # Factories of default values are built on ``Dict`` initialization
+            for key, item, default in validator._missing:
+                if key in result:
+                    continue
+                if default is None:
+                    errors.append(exc.MissingKeyError(key))
+                    if fail_fast:
+                        break
+                    continue
+                try:
+                    result[key] = await self.item(item, default(), context)
+                except exc.ValidationError as e:
+                    errors.extend(e.add_context(key))
+                    if fail_fast:
+                        break
+
+        if errors:
+            raise exc.SchemaError(errors)
+
+        length = len(result)
+        if validator.minlen is not None and length < validator.minlen:
+            raise exc.MinLengthError(expected=validator.minlen, actual=length)
+        if validator.maxlen is not None and length > validator.maxlen:
+            raise exc.MaxLengthError(expected=validator.maxlen, actual=length)
+
+        return result
+
+    async def walk_all_of(self, validator, value, context):
+        for num, step in enumerate(validator.steps):
+            try:
+                value = await self.call(step, value, context)
+            except exc.ValidationError as e:
+                raise e.add_context(exc.Step(num))
+        return value
+
+    async def walk_one_of(self, validator, value, context):
+        errors = []
+        for num, step in enumerate(validator.steps):
+            try:
+                return await self.call(step, value, context)
+            except exc.ValidationError as e:
+                if validator.fail_fast:
+                    errors = list(e.add_context(exc.Step(num)))
+                else:
+                    errors.extend(e.add_context(exc.Step(num)))
+        if errors:
+            raise exc.SchemaError(errors)
+
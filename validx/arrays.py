@@ -0,0 +1,234 @@
+"""
+Numeric Arrays
+
+Validators :class:`validx.py.Int` and :class:`validx.py.Float`
+validate numeric arrays in one pass,
+when NumPy_ is installed.
+It includes NumPy arrays, ``array.array`` objects,
+and ``memoryview`` objects of integers or floats.
+The arrays are accepted by ``validate_many()`` method of the validators,
+and by :class:`validx.py.List` validator wrapping them.
+
+Results and errors are the same as of element by element validation,
+i.e. index of invalid element is used as the first node of error context.
+Elements of the arrays are converted to built-in ``int`` and ``float``
+values.
+
+NumPy is an optional dependency.
+If it is not installed,
+``array.array`` and ``memoryview`` objects are validated element by element,
+and NumPy arrays are not accepted by ``List`` validator.
+
+.. _NumPy: https://numpy.org/
+
+"""
+
+from array import array as _array
+
+from . import exc
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+
+__all__ = ["numeric", "is_array", "validate_int", "validate_float"]
+
+
+def is_array(value):
+    """
+    Check, whether the value is an array, that can be validated in one pass
+
+    :returns:
+        ``True`` if the value is a NumPy array,
+        ``array.array`` or ``memoryview`` object,
+        and NumPy is installed.
+
+    """
+    if numpy is None:  # pragma: no cover
+        return False
+    return isinstance(value, (numpy.ndarray, _array, memoryview))
+
+
+def numeric(value):
+    """
+    Get one-dimensional NumPy array of numbers
+
+    :returns:
+        NumPy array sharing memory with the value,
+        or ``None``, if the value is not an array of integers or floats,
+        or NumPy is not installed.
+
+    """
+    if not is_array(value):
+        return None
+    try:
+        result = numpy.asarray(value)
+    except (TypeError, ValueError):  # pragma: no cover
+        return None
+    if result.ndim != 1 or result.dtype.kind not in "iuf":
+        return None
+    return result
+
+
+def validate_int(validator, values, errors):
+    """
+    Validate array of integer numbers
+
+    :param Int validator:
+        validator to get constraints from.
+
+    :param values:
+        values to validate.
+
+    :param str errors:
+        errors handling mode, see :meth:`validx.py.Validator.validate_many`.
+
+    :returns:
+        tuple ``(results, errors)``,
+        or ``None`` if the values cannot be validated in one pass.
+
+    """
+    values = numeric(values)
+    if values is None or errors not in _modes:
+        return None
+    checks = []
+    if values.dtype.kind == "f":
+        if validator.coerce:
+            # Coercion truncates floats, leave it to scalar validator
+            return None
+        integer = numpy.isfinite(values)
+        integer[integer] = numpy.floor(values[integer]) == values[integer]
+        checks.append(
+            (~integer, lambda value: exc.InvalidTypeError(expected=int, actual=float))
+        )
+    if validator.min is not None:
+        checks.append(
+            (
+                values < validator.min,
+                lambda value: exc.MinValueError(
+                    expected=validator.min, actual=int(value)
+                ),
+            )
+        )
+    if validator.max is not None:
+        checks.append(
+            (
+                values > validator.max,
+                lambda value: exc.MaxValueError(
+                    expected=validator.max, actual=int(value)
+                ),
+            )
+        )
+    if validator.options is not None:
+        checks.append(
+            (
+                ~numpy.isin(values, list(validator.options)),
+                lambda value: exc.OptionsError(
+                    expected=validator.options, actual=int(value)
+                ),
+            )
+        )
+    return _validate(values, checks, None, int, errors)
+
+
+def validate_float(validator, values, errors):
+    """
+    Validate array of float numbers
+
+    :param Float validator:
+        validator to get constraints from.
+
+    :param values:
+        values to validate.
+
+    :param str errors:
+        errors handling mode, see :meth:`validx.py.Validator.validate_many`.
+
+    :returns:
+        tuple ``(results, errors)``,
+        or ``None`` if the values cannot be validated in one pass.
+
+    """
+    values = numeric(values)
+    if values is None or errors not in _modes:
+        return None
+    checks = []
+    skip = None
+    if values.dtype.kind == "f":
+        nan = numpy.isnan(values)
+        if validator.nan:
+            # It doesn't make sence to future checks if value is ``Nan``
+            skip = nan
+        else:
+            checks.append(
+                (
+                    nan,
+                    lambda value: exc.FloatValueError(
+                        expected="number", actual=float(value)
+                    ),
+                )
+            )
+        if not validator.inf:
+            checks.append(
+                (
+                    numpy.isinf(values),
+                    lambda value: exc.FloatValueError(
+                        expected="finite", actual=float(value)
+                    ),
+                )
+            )
+    if validator.min is not None:
+        checks.append(
+            (
+                values < validator.min,
+                lambda value: exc.MinValueError(
+                    expected=validator.min, actual=float(value)
+                ),
+            )
+        )
+    if validator.max is not None:
+        checks.append(
+            (
+                values > validator.max,
+                lambda value: exc.MaxValueError(
+                    expected=validator.max, actual=float(value)
+                ),
+            )
+        )
+    return _validate(values, checks, skip, float, errors)
+
+
+_modes = ("collect", "raise", "skip")
+
+
+def _validate(values, checks, skip, convert, errors):
+    invalid = numpy.zeros(len(values), dtype=bool)
+    failures = []
+    for failed, error in checks:
+        failed &= ~invalid
+        if skip is not None:
+            failed &= ~skip
+        for num in numpy.flatnonzero(failed).tolist():
+            failures.append((num, error(values[num].item())))
+        invalid |= failed
+    failures.sort(key=lambda failure: failure[0])
+
+    if failures and errors == "raise":
+        num, error = failures[0]
+        raise exc.SchemaError(list(error.add_context(num)))
+
+    valid = values[~invalid] if failures else values
+    if convert is float:
+        results = valid.astype(float).tolist()
+    elif valid.dtype.kind == "f":
+        results = [int(value) for value in valid.tolist()]
+    else:
+        results = valid.tolist()
+
+    if errors == "collect":
+        errors = [error.add_context(num) for num, error in failures]
+    else:
+        errors = []
+    return results, errors
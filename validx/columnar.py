@@ -0,0 +1,182 @@
+"""
+Columnar Validation
+
+Method ``validate_columns()`` of :class:`validx.py.Dict` validator
+validates data stored as columns,
+i.e. a mapping of keys to sequences of values,
+where items of the sequences with the same index make up a row.
+
+Structure of the columns is checked once for the whole batch:
+unknown, disposed, missing and defaulted keys are handled per column,
+instead of per row.
+Then each column is validated by :meth:`validx.py.Validator.validate_many`
+of the corresponding validator,
+so numeric arrays are validated in one pass, see :mod:`validx.arrays`.
+
+Results and errors are the same as of
+:meth:`validx.py.Validator.validate_many` applied to the rows,
+i.e. row index is used as the first node of error context,
+and invalid rows are excluded from all the columns.
+
+"""
+
+from . import defaults
+from . import exc
+from .compat.colabc import Mapping, Sequence
+from .compat.types import chars
+
+__all__ = ["validate"]
+
+
+_modes = ("collect", "raise", "skip")
+
+
+def validate(validator, columns, errors):
+    """
+    Validate columns against schema of dict validator
+
+    :param Dict validator:
+        validator to get schema from.
+
+    :param Mapping columns:
+        columns to validate.
+
+    :param str errors:
+        errors handling mode, see :meth:`validx.py.Validator.validate_many`.
+
+    :returns:
+        tuple ``(results, errors)``,
+        where ``results`` is a dict of validated columns.
+
+    """
+    if errors not in _modes:
+        raise ValueError(
+            "Expected errors to be one of 'collect', 'raise' or 'skip', got %r"
+            % (errors,)
+        )
+    if not isinstance(columns, (dict, Mapping)):
+        raise exc.InvalidTypeError(expected=Mapping, actual=type(columns))
+
+    prepared, rows = _prepare(validator, columns)
+
+    results = {}
+    failed = {}
+    failures = []
+    for key, nodes, item, column in prepared:
+        results[key], column_errors = item.validate_many(column, "collect")
+        if not column_errors:
+            continue
+        failed[key] = set()
+        for error in column_errors:
+            # Put column nodes right after row index,
+            # as if the error was raised by validator of a row
+            context = error.context
+            row = context.popleft()
+            context.extendleft(reversed(nodes))
+            context.appendleft(row)
+            failed[key].add(row)
+        failures.extend(column_errors)
+
+    if not failures:
+        return results, []
+
+    failures.sort(key=_row)  # Stable, so errors of each row keep column order
+    if validator.fail_fast:
+        failures = [
+            error
+            for num, error in enumerate(failures)
+            if num == 0 or _row(failures[num - 1]) != _row(error)
+        ]
+    if errors == "raise":
+        row = _row(failures[0])
+        raise exc.SchemaError([error for error in failures if _row(error) == row])
+
+    invalid = set(_row(error) for error in failures)
+    for key, values in results.items():
+        own = failed.get(key, ())
+        valid = (row for row in range(rows) if row not in own)
+        results[key] = [
+            value for row, value in zip(valid, values) if row not in invalid
+        ]
+    return results, failures if errors == "collect" else []
+
+
+def _row(error):
+    return error.context[0]
+
+
+def _prepare(validator, columns):
+    # Returns list of ``(key, nodes, validator, column)`` and number of rows,
+    # where ``nodes`` are inserted into error context after row index.
+    # Errors of the whole columns are raised at once.
+    prepared = []
+    errors = []
+    rows = None
+    for key, column in columns.items():
+        if validator.dispose is not None and key in validator.dispose:
+            continue
+        if validator.schema is not None and key in validator.schema:
+            nodes = (key,)
+            item = validator.schema[key]
+        elif validator.extra is not None:
+            try:
+                key = validator.extra[0](key)
+            except exc.ValidationError as e:
+                errors.extend(e.add_context(exc.EXTRA_KEY).add_context(key))
+                if validator.fail_fast:
+                    break
+                continue
+            nodes = (key, exc.EXTRA_VALUE)
+            item = validator.extra[1]
+        else:
+            errors.append(exc.ForbiddenKeyError(key))
+            if validator.fail_fast:
+                break
+            continue
+
+        if isinstance(column, chars) or not hasattr(column, "__len__"):
+            errors.append(
+                exc.InvalidTypeError(
+                    expected=Sequence, actual=type(column)
+                ).add_context(key)
+            )
+        elif rows is None:
+            # Number of rows is defined by the first column
+            rows = len(column)
+        elif len(column) < rows:
+            errors.append(
+                exc.MinLengthError(expected=rows, actual=len(column)).add_context(key)
+            )
+        elif len(column) > rows:
+            errors.append(
+                exc.MaxLengthError(expected=rows, actual=len(column)).add_context(key)
+            )
+        if errors and validator.fail_fast:
+            break
+        prepared.append((key, nodes, item, column))
+
+    rows = rows or 0
+    if validator.schema is not None and not (errors and validator.fail_fast):
+        present = set(key for key, nodes, item, column in prepared)
+        for key, item in validator.schema.items():
+            if key in present:
+                continue
+            if validator.defaults is not None and key in validator.defaults:
+                default = defaults.factory(validator.defaults[key])
+                column = [default() for _ in range(rows)]
+                prepared.append((key, (key,), item, column))
+            elif validator.optional is None or key not in validator.optional:
+                errors.append(exc.MissingKeyError(key))
+                if validator.fail_fast:
+                    break
+
+    if errors:
+        raise exc.SchemaError(errors)
+
+    length = len(prepared)
+    if validator.minlen is not None and length < validator.minlen:
+        raise exc.MinLengthError(expected=validator.minlen, actual=length)
+    if validator.maxlen is not None and length > validator.maxlen:
+        raise exc.MaxLengthError(expected=validator.maxlen, actual=length)
+
+    return prepared, rows
@@ -28,3 +28,6 @@ class frozendict(Mapping):
 
     def values(self):
         return self.__data.values()
+
+    def __hash__(self):
+        return hash(frozenset(self.__data.items()))
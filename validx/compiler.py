@@ -0,0 +1,759 @@
+"""
+Schema Compiler
+
+The compiler walks a tree of validators once
+and generates source code of a single specialized function,
+that is equivalent to the tree.
+Checks for unset parameters are not generated at all,
+and nested validators are inlined into their parents.
+
+Validators, which cannot be inlined
+(custom validators, ``LazyRef``, date and time validators),
+are called as usual from the generated code.
+
+"""
+
+import linecache
+import math
+from contextlib import contextmanager
+from itertools import count
+
+from . import exc
+from . import patterns
+from .compat.colabc import Sequence, Mapping
+from .compat.types import chars, string
+from .defaults import factory, immutable
+
+__all__ = ["compile"]
+
+
+# Python allows up to 20 statically nested blocks (loops and ``try``) per
+# function and up to 100 levels of indentation.  When inlined code goes deeper
+# than the following limits, the nested validator is compiled into a separate
+# function.
+MAX_BLOCKS = 12
+MAX_LEVEL = 40
+
+_filenames = count()
+_builtin_compile = compile
+
+
+def compile(validator):
+    """
+    Compile validator into specialized function
+
+    :param Validator validator:
+        validator to compile.
+
+    :returns:
+        function ``(value, __context=None)``,
+        that returns the same results and raises the same errors,
+        as the passed validator.
+
+    The generated source code is available
+    via ``__source__`` attribute of the result function.
+
+    """
+    return _Compiler().compile(validator)
+
+
+def _kinds():
+    """Map built-in validator classes to their names"""
+    from . import py
+
+    modules = [py]
+    try:
+        from . import cy
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        modules.append(cy)
+
+    result = {}
+    for module in modules:
+        for name in module.__all__:
+            obj = getattr(module, name)
+            if isinstance(obj, type) and issubclass(obj, module.Validator):
+                result[obj] = name
+    return result
+
+
+_kinds_cache = []  # type: list
+
+
+def _kind(validator):
+    if not _kinds_cache:
+        _kinds_cache.append(_kinds())
+    return _kinds_cache[0].get(type(validator))
+
+
+class _Writer(object):
+    def __init__(self):
+        self.lines = []
+        self.level = 0
+        self.blocks = 0
+
+    def __call__(self, line):
+        self.lines.append("    " * self.level + line)
+
+    @contextmanager
+    def indent(self, block=False):
+        self.level += 1
+        self.blocks += block
+        try:
+            yield
+        finally:
+            self.level -= 1
+            self.blocks -= block
+
+    def too_deep(self):
+        return self.blocks >= MAX_BLOCKS or self.level >= MAX_LEVEL
+
+
+class _Compiler(object):
+
+    # Parameters, that are supported by the corresponding emitter.
+    # Validators with any other parameter set are called as is.
+    supported = {
+        "Int": {"nullable", "coerce", "min", "max", "options"},
+        "Float": {"nullable", "coerce", "nan", "inf", "min", "max"},
+        "Str": {"nullable", "encoding", "minlen", "maxlen", "pattern", "options"},
+        "Bytes": {"nullable", "minlen", "maxlen"},
+        "Bool": {"nullable", "coerce_str", "coerce_int"},
+        "List": {"item", "nullable", "minlen", "maxlen", "unique", "fail_fast"},
+        "Tuple": {"items", "nullable", "fail_fast"},
+        "Dict": {
+            "schema",
+            "nullable",
+            "minlen",
+            "maxlen",
+            "extra",
+            "defaults",
+            "optional",
+            "dispose",
+            "multikeys",
+            "fail_fast",
+        },
+        "AllOf": {"steps"},
+        "OneOf": {"steps", "fail_fast", "discriminator"},
+        "Type": {
+            "tp",
+            "nullable",
+            "coerce",
+            "min",
+            "max",
+            "minlen",
+            "maxlen",
+            "options",
+        },
+        "Const": {"value"},
+        "Any": set(),
+    }
+
+    def __init__(self):
+        self.counter = count()
+        self.functions = []
+        self.namespace = {
+            "isinstance": isinstance,
+            "type": type,
+            "len": len,
+            "enumerate": enumerate,
+            "getattr": getattr,
+            "int": int,
+            "float": float,
+            "bool": bool,
+            "bytes": bytes,
+            "str": str,
+            "list": list,
+            "tuple": tuple,
+            "dict": dict,
+            "set": set,
+            "string": string,
+            "chars": chars,
+            "Sequence": Sequence,
+            "Mapping": Mapping,
+            "isnan": math.isnan,
+            "isinf": math.isinf,
+            "TypeError": TypeError,
+            "ValueError": ValueError,
+            "UnicodeDecodeError": UnicodeDecodeError,
+            "ValidationError": exc.ValidationError,
+            "InvalidTypeError": exc.InvalidTypeError,
+            "OptionsError": exc.OptionsError,
+            "MinValueError": exc.MinValueError,
+            "MaxValueError": exc.MaxValueError,
+            "FloatValueError": exc.FloatValueError,
+            "StrDecodeError": exc.StrDecodeError,
+            "MinLengthError": exc.MinLengthError,
+            "MaxLengthError": exc.MaxLengthError,
+            "TupleLengthError": exc.TupleLengthError,
+            "PatternMatchError": exc.PatternMatchError,
+            "ForbiddenKeyError": exc.ForbiddenKeyError,
+            "MissingKeyError": exc.MissingKeyError,
+            "SchemaError": exc.SchemaError,
+            "Step": exc.Step,
+            "EXTRA_KEY": exc.EXTRA_KEY,
+            "EXTRA_VALUE": exc.EXTRA_VALUE,
+        }
+        self.constants = {}
+        self.uses_context = False
+        self.deferred = []
+
+    # Helpers
+    # =======
+
+    def name(self, prefix):
+        return "%s_%d" % (prefix, next(self.counter))
+
+    def const(self, value, prefix="const"):
+        try:
+            return self.constants[id(value)][0]
+        except KeyError:
+            name = self.name(prefix)
+            # Keep reference to the value, so that its ``id`` is not reused
+            self.constants[id(value)] = (name, value)
+            self.namespace[name] = value
+            return name
+
+    def literal(self, value):
+        if value is None or type(value) in (bool, int, str):
+            return repr(value)
+        if type(value) is float and not (math.isnan(value) or math.isinf(value)):
+            return repr(value)
+        return self.const(value)
+
+    @contextmanager
+    def nullable(self, w, validator, var):
+        if validator.nullable:
+            w("if %s is not None:" % var)
+            with w.indent():
+                yield
+        else:
+            yield
+
+    def raise_type(self, w, expected, var):
+        w("raise InvalidTypeError(expected=%s, actual=type(%s))" % (expected, var))
+
+    def coerce(self, w, to, expected, var):
+        w("try:")
+        with w.indent(block=True):
+            w("%s = %s(%s)" % (var, to, var))
+        w("except (TypeError, ValueError):")
+        with w.indent():
+            self.raise_type(w, expected, var)
+
+    def length(self, w, validator, var, length=None):
+        if validator.minlen is None and validator.maxlen is None:
+            return
+        if length is None:
+            length = self.name("length")
+            w("%s = len(%s)" % (length, var))
+        if validator.minlen is not None:
+            minlen = self.literal(validator.minlen)
+            w("if %s < %s:" % (length, minlen))
+            with w.indent():
+                w("raise MinLengthError(expected=%s, actual=%s)" % (minlen, length))
+        if validator.maxlen is not None:
+            maxlen = self.literal(validator.maxlen)
+            w("if %s > %s:" % (length, maxlen))
+            with w.indent():
+                w("raise MaxLengthError(expected=%s, actual=%s)" % (maxlen, length))
+
+    def limits(self, w, validator, var):
+        if validator.min is not None:
+            min_ = self.literal(validator.min)
+            w("if %s < %s:" % (var, min_))
+            with w.indent():
+                w("raise MinValueError(expected=%s, actual=%s)" % (min_, var))
+        if validator.max is not None:
+            max_ = self.literal(validator.max)
+            w("if %s > %s:" % (var, max_))
+            with w.indent():
+                w("raise MaxValueError(expected=%s, actual=%s)" % (max_, var))
+
+    def options(self, w, validator, var):
+        if validator.options is not None:
+            options = self.const(validator.options, "options")
+            w("if %s not in %s:" % (var, options))
+            with w.indent():
+                w("raise OptionsError(expected=%s, actual=%s)" % (options, var))
+
+    def extend(self, w, errors, error, *nodes):
+        context = error
+        for node in nodes:
+            context = "%s.add_context(%s)" % (context, node)
+        w("%s.extend(%s)" % (errors, context))
+
+    def fail_fast(self, w, validator, errors):
+        if validator.fail_fast:
+            w("raise SchemaError(%s)" % errors)
+
+    # Compilation
+    # ===========
+
+    def compile(self, validator):
+        root = self.function(validator, "validate", top=True)
+        lines = ["def factory(namespace):"]
+        for name in sorted(self.namespace):
+            lines.append("    %s = namespace[%r]" % (name, name))
+        for w in self.functions:
+            lines.append("")
+            lines.extend("    " + line for line in w.lines)
+        lines.append("")
+        # Dispatch tables refer to functions, so they are defined at the end
+        for line in self.deferred:
+            lines.append("    " + line)
+        lines.append("    return %s" % root)
+        source = "\n".join(lines) + "\n"
+
+        filename = "<validx.compiler-%d>" % next(_filenames)
+        code = _builtin_compile(source, filename, "exec")
+        # Make the source available for tracebacks
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(True),
+            filename,
+        )
+
+        scope = {}
+        exec(code, scope)
+        result = scope["factory"](self.namespace)
+        result.__source__ = source
+        return result
+
+    def function(self, validator, prefix="validate", top=False):
+        name = self.name(prefix)
+        w = _Writer()
+        self.functions.append(w)
+        w("def %s(value, __context%s):" % (name, "=None" if top else ""))
+        with w.indent():
+            header = len(w.lines)
+            self.emit(w, validator, "value")
+            w("return value")
+            if top and self.uses_context:
+                w.lines[header:header] = [
+                    "    if __context is None:",
+                    "        __context = {}  # Setup context, if it's top level call",
+                ]
+        return name
+
+    def emit(self, w, validator, var):
+        kind = _kind(validator)
+        if kind is None or not self.is_supported(kind, validator):
+            return self.emit_call(w, self.const(validator, "validator"), var)
+        if w.too_deep():
+            return self.emit_call(w, self.function(validator), var)
+        getattr(self, "emit_" + kind.lower())(w, validator, var)
+
+    def is_supported(self, kind, validator):
+        supported = self.supported.get(kind)
+        if supported is None:
+            return False
+        return all(name in supported for name, value in validator.params())
+
+    def emit_call(self, w, function, var):
+        self.uses_context = True
+        w("%s = %s(%s, __context)" % (var, function, var))
+
+    # Numbers
+    # =======
+
+    def emit_int(self, w, validator, var):
+        with self.nullable(w, validator, var):
+            w("if not isinstance(%s, int):" % var)
+            with w.indent():
+                w("if isinstance(%s, float) and %s.is_integer():" % (var, var))
+                with w.indent():
+                    # Implicitly convert ``float`` to ``int``,
+                    # if the value represents integer number
+                    w("%s = int(%s)" % (var, var))
+                w("else:")
+                with w.indent():
+                    if validator.coerce:
+                        self.coerce(w, "int", "int", var)
+                    else:
+                        self.raise_type(w, "int", var)
+            self.limits(w, validator, var)
+            self.options(w, validator, var)
+
+    def emit_float(self, w, validator, var):
+        with self.nullable(w, validator, var):
+            w("if not isinstance(%s, float):" % var)
+            with w.indent():
+                w("if isinstance(%s, int):" % var)
+                with w.indent():
+                    # Always implicitly convert ``int`` to ``float``
+                    w("%s = float(%s)" % (var, var))
+                w("else:")
+                with w.indent():
+                    if validator.coerce:
+                        self.coerce(w, "float", "float", var)
+                    else:
+                        self.raise_type(w, "float", var)
+            # There is no need to check for ``NaN`` explicitly,
+            # when it is acceptable, since any comparison with ``NaN``
+            # evaluates to ``False``.
+            if not validator.nan:
+                w("if isnan(%s):" % var)
+                with w.indent():
+                    w("raise FloatValueError(expected='number', actual=%s)" % var)
+            if not validator.inf:
+                w("if isinf(%s):" % var)
+                with w.indent():
+                    w("raise FloatValueError(expected='finite', actual=%s)" % var)
+            self.limits(w, validator, var)
+
+    # Chars
+    # =====
+
+    def emit_str(self, w, validator, var):
+        with self.nullable(w, validator, var):
+            w("if not isinstance(%s, string):" % var)
+            with w.indent():
+                if validator.encoding is not None:
+                    encoding = self.literal(validator.encoding)
+                    w("if isinstance(%s, bytes):" % var)
+                    with w.indent():
+                        w("try:")
+                        with w.indent(block=True):
+                            w("%s = %s.decode(%s)" % (var, var, encoding))
+                        w("except UnicodeDecodeError:")
+                        with w.indent():
+                            w(
+                                "raise StrDecodeError(expected=%s, actual=%s)"
+                                % (encoding, var)
+                            )
+                    w("else:")
+                    with w.indent():
+                        self.raise_type(w, "string", var)
+                else:
+                    self.raise_type(w, "string", var)
+            self.length(w, validator, var)
+            if validator.pattern:
+                pattern = self.literal(validator.pattern)
+                match = self.const(patterns.compile(validator.pattern).match, "match")
+                w("if not %s(%s):" % (match, var))
+                with w.indent():
+                    w(
+                        "raise PatternMatchError(expected=%s, actual=%s)"
+                        % (pattern, var)
+                    )
+            self.options(w, validator, var)
+
+    def emit_bytes(self, w, validator, var):
+        with self.nullable(w, validator, var):
+            w("if not isinstance(%s, bytes):" % var)
+            with w.indent():
+                self.raise_type(w, "bytes", var)
+            self.length(w, validator, var)
+
+    # Boolean
+    # =======
+
+    def emit_bool(self, w, validator, var):
+        with self.nullable(w, validator, var):
+            w("if not isinstance(%s, bool):" % var)
+            with w.indent():
+                branch = "if"
+                if validator.coerce_str:
+                    true = self.const(validator.TRUE, "true")
+                    false = self.const(validator.FALSE, "false")
+                    w("if isinstance(%s, str):" % var)
+                    with w.indent():
+                        w("%s = %s.lower()" % (var, var))
+                        w("if %s in %s:" % (var, true))
+                        with w.indent():
+                            w("%s = True" % var)
+                        w("elif %s in %s:" % (var, false))
+                        with w.indent():
+                            w("%s = False" % var)
+                        w("else:")
+                        with w.indent():
+                            w(
+                                "raise OptionsError(expected=%s + %s, actual=%s)"
+                                % (true, false, var)
+                            )
+                    branch = "elif"
+                if validator.coerce_int:
+                    w("%s isinstance(%s, int):" % (branch, var))
+                    with w.indent():
+                        w("%s = bool(%s)" % (var, var))
+                    branch = "elif"
+                if branch == "elif":
+                    w("else:")
+                    with w.indent():
+                        self.raise_type(w, "bool", var)
+                else:
+                    self.raise_type(w, "bool", var)
+
+    # Containers
+    # ==========
+
+    def sequence(self, w, var):
+        w("if not isinstance(%s, (list, tuple)):" % var)
+        with w.indent():
+            w("if not isinstance(%s, Sequence) or isinstance(%s, chars):" % (var, var))
+            with w.indent():
+                self.raise_type(w, "Sequence", var)
+
+    def emit_list(self, w, validator, var):
+        with self.nullable(w, validator, var):
+            self.sequence(w, var)
+            result = self.name("result")
+            errors = self.name("errors")
+            num = self.name("num")
+            item = self.name("item")
+            w("%s = []" % result)
+            w("%s = []" % errors)
+            if validator.unique:
+                unique = self.name("unique")
+                w("%s = set()" % unique)
+            w("for %s, %s in enumerate(%s):" % (num, item, var))
+            with w.indent(block=True):
+                w("try:")
+                with w.indent(block=True):
+                    self.emit(w, validator.item, item)
+                w("except ValidationError as e:")
+                with w.indent():
+                    self.extend(w, errors, "e", num)
+                    self.fail_fast(w, validator, errors)
+                    w("continue")
+                if validator.unique:
+                    w("if %s in %s:" % (item, unique))
+                    with w.indent():
+                        w("continue")
+                    w("%s.add(%s)" % (unique, item))
+                w("%s.append(%s)" % (result, item))
+            w("if %s:" % errors)
+            with w.indent():
+                w("raise SchemaError(%s)" % errors)
+            self.length(w, validator, result)
+            w("%s = %s" % (var, result))
+
+    def emit_tuple(self, w, validator, var):
+        with self.nullable(w, validator, var):
+            self.sequence(w, var)
+            size = len(validator.items)
+            w("if %s != len(%s):" % (size, var))
+            with w.indent():
+                w("raise TupleLengthError(expected=%s, actual=len(%s))" % (size, var))
+            errors = self.name("errors")
+            items = [self.name("item") for _ in validator.items]
+            w("%s = []" % errors)
+            w("%s, = %s" % (", ".join(items), var))
+            for num, (step, item) in enumerate(zip(validator.items, items)):
+                w("try:")
+                with w.indent(block=True):
+                    self.emit(w, step, item)
+                w("except ValidationError as e:")
+                with w.indent():
+                    self.extend(w, errors, "e", num)
+                    self.fail_fast(w, validator, errors)
+            w("if %s:" % errors)
+            with w.indent():
+                w("raise SchemaError(%s)" % errors)
+            w("%s = (%s,)" % (var, ", ".join(items)))
+
+    def emit_dict(self, w, validator, var):
+        with self.nullable(w, validator, var):
+            w("if not isinstance(%s, (dict, Mapping)):" % var)
+            with w.indent():
+                self.raise_type(w, "Mapping", var)
+            result = self.name("result")
+            errors = self.name("errors")
+            key = self.name("key")
+            val = self.name("val")
+            w("%s = {}" % result)
+            w("%s = []" % errors)
+            if validator.multikeys is not None:
+                getall = self.name("getall")
+                multikeys = self.const(validator.multikeys, "multikeys")
+                # If value is a multidict, specified keys should be treated
+                # as sequences, not as scalars.
+                w(
+                    '%s = getattr(%s, "getall", None) or getattr(%s, "getlist", None)'
+                    % (getall, var, var)
+                )
+            if validator.schema is not None:
+                # Validators of schema keys are compiled into separate
+                # functions, which are dispatched by key
+                functions = dict(
+                    (k, self.function(v)) for k, v in validator.schema.items()
+                )
+                schema = self.name("schema")
+                self.deferred.append(
+                    "%s = {%s}"
+                    % (
+                        schema,
+                        ", ".join(
+                            "%s: %s" % (self.literal(k), f)
+                            for k, f in functions.items()
+                        ),
+                    )
+                )
+            w("for %s, %s in %s.items():" % (key, val, var))
+            with w.indent(block=True):
+                if validator.dispose is not None:
+                    dispose = self.const(validator.dispose, "dispose")
+                    w("if %s in %s:" % (key, dispose))
+                    with w.indent():
+                        w("continue")
+                if validator.multikeys is not None:
+                    w("if %s is not None and %s in %s:" % (getall, key, multikeys))
+                    with w.indent():
+                        w("%s = %s(%s)" % (val, getall, key))
+                if validator.schema is not None:
+                    function = self.name("function")
+                    w("%s = %s.get(%s)" % (function, schema, key))
+                    w("if %s is not None:" % function)
+                    with w.indent():
+                        w("try:")
+                        with w.indent(block=True):
+                            w("%s = %s(%s, __context)" % (val, function, val))
+                        w("except ValidationError as e:")
+                        with w.indent():
+                            self.extend(w, errors, "e", key)
+                            self.fail_fast(w, validator, errors)
+                    w("else:")
+                with self.optional_indent(w, validator.schema is not None):
+                    if validator.extra is not None:
+                        self.emit_extra(w, validator, key, val, errors)
+                    else:
+                        w("%s.append(ForbiddenKeyError(%s))" % (errors, key))
+                        self.fail_fast(w, validator, errors)
+                w("%s[%s] = %s" % (result, key, val))
+            if validator.schema is not None:
+                self.emit_missing(w, validator, result, errors)
+            w("if %s:" % errors)
+            with w.indent():
+                w("raise SchemaError(%s)" % errors)
+            self.length(w, validator, result)
+            w("%s = %s" % (var, result))
+
+    @contextmanager
+    def optional_indent(self, w, condition):
+        if condition:
+            with w.indent():
+                yield
+        else:
+            yield
+
+    def emit_extra(self, w, validator, key, val, errors):
+        # Inlined code may partially convert its variable before failure,
+        # so the original key and value are kept until validation succeeds.
+        extra = validator.extra
+        tmp = self.name("tmp")
+        w("%s = %s" % (tmp, key))
+        w("try:")
+        with w.indent(block=True):
+            self.emit(w, extra[0], tmp)
+            w("%s = %s" % (key, tmp))
+        w("except ValidationError as e:")
+        with w.indent():
+            self.extend(w, errors, "e", "EXTRA_KEY", key)
+            self.fail_fast(w, validator, errors)
+        w("%s = %s" % (tmp, val))
+        w("try:")
+        with w.indent(block=True):
+            self.emit(w, extra[1], tmp)
+            w("%s = %s" % (val, tmp))
+        w("except ValidationError as e:")
+        with w.indent():
+            self.extend(w, errors, "e", "EXTRA_VALUE", key)
+            self.fail_fast(w, validator, errors)
+
+    def emit_missing(self, w, validator, result, errors):
+        defaults = validator.defaults or {}
+        optional = validator.optional or ()
+        for k, v in validator.schema.items():
+            if k not in defaults and k in optional:
+                continue
+            key = self.literal(k)
+            w("if %s not in %s:" % (key, result))
+            with w.indent():
+                if k in defaults:
+                    default = defaults[k]
+                    tmp = self.name("default")
+                    if not callable(default) and immutable(default):
+                        w("%s = %s" % (tmp, self.const(default, "default")))
+                    else:
+                        make = self.const(factory(default), "default")
+                        w("%s = %s()" % (tmp, make))
+                    w("try:")
+                    with w.indent(block=True):
+                        self.emit(w, v, tmp)
+                        w("%s[%s] = %s" % (result, key, tmp))
+                    w("except ValidationError as e:")
+                    with w.indent():
+                        self.extend(w, errors, "e", key)
+                        self.fail_fast(w, validator, errors)
+                else:
+                    w("%s.append(MissingKeyError(%s))" % (errors, key))
+                    self.fail_fast(w, validator, errors)
+
+    # Pipelines
+    # =========
+
+    def emit_allof(self, w, validator, var):
+        for num, step in enumerate(validator.steps):
+            w("try:")
+            with w.indent(block=True):
+                self.emit(w, step, var)
+            w("except ValidationError as e:")
+            with w.indent():
+                w("raise e.add_context(Step(%d))" % num)
+
+    def emit_oneof(self, w, validator, var):
+        errors = self.name("errors")
+        tmp = self.name("tmp")
+        w("%s = []" % errors)
+        w("while True:")
+        with w.indent(block=True):
+            for num, step in enumerate(validator.steps):
+                w("%s = %s" % (tmp, var))
+                w("try:")
+                with w.indent(block=True):
+                    self.emit(w, step, tmp)
+                w("except ValidationError as e:")
+                with w.indent():
+                    if validator.fail_fast:
+                        # Keep errors of the last step only
+                        w("%s = []" % errors)
+                    self.extend(w, errors, "e", "Step(%d)" % num)
+                w("else:")
+                with w.indent():
+                    w("%s = %s" % (var, tmp))
+                    w("break")
+            w("if %s:" % errors)
+            with w.indent():
+                w("raise SchemaError(%s)" % errors)
+            w("%s = None" % var)
+            w("break")
+
+    # Special
+    # =======
+
+    def emit_type(self, w, validator, var):
+        with self.nullable(w, validator, var):
+            tp = self.const(validator.tp, "tp")
+            w("if not isinstance(%s, %s):" % (var, tp))
+            with w.indent():
+                if validator.coerce:
+                    self.coerce(w, tp, tp, var)
+                else:
+                    self.raise_type(w, tp, var)
+            if validator.min is not None or validator.max is not None:
+                self.limits(w, validator, var)
+            self.length(w, validator, var)
+            self.options(w, validator, var)
+
+    def emit_const(self, w, validator, var):
+        value = self.literal(validator.value)
+        w("if %s != %s:" % (var, value))
+        with w.indent():
+            w("raise OptionsError(expected=[%s], actual=%s)" % (value, var))
+
+    def emit_any(self, w, validator, var):
+        # Any value is valid, but the line keeps enclosing blocks non-empty
+        w("pass")
@@ -5,7 +5,7 @@ from .datetimes import Date, Time, Datetime
 from .bools import Bool
 from .containers import List, Tuple, Dict
 from .pipelines import AllOf, OneOf
-from .special import LazyRef, Type, Const, Any
+from .special import LazyRef, Type, Const, Any, Cached, Lazy
 from . import classes, instances
 
 
@@ -30,6 +30,8 @@ __all__ = [
     "Type",
     "Const",
     "Any",
+    "Cached",
+    "Lazy",
     "classes",
     "instances",
 ]
@@ -52,3 +54,5 @@ classes.add(LazyRef)
 classes.add(Type)
 classes.add(Const)
 classes.add(Any)
+classes.add(Cached)
+classes.add(Lazy)
@@ -1,5 +1,6 @@
 import typing as t
 from abc import ABC
+from ..exc import ValidationError
 
 Value = t.TypeVar("Value")
 
@@ -9,6 +10,7 @@ class Validator(ABC):
     def __call__(self, value: Value) -> Value: ...
     def __repr__(self) -> str: ...
     def __eq__(self, other: t.Any) -> bool: ...
+    def __hash__(self) -> int: ...
     def params(self) -> t.Iterator[t.Tuple[str, t.Any]]: ...
     def dump(self) -> t.Dict[str, t.Any]: ...
     @staticmethod
@@ -16,3 +18,13 @@ class Validator(ABC):
         params: t.Dict[str, t.Any], update: t.Dict[str, t.Any] = None, **kw,
     ) -> Validator: ...
     def clone(self, update: t.Dict[str, t.Any] = None, **kw) -> Validator: ...
+    def compile(self) -> t.Callable[[Value], Value]: ...
+    def validate_many(
+        self, values: t.Iterable[t.Any], errors: str = "collect"
+    ) -> t.Tuple[t.List[t.Any], t.List[ValidationError]]: ...
+    def avalidate(
+        self, value: t.Any, budget: int = 1000, concurrency: int = 1
+    ) -> t.Awaitable[t.Any]: ...
+    def revalidate(
+        self, value: t.Any, patch: t.Iterable[t.Mapping[str, t.Any]]
+    ) -> t.Any: ...
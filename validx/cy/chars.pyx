@@ -1,8 +1,9 @@
+from cpython.buffer cimport PyObject_CheckBuffer
 from libc cimport limits
-import re
 
 from .. import exc
 from .. import contracts
+from .. import patterns
 from ..compat.types import string
 from . cimport abstract
 
@@ -62,6 +63,7 @@ cdef class Str(abstract.Validator):
     cdef long _maxlen
     cdef basestring _pattern
     cdef frozenset _options
+    cdef object _match
 
     @property
     def nullable(self):
@@ -113,6 +115,7 @@ cdef class Str(abstract.Validator):
         self._maxlen = limits.LONG_MAX if maxlen is None else maxlen
         self._pattern = pattern
         self._options = options
+        self._match = patterns.compile(pattern).match if pattern else None
 
         self._register(alias, replace)
 
@@ -132,7 +135,7 @@ cdef class Str(abstract.Validator):
             raise exc.MinLengthError(expected=self.minlen, actual=length)
         if length > self._maxlen:
             raise exc.MaxLengthError(expected=self.maxlen, actual=length)
-        if self.pattern and not re.match(self.pattern, value):
+        if self._match is not None and not self._match(value):
             raise exc.PatternMatchError(expected=self.pattern, actual=value)
         if self.options is not None and value not in self.options:
             raise exc.OptionsError(expected=self.options, actual=value)
@@ -153,10 +156,19 @@ cdef class Bytes(abstract.Validator):
     :param int maxlen:
         upper length limit.
 
+    :param bool buffer:
+        accept any object, that supports buffer protocol,
+        i.e. ``bytearray``, ``memoryview``, ``mmap``, etc.
+        Such objects are not copied,
+        validator returns ``memoryview`` of them,
+        ``memoryview`` objects are returned as is.
+        Their length is measured in bytes.
+
 
     :raises InvalidTypeError:
         * if ``value is None`` and ``not self.nullable``;
-        * if ``not isinstance(value, bytes)``.
+        * if ``not isinstance(value, bytes)`` and ``not self.buffer``;
+        * if value does not support buffer protocol and ``self.buffer``.
 
     :raises MinLengthError:
         if ``len(value) < self.minlen``.
@@ -166,11 +178,12 @@ cdef class Bytes(abstract.Validator):
 
     """
 
-    __slots__ = ("nullable", "minlen", "maxlen")
+    __slots__ = ("nullable", "minlen", "maxlen", "buffer")
 
     cdef bint _nullable
     cdef long _minlen
     cdef long _maxlen
+    cdef bint _buffer
 
     @property
     def nullable(self):
@@ -184,25 +197,43 @@ cdef class Bytes(abstract.Validator):
     def maxlen(self):
         return None if self._maxlen == limits.LONG_MAX else self._maxlen
 
+    @property
+    def buffer(self):
+        return self._buffer
+
     def __init__(
-        self, nullable=False, minlen=None, maxlen=None, alias=None, replace=False
+        self,
+        nullable=False,
+        minlen=None,
+        maxlen=None,
+        buffer=False,
+        alias=None,
+        replace=False,
     ):
         nullable = contracts.expect_flag(self, "nullable", nullable)
         minlen = contracts.expect_length(self, "minlen", minlen, nullable=True)
         maxlen = contracts.expect_length(self, "maxlen", maxlen, nullable=True)
+        buffer = contracts.expect_flag(self, "buffer", buffer)
 
         self._nullable = nullable
         self._minlen = 0 if minlen is None else minlen
         self._maxlen = limits.LONG_MAX if maxlen is None else maxlen
+        self._buffer = buffer
 
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
         if value is None and self._nullable:
             return value
-        if not isinstance(value, bytes):
+        cdef long length
+        if isinstance(value, bytes):
+            length = len(value)
+        elif not self._buffer or not PyObject_CheckBuffer(value):
             raise exc.InvalidTypeError(expected=bytes, actual=type(value))
-        cdef long length = len(value)
+        else:
+            if not isinstance(value, memoryview):
+                value = memoryview(value)
+            length = value.nbytes
         if length < self._minlen:
             raise exc.MinLengthError(expected=self.minlen, actual=length)
         if length > self._maxlen:
@@ -0,0 +1,8 @@
+import typing as t
+from . import abstract
+
+def loads(
+    validator: abstract.Validator,
+    data: t.Union[str, bytes, bytearray],
+    context: t.Dict[str, t.Any] = None,
+) -> t.Any: ...
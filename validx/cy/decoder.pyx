@@ -0,0 +1,572 @@
+cimport cython
+from libc cimport limits
+
+import json
+import re
+from json.decoder import scanstring
+from json.scanner import make_scanner
+from threading import Lock
+
+from .. import exc
+from ..compat.types import string
+from ..compiler import _kind
+from ..defaults import factory
+from ..introspection import accepts, registry
+
+__all__ = ["loads"]
+
+
+JSONDecodeError = getattr(json, "JSONDecodeError", ValueError)
+
+# Tokens, that have to be tracked to skip containers:
+# strings (which can contain brackets) and brackets
+_TOKENS = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]', re.DOTALL)
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+_scan = make_scanner(json.JSONDecoder())
+
+_detect_encoding = getattr(json, "detect_encoding", lambda data: "utf-8")
+
+# Plan of the last parsed validator, ``(validator, node)``,
+# it is reused by repeated calls, e.g. for each line of JSON Lines,
+# the lock guards the plan cache and targets of ``LazyRef`` nodes
+_last = (None, None)
+_lock = Lock()
+
+# Kinds of validators, see ``_Node``
+cdef enum:
+    OTHER
+    DICT
+    LIST
+    LAZYREF
+    STR
+    INT
+    ANY
+
+_kinds = {
+    "Dict": DICT,
+    "List": LIST,
+    "LazyRef": LAZYREF,
+    "Str": STR,
+    "Int": INT,
+    "Any": ANY,
+}
+
+
+def loads(validator, data, context=None):
+    """
+    Parse and validate JSON document
+
+    :param Validator validator:
+        validator of the document.
+
+    :param data:
+        JSON document, ``str``, ``bytes``, or ``bytearray``,
+        bytes are decoded the same way :func:`json.loads` does.
+
+    :param dict context:
+        validation context.
+
+    :returns:
+        validated document.
+
+    :raises ValueError:
+        (:class:`json.JSONDecodeError` on Python 3)
+        if the document is malformed.
+
+    :raises ValidationError:
+        if the document is invalid.
+
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode(_detect_encoding(data), "surrogatepass")
+    elif not isinstance(data, string):
+        raise TypeError(
+            "Expected data to be str, bytes or bytearray, got %r" % (type(data),)
+        )
+    elif data.startswith(u"\ufeff"):
+        raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)", data, 0)
+    if context is None:
+        context = {}
+    global _last
+    with _lock:
+        if _last[0] is not validator:
+            _last = (validator, _Node(validator))
+        node = _last[1]
+    cdef _Parser parser = _Parser(data, context)
+    try:
+        result = parser.parse(node, parser.space(0))
+    except exc.ValidationError:
+        if parser.end >= 0:
+            parser.finish()
+        raise
+    parser.finish()
+    return result
+
+
+@cython.final
+cdef class _Node:
+    # Validator prepared for parsing,
+    # nodes of nested validators are created on demand
+    cdef object validator
+    cdef int kind
+    # ``Str`` and ``Int``: whether valid values can be checked by bounds,
+    # i.e. by bounds of length of ``Str``, or of value of ``Int``
+    cdef bint simple
+    cdef long long low
+    cdef long long high
+    # ``Str``, ``List``, and ``Dict``, ``-1`` stands for ``None``
+    cdef Py_ssize_t minlen
+    cdef Py_ssize_t maxlen
+    # ``List`` and ``Dict``
+    cdef bint fail_fast
+    # ``List``
+    cdef _Node item
+    cdef bint unique
+    # ``Dict``
+    cdef dict schema
+    cdef dict children
+    cdef object extra
+    cdef _Node extra_value
+    cdef object dispose
+    # ``(key, validator, default)`` of non-optional keys,
+    # see ``validx.py.containers._missing_keys()``
+    cdef tuple missing
+    # ``LazyRef``
+    cdef object target
+    cdef _Node target_node
+
+    def __init__(self, validator):
+        self.validator = validator
+        self.kind = _kinds.get(_kind(validator), OTHER)
+        if self.kind in (STR, LIST, DICT):
+            self.minlen = -1 if validator.minlen is None else validator.minlen
+            self.maxlen = -1 if validator.maxlen is None else validator.maxlen
+        if self.kind in (LIST, DICT):
+            self.fail_fast = validator.fail_fast
+        if self.kind == STR:
+            self.simple = validator.pattern is None and validator.options is None
+            self.low = max(self.minlen, 0)
+            self.high = limits.LLONG_MAX if self.maxlen < 0 else self.maxlen
+        elif self.kind == INT:
+            self.simple = validator.options is None and all(
+                bound is None or limits.LLONG_MIN <= bound <= limits.LLONG_MAX
+                for bound in (validator.min, validator.max)
+            )
+            self.low = limits.LLONG_MIN
+            self.high = limits.LLONG_MAX
+            if self.simple and validator.min is not None:
+                self.low = validator.min
+            if self.simple and validator.max is not None:
+                self.high = validator.max
+        elif self.kind == LIST:
+            self.item = _Node(validator.item)
+            self.unique = validator.unique
+        elif self.kind == DICT:
+            self.init_dict(validator)
+
+    cdef init_dict(self, validator):
+        self.schema = None
+        self.children = {}
+        self.missing = ()
+        if validator.schema is not None:
+            self.schema = dict(validator.schema.items())
+            missing = []
+            for key, item in self.schema.items():
+                if validator.defaults is not None and key in validator.defaults:
+                    missing.append((key, item, factory(validator.defaults[key])))
+                elif validator.optional is None or key not in validator.optional:
+                    missing.append((key, item, None))
+            self.missing = tuple(missing)
+        self.extra = validator.extra
+        if self.extra is not None:
+            self.extra_value = _Node(self.extra[1])
+        self.dispose = validator.dispose
+
+    cdef _Node child(self, key):
+        # Returns node of schema validator of the key, or ``None``
+        cdef _Node node = self.children.get(key)
+        if node is None and self.schema is not None:
+            validator = self.schema.get(key)
+            if validator is not None:
+                node = self.children[key] = _Node(validator)
+        return node
+
+
+@cython.final
+cdef class _Parser:
+    cdef unicode text
+    cdef Py_ssize_t length
+    cdef dict context
+    # Index of the end of the last parsed value,
+    # or ``-1``, if parsing of containers has been stopped
+    # at ``self.pos`` by their validators,
+    # where ``self.unclosed`` is number of the stopped containers
+    cdef Py_ssize_t end
+    cdef Py_ssize_t pos
+    cdef Py_ssize_t unclosed
+
+    def __init__(self, unicode text, dict context):
+        self.text = text
+        self.length = len(text)
+        self.context = context
+        self.end = 0
+        self.pos = 0
+        self.unclosed = 0
+
+    # Parsing
+    # =======
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef inline Py_UCS4 char(self, Py_ssize_t idx):
+        if idx < self.length:
+            return self.text[idx]
+        return 0
+
+    cdef Py_ssize_t space(self, Py_ssize_t idx):
+        cdef Py_UCS4 char = self.char(idx)
+        while char == u" " or char == u"\n" or char == u"\r" or char == u"\t":
+            idx += 1
+            char = self.char(idx)
+        return idx
+
+    cdef Py_ssize_t next(self) except -1:
+        # Returns the end of the last parsed value,
+        # stopped containers are skipped
+        if self.end < 0:
+            self.end = self.skip_open(self.pos, self.unclosed)
+        return self.end
+
+    cdef void stop(self):
+        # Stops parsing of container after the last parsed value
+        if self.end < 0:
+            self.unclosed += 1
+        else:
+            self.pos = self.end
+            self.unclosed = 1
+            self.end = -1
+
+    cdef finish(self):
+        cdef Py_ssize_t end = self.space(self.end)
+        if end != self.length:
+            raise JSONDecodeError("Extra data", self.text, end)
+
+    cdef parse(self, _Node node, Py_ssize_t idx):
+        # Parses value at the index, sets ``self.end``,
+        # and returns the value validated by the node
+        cdef Py_UCS4 char = self.char(idx)
+        cdef int kind = node.kind
+        cdef long long number
+        if kind == LAZYREF:
+            return self.parse_lazyref(node, idx)
+        if char == u"{":
+            if kind == DICT:
+                return self.parse_dict(node, idx)
+            return self.parse_container(node.validator, idx, {})
+        if char == u"[":
+            if kind == LIST:
+                return self.parse_list(node, idx)
+            return self.parse_container(node.validator, idx, [])
+        # Valid values of simple leaf validators are returned as is,
+        # otherwise validators are called to raise errors
+        if char == u'"':
+            value = self.scan_string(idx, node)
+            if kind == STR and node.simple and node.low <= len(value) <= node.high:
+                return value
+        elif self.scan_int(idx, &number):
+            if kind == INT and node.simple and node.low <= number <= node.high:
+                return number
+            value = number
+        else:
+            value = self.scan(idx)
+        if kind == ANY:
+            return value
+        return node.validator(value, self.context)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef scan_string(self, Py_ssize_t idx, _Node node):
+        # Strings without escapes are sliced,
+        # and rejected by ``maxlen`` of ``Str`` validator without slicing
+        cdef unicode text = self.text
+        cdef Py_ssize_t end = idx + 1
+        cdef Py_UCS4 char
+        while end < self.length:
+            char = text[end]
+            if char == u'"':
+                self.end = end + 1
+                if node is not None and node.kind == STR:
+                    if 0 <= node.maxlen < end - idx - 1:
+                        raise exc.MaxLengthError(
+                            expected=node.maxlen, actual=end - idx - 1
+                        )
+                return text[idx + 1 : end]
+            if char == u"\\" or char < 0x20:
+                break
+            end += 1
+        value, self.end = scanstring(text, idx + 1)
+        return value
+
+    cdef bint scan_int(self, Py_ssize_t idx, long long *number):
+        # Parses integer, that fits into ``long long``,
+        # returns false, if there is no such integer at the index
+        cdef Py_ssize_t end = idx
+        cdef Py_UCS4 char = self.char(end)
+        cdef bint negative = char == u"-"
+        number[0] = 0
+        if negative:
+            end += 1
+            char = self.char(end)
+        if char == u"0":
+            end += 1
+            char = self.char(end)
+        elif u"1" <= char <= u"9":
+            while u"0" <= char <= u"9":
+                if end - idx >= 18:
+                    return False
+                number[0] = number[0] * 10 + (<long long>char - 48)
+                end += 1
+                char = self.char(end)
+        else:
+            return False
+        if u"0" <= char <= u"9" or char == u"." or char == u"e" or char == u"E":
+            return False
+        if negative:
+            number[0] = -number[0]
+        self.end = end
+        return True
+
+    cdef scan(self, Py_ssize_t idx):
+        # Literals are parsed inline,
+        # anything else is parsed by the scanner of ``json``
+        cdef Py_UCS4 char = self.char(idx)
+        if char == u"t":
+            if self.text[idx : idx + 4] == u"true":
+                self.end = idx + 4
+                return True
+        elif char == u"f":
+            if self.text[idx : idx + 5] == u"false":
+                self.end = idx + 5
+                return False
+        elif char == u"n":
+            if self.text[idx : idx + 4] == u"null":
+                self.end = idx + 4
+                return None
+        try:
+            value, self.end = _scan(self.text, idx)
+        except StopIteration as e:
+            raise JSONDecodeError("Expecting value", self.text, e.value)
+        return value
+
+    cdef parse_container(self, validator, Py_ssize_t idx, empty):
+        # Container, which type is not accepted by validator,
+        # is skipped, and the empty one of the same type
+        # makes the validator raise the same error
+        types = accepts(validator)
+        if types is not None and (
+            not isinstance(empty, types[0]) or isinstance(empty, types[1])
+        ):
+            self.end = self.skip_open(idx + 1, 1)
+            return validator(empty, self.context)
+        return validator(self.scan(idx), self.context)
+
+    cdef parse_lazyref(self, _Node node, Py_ssize_t idx):
+        # See ``LazyRef.__call__``
+        validator = node.validator
+        instance = registry(validator).get(validator.use)
+        with _lock:
+            if instance is not node.target:
+                node.target = instance
+                node.target_node = _Node(instance)
+            target = node.target_node
+        if validator.maxdepth is None:
+            return self.parse(target, idx)
+        cdef dict context = self.context
+        try:
+            key = validator.use + ".recursion_depth"
+            depth = context.setdefault(key, 0) + 1
+            if depth > validator.maxdepth:
+                self.end = self.skip(idx)
+                raise exc.RecursionMaxDepthError(
+                    expected=validator.maxdepth, actual=depth
+                )
+            context[key] = depth
+            return self.parse(target, idx)
+        finally:
+            context[key] -= 1
+
+    cdef parse_list(self, _Node node, Py_ssize_t idx):
+        # See ``List.__call__``
+        cdef _Node item = node.item
+        cdef set unique = set() if node.unique else None
+        cdef list result = []
+        cdef list errors = []
+        cdef Py_ssize_t num = 0
+        cdef Py_UCS4 char
+
+        idx = self.space(idx + 1)
+        if self.char(idx) == u"]":
+            idx += 1
+        else:
+            while True:
+                try:
+                    val = self.parse(item, idx)
+                except exc.ValidationError as e:
+                    errors.extend(e.add_context(num))
+                    if node.fail_fast:
+                        self.stop()
+                        raise exc.SchemaError(errors)
+                else:
+                    if unique is None or val not in unique:
+                        if unique is not None:
+                            unique.add(val)
+                        result.append(val)
+                        if 0 <= node.maxlen < len(result) and not errors:
+                            self.stop()
+                            raise exc.MaxLengthError(
+                                expected=node.maxlen, actual=node.maxlen + 1
+                            )
+                idx = self.space(self.next())
+                char = self.char(idx)
+                if char == u"]":
+                    idx += 1
+                    break
+                if char != u",":
+                    raise JSONDecodeError("Expecting ',' delimiter", self.text, idx)
+                idx = self.space(idx + 1)
+                num += 1
+        self.end = idx
+
+        if errors:
+            raise exc.SchemaError(errors)
+
+        if len(result) < node.minlen:
+            raise exc.MinLengthError(expected=node.minlen, actual=len(result))
+        return result
+
+    cdef parse_dict(self, _Node node, Py_ssize_t idx):
+        # See ``Dict.__call__``
+        cdef dict context = self.context
+        cdef dict result = {}
+        cdef list errors = []
+        cdef Py_ssize_t failed
+        cdef Py_UCS4 char
+        cdef _Node child
+        extra = node.extra
+        dispose = node.dispose
+
+        idx = self.space(idx + 1)
+        if self.char(idx) == u"}":
+            idx += 1
+        else:
+            while True:
+                if self.char(idx) != u'"':
+                    raise JSONDecodeError(
+                        "Expecting property name enclosed in double quotes",
+                        self.text,
+                        idx,
+                    )
+                key = self.scan_string(idx, None)
+                idx = self.space(self.end)
+                if self.char(idx) != u":":
+                    raise JSONDecodeError("Expecting ':' delimiter", self.text, idx)
+                idx = self.end = self.space(idx + 1)
+                failed = len(errors)
+                child = node.child(key)
+                if dispose is not None and key in dispose:
+                    self.end = self.skip(idx)
+                elif child is not None:
+                    try:
+                        result[key] = self.parse(child, idx)
+                    except exc.ValidationError as e:
+                        errors.extend(e.add_context(key))
+                        result[key] = None
+                elif extra is not None:
+                    try:
+                        key = extra[0](key, context)
+                    except exc.ValidationError as e:
+                        errors.extend(e.add_context(exc.EXTRA_KEY).add_context(key))
+                    if not (errors and node.fail_fast):
+                        try:
+                            result[key] = self.parse(node.extra_value, idx)
+                        except exc.ValidationError as e:
+                            errors.extend(
+                                e.add_context(exc.EXTRA_VALUE).add_context(key)
+                            )
+                            result[key] = None
+                else:
+                    errors.append(exc.ForbiddenKeyError(key))
+                    if not node.fail_fast:
+                        self.end = self.skip(idx)
+                if len(errors) > failed and node.fail_fast:
+                    self.stop()
+                    raise exc.SchemaError(errors)
+                if 0 <= node.maxlen < len(result) and not errors:
+                    self.stop()
+                    raise exc.MaxLengthError(
+                        expected=node.maxlen, actual=node.maxlen + 1
+                    )
+                idx = self.space(self.next())
+                char = self.char(idx)
+                if char == u"}":
+                    idx += 1
+                    break
+                if char != u",":
+                    raise JSONDecodeError("Expecting ',' delimiter", self.text, idx)
+                idx = self.space(idx + 1)
+        self.end = idx
+
+        # Without extra keys, all keys are matched, if their number is equal
+        if node.missing and not (errors and node.fail_fast) and (
+            extra is not None or len(result) < len(node.schema)
+        ):
+            for key, item, default in node.missing:
+                if key in result:
+                    continue
+                if default is None:
+                    errors.append(exc.MissingKeyError(key))
+                    if node.fail_fast:
+                        break
+                    continue
+                try:
+                    result[key] = item(default(), context)
+                except exc.ValidationError as e:
+                    errors.extend(e.add_context(key))
+                    if node.fail_fast:
+                        break
+
+        if errors:
+            raise exc.SchemaError(errors)
+
+        if len(result) < node.minlen:
+            raise exc.MinLengthError(expected=node.minlen, actual=len(result))
+        return result
+
+    # Skipping
+    # ========
+
+    cdef Py_ssize_t skip(self, Py_ssize_t idx) except -1:
+        # Returns the end of value at the index without building it
+        cdef Py_UCS4 char = self.char(idx)
+        if char == u"{" or char == u"[":
+            return self.skip_open(idx + 1, 1)
+        if char == u'"':
+            match = _STRING.match(self.text, idx)
+            if match is None:
+                raise JSONDecodeError("Unterminated string", self.text, idx)
+            return match.end()
+        self.scan(idx)
+        return self.end
+
+    cdef Py_ssize_t skip_open(self, Py_ssize_t idx, Py_ssize_t depth) except -1:
+        # Returns the end of containers opened before the index
+        for match in _TOKENS.finditer(self.text, idx):
+            token = match.group()
+            if token == u"[" or token == u"{":
+                depth += 1
+            elif token == u"]" or token == u"}":
+                depth -= 1
+                if not depth:
+                    return match.end()
+        raise JSONDecodeError("Unterminated container", self.text, idx)
@@ -1,4 +1,5 @@
 cpdef add(str alias, instance)
 cpdef put(str alias, instance)
 cpdef get(str alias)
+cpdef list items()
 cpdef clear()
@@ -1,6 +1,8 @@
+import typing as t
 from . import abstract
 
 def add(alias: str, instance: abstract.Validator) -> abstract.Validator: ...
 def put(alias: str, instance: abstract.Validator) -> abstract.Validator: ...
 def get(alias: str) -> abstract.Validator: ...
+def items() -> t.List[t.Tuple[str, abstract.Validator]]: ...
 def clear() -> None: ...
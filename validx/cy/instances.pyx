@@ -78,6 +78,18 @@ cpdef get(str alias):
         raise KeyError("Instance '%s' is not registered" % alias)
 
 
+cpdef list items():
+    """
+    List registered validators
+
+
+    :returns:
+        list of ``(alias, instance)`` pairs.
+
+    """
+    return list(_instances.items())
+
+
 cpdef clear():
     """Clear the registry"""
     _instances.clear()
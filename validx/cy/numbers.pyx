@@ -1,6 +1,8 @@
+from cpython.buffer cimport PyObject_CheckBuffer
 from libc cimport math
 from libc cimport limits
 
+from .. import arrays
 from .. import exc
 from .. import contracts
 from ..compat.types import numbers
@@ -127,6 +129,22 @@ cdef class Int(abstract.Validator):
             raise exc.OptionsError(expected=self.options, actual=value)
         return value
 
+    def validate_many(self, values, errors="collect"):
+        """
+        Validate many values.
+
+        Same as :meth:`Validator.validate_many`,
+        but numeric arrays are validated in one pass,
+        see :mod:`validx.arrays`.
+
+        """
+        result = _validate_longs(self, values, errors)
+        if result is None:
+            result = arrays.validate_int(self, values, errors)
+        if result is None:
+            result = abstract.Validator.validate_many(self, values, errors)
+        return result
+
 
 cdef class Float(abstract.Validator):
     """
@@ -263,3 +281,139 @@ cdef class Float(abstract.Validator):
         if _value > self._max:
             raise exc.MaxValueError(expected=self.max, actual=value)
         return value
+
+    def validate_many(self, values, errors="collect"):
+        """
+        Validate many values.
+
+        Same as :meth:`Validator.validate_many`,
+        but numeric arrays are validated in one pass,
+        see :mod:`validx.arrays`.
+
+        """
+        result = _validate_doubles(self, values, errors)
+        if result is None:
+            result = arrays.validate_float(self, values, errors)
+        if result is None:
+            result = abstract.Validator.validate_many(self, values, errors)
+        return result
+
+
+# Batch checks of typed buffers, see ``validate_many`` methods.
+# Values are checked without GIL, each one gets an error code,
+# then results and errors are built with GIL.
+
+ctypedef fused number:
+    long
+    double
+
+
+cdef enum:
+    _VALID = 0
+    _NAN = 1
+    _INF = 2
+    _MIN = 3
+    _MAX = 4
+
+
+cdef void _check_longs(
+    const long[:] values, long min, long max, unsigned char[:] codes
+) noexcept nogil:
+    cdef Py_ssize_t i
+    for i in range(values.shape[0]):
+        if values[i] < min:
+            codes[i] = _MIN
+        elif values[i] > max:
+            codes[i] = _MAX
+
+
+cdef void _check_doubles(
+    const double[:] values,
+    double min,
+    double max,
+    bint nan,
+    bint inf,
+    unsigned char[:] codes,
+) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef double value
+    for i in range(values.shape[0]):
+        value = values[i]
+        if math.isnan(value):
+            if not nan:
+                codes[i] = _NAN
+        elif math.isinf(value) and not inf:
+            codes[i] = _INF
+        elif value < min:
+            codes[i] = _MIN
+        elif value > max:
+            codes[i] = _MAX
+
+
+def _validate_longs(Int validator, values, errors):
+    # Returns ``None``, if values are not a buffer of C longs
+    if validator._options is not None or not PyObject_CheckBuffer(values):
+        return None
+    if errors not in ("collect", "raise", "skip"):
+        return None
+    cdef const long[:] view
+    try:
+        view = values
+    except (TypeError, ValueError):
+        return None
+    codes = bytearray(view.shape[0])
+    cdef unsigned char[:] _codes = codes
+    with nogil:
+        _check_longs(view, validator._min, validator._max, _codes)
+    return _collect(validator, view, _codes, errors)
+
+
+def _validate_doubles(Float validator, values, errors):
+    # Returns ``None``, if values are not a buffer of C doubles
+    if not PyObject_CheckBuffer(values):
+        return None
+    if errors not in ("collect", "raise", "skip"):
+        return None
+    cdef const double[:] view
+    try:
+        view = values
+    except (TypeError, ValueError):
+        return None
+    codes = bytearray(view.shape[0])
+    cdef unsigned char[:] _codes = codes
+    with nogil:
+        _check_doubles(
+            view,
+            validator._min,
+            validator._max,
+            validator._nan,
+            validator._inf,
+            _codes,
+        )
+    return _collect(validator, view, _codes, errors)
+
+
+cdef tuple _collect(
+    validator, const number[:] view, unsigned char[:] codes, errors
+):
+    cdef Py_ssize_t i
+    results = []
+    collected = []
+    for i in range(codes.shape[0]):
+        if codes[i] == _VALID:
+            results.append(view[i])
+            continue
+        value = view[i]
+        if codes[i] == _NAN:
+            error = exc.FloatValueError(expected="number", actual=value)
+        elif codes[i] == _INF:
+            error = exc.FloatValueError(expected="finite", actual=value)
+        elif codes[i] == _MIN:
+            error = exc.MinValueError(expected=validator.min, actual=value)
+        else:
+            error = exc.MaxValueError(expected=validator.max, actual=value)
+        if errors == "raise":
+            raise exc.SchemaError(list(error.add_context(i)))
+        if errors == "collect":
+            collected.append(error.add_context(i))
+    return results, collected
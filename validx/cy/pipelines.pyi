@@ -11,6 +11,13 @@ class AllOf(abstract.Validator):
 class OneOf(abstract.Validator):
     __slots__: t.Tuple[str, ...]
     steps: t.List[abstract.Validator]
+    fail_fast: t.Optional[bool]
+    discriminator: t.Optional[str]
     def __init__(
-        self, *steps: abstract.Validator, alias: str = None, replace: bool = False
+        self,
+        *steps: abstract.Validator,
+        fail_fast: bool = None,
+        discriminator: str = None,
+        alias: str = None,
+        replace: bool = False,
     ) -> None: ...
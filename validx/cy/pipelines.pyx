@@ -1,5 +1,6 @@
 from .. import exc
 from .. import contracts
+from .. import dispatch
 from . cimport abstract
 
 
@@ -62,10 +63,22 @@ cdef class OneOf(abstract.Validator):
     :param Validator \\*steps:
         nested validators.
 
+    :param bool fail_fast:
+        keep errors of the last failed step only,
+        instead of accumulating errors of all steps.
+
+    :param str discriminator:
+        key of dicts, that tells ``Dict`` steps apart,
+        if it's not specified, it is detected automatically.
+        Steps are dispatched by type of value and by discriminator,
+        so that only steps, which can accept the value, are tried,
+        see :mod:`validx.dispatch`.
+
     :raises SchemaError:
         if all steps are failed,
         so it contains all errors,
-        raised by each step.
+        raised by each step
+        (or by the last one, if ``self.fail_fast``).
 
     :note:
         it uses :class:`validx.exc.Step` marker to indicate,
@@ -73,30 +86,72 @@ cdef class OneOf(abstract.Validator):
 
     """
 
-    __slots__ = ("steps",)
+    __slots__ = ("steps", "fail_fast", "discriminator")
 
     cdef tuple _steps
+    cdef bint _fail_fast
+    cdef object _discriminator
+    cdef object _dispatch
 
     @property
     def steps(self):
         return self._steps
 
-    def __init__(self, *steps_, steps=None, alias=None, replace=False):
+    @property
+    def fail_fast(self):
+        return self._fail_fast
+
+    @property
+    def discriminator(self):
+        return self._discriminator
+
+    def __init__(
+        self,
+        *steps_,
+        steps=None,
+        fail_fast=False,
+        discriminator=None,
+        alias=None,
+        replace=False,
+    ):
         self._steps = contracts.expect_sequence(
             self, "steps", steps or steps_, item_type=abstract.Validator
         )
+        self._fail_fast = contracts.expect_flag(self, "fail_fast", fail_fast)
+        self._discriminator = contracts.expect_basestr(
+            self, "discriminator", discriminator, nullable=True
+        )
+        self._dispatch = dispatch.build(self._steps, self._discriminator)
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
         if __context is None:
             __context = {}  # Setup context, if it's top level call
 
+        failed = None
+        if self._dispatch is not None:
+            # Other steps are known to fail,
+            # they are only called below to collect their errors
+            failed = {}
+            for num in self._dispatch(value):
+                try:
+                    return self.steps[num](value, __context)
+                except exc.ValidationError as e:
+                    failed[num] = e
+
         errors = []
         for num, step in enumerate(self.steps):
-            try:
-                return step(value, __context)
-            except exc.ValidationError as e:
-                errors.extend(ne.add_context(exc.Step(num)) for ne in e)
+            if failed is not None and num in failed:
+                error = failed[num]
+            else:
+                try:
+                    return step(value, __context)
+                except exc.ValidationError as e:
+                    error = e
+            if self.fail_fast:
+                errors = list(error.add_context(exc.Step(num)))
+            else:
+                errors.extend(error.add_context(exc.Step(num)))
         if errors:
             raise exc.SchemaError(errors)
         assert False, "At least one validation step has to be passed"
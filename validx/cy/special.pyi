@@ -1,5 +1,7 @@
 import typing as t
 from . import abstract
+from .containers import Dict
+from ..memo import CacheInfo
 
 class LazyRef(abstract.Validator):
     __slots__: t.Tuple[str, ...]
@@ -48,3 +50,30 @@ class Const(abstract.Validator):
 
 class Any(abstract.Validator):
     pass
+
+class Cached(abstract.Validator):
+    __slots__: t.Tuple[str, ...]
+    validator: abstract.Validator
+    maxsize: int
+    ttl: t.Optional[float]
+    cache_errors: t.Optional[bool]
+    def __init__(
+        self,
+        validator: abstract.Validator,
+        *,
+        maxsize: int = 1024,
+        ttl: float = None,
+        cache_errors: bool = None,
+        alias: str = None,
+        replace: bool = False,
+    ) -> None: ...
+    def cache_info(self) -> CacheInfo: ...
+    def cache_clear(self) -> None: ...
+
+
+class Lazy(abstract.Validator):
+    __slots__: t.Tuple[str, ...]
+    validator: Dict
+    def __init__(
+        self, validator: Dict, *, alias: str = None, replace: bool = False
+    ) -> None: ...
@@ -1,8 +1,15 @@
 from libc cimport limits
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
 
 from .. import exc
 from .. import contracts
+from .. import lazy
+from .. import memo
+from ..defaults import _scalars
 from . cimport abstract, instances
+from .containers import Dict
 
 
 cdef class LazyRef(abstract.Validator):
@@ -41,7 +48,7 @@ cdef class LazyRef(abstract.Validator):
         >>> schema({"bar": {"bar": {"foo": 1}}})
         Traceback (most recent call last):
             ...
-        validx.exc.errors.SchemaError: <SchemaError(errors=[
+        validx.exc.SchemaError: <SchemaError(errors=[
             <bar.bar: RecursionMaxDepthError(expected=1, actual=2)>
         ])>
 
@@ -314,3 +321,235 @@ cdef class Any(abstract.Validator):
     def __call__(self, value, __context=None):
         return value
 
+
+cdef class Cached(abstract.Validator):
+    """
+    Memoizing Validator
+
+    It caches results of nested validator for repeated values,
+    see :mod:`validx.memo` for cacheable values.
+    Other values are validated as usual.
+    Nested validators depending on current time,
+    i.e. ``Date`` and ``Datetime`` with ``relmin`` or ``relmax``,
+    are not cached at all.
+
+    Cache lookup costs about a microsecond for scalars,
+    and grows with size of the value,
+    since the value is converted into a key on each call.
+    So caching pays off for expensive validators,
+    e.g. long strings matched against patterns
+    or custom validators making lookups,
+    rather than for small dicts of built-in validators.
+
+    ..  testsetup:: cached
+
+        from validx import Cached, Str
+
+    ..  doctest:: cached
+
+        >>> schema = Cached(Str(options=["DE", "FR", "US"]), maxsize=100)
+        >>> schema("US")
+        'US'
+        >>> schema("US")
+        'US'
+        >>> schema.cache_info()
+        CacheInfo(hits=1, misses=1, bypasses=0, maxsize=100, currsize=1)
+
+    :param Validator validator:
+        validator to cache results of.
+
+    :param int maxsize:
+        maximum number of cached values,
+        the least recently used ones are evicted.
+
+    :param float ttl:
+        time to live of cached values in seconds.
+
+    :param bool cache_errors:
+        cache validation errors too.
+
+    """
+
+    __slots__ = ("validator", "maxsize", "ttl", "cache_errors")
+
+    cdef abstract.Validator _validator
+    cdef Py_ssize_t _maxsize
+    cdef object _ttl
+    cdef bint _cache_errors
+    cdef object _cache
+    cdef object _lock
+    cdef Py_ssize_t _hits
+    cdef Py_ssize_t _misses
+    cdef Py_ssize_t _bypasses
+    cdef bint _bypass
+
+    @property
+    def validator(self):
+        return self._validator
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    @property
+    def cache_errors(self):
+        return self._cache_errors
+
+    def __init__(
+        self,
+        validator,
+        maxsize=1024,
+        ttl=None,
+        cache_errors=False,
+        alias=None,
+        replace=False,
+    ):
+        validator = contracts.expect(
+            self, "validator", validator, types=abstract.Validator
+        )
+        maxsize = contracts.expect_length(self, "maxsize", maxsize)
+        ttl = contracts.expect(
+            self, "ttl", ttl, nullable=True, types=(int, float), not_types=bool
+        )
+        cache_errors = contracts.expect_flag(self, "cache_errors", cache_errors)
+
+        self._validator = validator
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._cache_errors = cache_errors
+
+        # Cache maps frozen values to ``(expires, copier, error)`` entries,
+        # and its order is the order of usage,
+        # the lock guards the cache and its statistics.
+        self._cache = OrderedDict()
+        self._lock = Lock()
+        self._bypass = memo.depends_on_time(validator)
+
+        self._register(alias, replace)
+
+    def __call__(self, value, __context=None):
+        if not self._bypass:
+            try:
+                key = _freeze(value)
+            except TypeError:
+                pass
+            else:
+                return self._cached_call(key, value, __context)
+        with self._lock:
+            self._bypasses += 1
+        return self._validator(value, __context)
+
+    cdef _cached_call(self, key, value, context):
+        cdef tuple entry
+        # Lookup and update of the cache are locked, but validation is not,
+        # so concurrent misses of the same key just validate the value twice
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is not None and (entry[0] is None or entry[0] > memo.clock()):
+                self._cache[key] = entry  # Mark as the most recently used
+                self._hits += 1
+            else:
+                entry = None
+                self._misses += 1
+        if entry is not None:
+            if entry[2] is not None:
+                raise deepcopy(entry[2])
+            return entry[1]()
+
+        expires = None if self._ttl is None else memo.clock() + self._ttl
+        try:
+            result = self._validator(value, context)
+        except exc.ValidationError as e:
+            if self._cache_errors:
+                self._store(key, (expires, None, deepcopy(e)))
+            raise
+        copier = memo.copier(result)
+        self._store(key, (expires, copier, None))
+        return copier()
+
+    cdef void _store(self, key, tuple entry) except *:
+        cache = self._cache
+        with self._lock:
+            cache[key] = entry
+            while len(cache) > self._maxsize:
+                cache.popitem(last=False)
+
+    def cache_info(self):
+        """
+        Get cache statistics.
+
+        :returns:
+            named tuple
+            ``CacheInfo(hits, misses, bypasses, maxsize, currsize)``,
+            where ``bypasses`` is number of values validated without cache.
+
+        """
+        with self._lock:
+            return memo.CacheInfo(
+                self._hits,
+                self._misses,
+                self._bypasses,
+                self._maxsize,
+                len(self._cache),
+            )
+
+    def cache_clear(self):
+        """Clear cache and its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._bypasses = 0
+
+
+cdef object _freeze(object value):
+    # Typed version of ``memo.freeze``, see its docstring for details
+    cdef type kind = type(value)
+    if kind in _scalars:
+        return kind, value
+    if kind is list or kind is tuple:
+        return kind, tuple([_freeze(item) for item in value])
+    if kind is dict:
+        return kind, tuple([(_freeze(key), _freeze(item)) for key, item in value.items()])
+    if kind is set or kind is frozenset:
+        return kind, frozenset([_freeze(item) for item in value])
+    raise TypeError("Value of type %r is not cacheable" % kind)
+
+
+cdef class Lazy(abstract.Validator):
+    """
+    Lazy Validator
+
+    It validates type, keys, and length of dict immediately,
+    and returns read-only mapping,
+    that validates each value on first access,
+    see :mod:`validx.lazy`.
+    It pays off, when only a few values of large dict are used.
+
+
+    :param Dict validator:
+        validator of dict.
+
+    :raises ValidationError:
+        errors of type, keys, and length, raised by the validator.
+
+    """
+
+    __slots__ = ("validator",)
+
+    cdef object _validator
+
+    @property
+    def validator(self):
+        return self._validator
+
+    def __init__(self, validator, alias=None, replace=False):
+        self._validator = contracts.expect(self, "validator", validator, types=Dict)
+        self._register(alias, replace)
+
+    def __call__(self, value, __context=None):
+        return lazy.validate(self._validator, value, __context)
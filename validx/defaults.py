@@ -0,0 +1,112 @@
+"""
+Default Values
+
+Default values of :class:`validx.py.Dict` validator
+are classified once on validator initialization:
+
+*   callables are called to get a value;
+*   immutable values (numbers, strings, dates,
+    tuples and frozensets of immutable values, etc)
+    are used as is;
+*   lists, dicts, sets, and byte arrays are copied by specialized copiers,
+    which are built for each default value;
+*   other values fall back to :func:`copy.deepcopy`.
+
+So that filling missing keys does not go through :func:`copy.deepcopy`
+in the most cases.
+
+"""
+
+from copy import deepcopy
+from datetime import date, time, datetime, timedelta
+from decimal import Decimal
+from fractions import Fraction
+from functools import partial
+from uuid import UUID
+
+from .compat.types import chars
+
+__all__ = ["factory", "immutable"]
+
+
+NoneType = type(None)
+
+_scalars = frozenset(
+    [NoneType, bool, int, float, complex, Decimal, Fraction, UUID]
+    + [date, time, datetime, timedelta]
+    + list(chars)
+)
+
+
+class _Recursion(Exception):
+    pass
+
+
+def immutable(value):
+    """
+    Check, whether the value is immutable
+
+    :returns:
+        ``True`` if the value is a scalar of known immutable type,
+        or tuple (frozenset) of immutable values.
+
+    """
+    if type(value) in _scalars:
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(immutable(item) for item in value)
+    return False
+
+
+def factory(default):
+    """
+    Make function, that returns default value
+
+    :param default:
+        default value or callable, that returns default value.
+
+    :returns:
+        function without arguments,
+        that returns a fresh copy of default value on each call.
+
+    """
+    if callable(default):
+        return default
+    try:
+        return _copier(default, set())
+    except _Recursion:
+        return partial(deepcopy, default)
+
+
+def _identity(value):
+    return value
+
+
+def _copier(value, memo):
+    if immutable(value):
+        return partial(_identity, value)
+    kind = type(value)
+    if kind in (set, bytearray):
+        # Items of sets and content of byte arrays are immutable
+        return partial(kind, value)
+    if kind not in (list, tuple, dict):
+        return partial(deepcopy, value)
+    if id(value) in memo:
+        raise _Recursion()
+    memo.add(id(value))
+    if kind is dict:
+        if all(immutable(item) for item in value.values()):
+            result = partial(dict, value)
+        else:
+            items = [(key, _copier(item, memo)) for key, item in value.items()]
+            result = lambda: {key: item() for key, item in items}
+    elif kind is list and all(immutable(item) for item in value):
+        result = partial(list, value)
+    elif kind is list:
+        items = [_copier(item, memo) for item in value]
+        result = lambda: [item() for item in items]
+    else:
+        items = [_copier(item, memo) for item in value]
+        result = lambda: tuple([item() for item in items])
+    memo.discard(id(value))
+    return result
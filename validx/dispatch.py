@@ -0,0 +1,218 @@
+"""
+Dispatch of OneOf Steps
+
+Validator :class:`validx.py.OneOf` analyzes its steps once
+on initialization, and builds a dispatch table,
+that maps a value to the steps, which can accept it:
+
+*   by type of the value,
+    e.g. ``Int`` step cannot accept a string,
+    and ``Dict`` step cannot accept a list;
+*   and for ``Dict`` steps by value of a discriminator key,
+    that is constrained by ``Const`` validator,
+    or by ``options`` of ``Str``, ``Int``, or ``Type`` validator.
+    The key is passed explicitly,
+    or detected as the first key of the first ``Dict`` step,
+    that is constrained by all ``Dict`` steps.
+
+Only candidate steps are tried in order,
+so the first succeeded step is the same,
+as if all steps were tried sequentially.
+If all candidates fail, the other steps are called as well,
+so that errors are the same as well.
+
+Custom validators, subclasses of built-in ones,
+and validators, which coerce values, can accept any value,
+so they are always tried.
+
+..  testsetup:: dispatch
+
+    from validx import Dict, Int, Str, Const
+    from validx.dispatch import build
+
+..  doctest:: dispatch
+
+    >>> table = build([
+    ...     Int(),
+    ...     Dict({"type": Const("point"), "x": Int(), "y": Int()}),
+    ...     Dict({"type": Const("circle"), "r": Int()}),
+    ...     Str(),
+    ... ])
+    >>> table.key
+    'type'
+    >>> table(1)
+    (0,)
+    >>> table({"type": "circle", "r": 1})
+    (2,)
+    >>> table({"r": 1})
+    (1, 2)
+
+"""
+
+from .compat.colabc import Mapping
+from .compiler import _kind
+from .introspection import accepts, unwrap
+
+__all__ = ["build", "detect", "Table"]
+
+
+# Maximum number of value types cached by a single table
+MAX_TYPES = 256
+
+_missing = object()
+
+
+def build(steps, discriminator=None):
+    """
+    Build dispatch table of steps
+
+    :param iterable steps:
+        steps of ``OneOf`` validator.
+
+    :param str discriminator:
+        discriminator key of ``Dict`` steps,
+        it is detected by :func:`detect`, if not specified.
+
+    :returns:
+        :class:`Table` or ``None``,
+        if the table cannot narrow down steps to try.
+
+    """
+    if discriminator is None:
+        discriminator = detect(steps)
+    table = Table(steps, discriminator)
+    if len(set(table.accepts)) < 2 and not any(tags is not None for tags in table.tags):
+        return None
+    return table
+
+
+def detect(steps):
+    """
+    Detect discriminator key of ``Dict`` steps
+
+    :returns:
+        the first key of the first ``Dict`` step,
+        that is constrained by all ``Dict`` steps,
+        and that tells at least two of them apart,
+        or ``None``, if there is no such key,
+        or there are less than two ``Dict`` steps.
+
+    """
+    dicts = [unwrap(step) for step in steps]
+    dicts = [step for step in dicts if _kind(step) == "Dict"]
+    if len(dicts) < 2 or dicts[0].schema is None:
+        return None
+    for key in dicts[0].schema:
+        tags = [_tags(step, key) for step in dicts]
+        if None not in tags and len(set(tags)) > 1:
+            return key
+    return None
+
+
+class Table(object):
+    """
+    Dispatch Table
+
+    :param iterable steps:
+        steps of ``OneOf`` validator.
+
+    :param str key:
+        discriminator key of ``Dict`` steps.
+
+    Calling the table with a value returns tuple of indexes of steps,
+    which can accept the value.
+
+    """
+
+    def __init__(self, steps, key=None):
+        self.key = key
+        self.accepts = tuple(accepts(step) for step in steps)
+        self.tags = tuple(None if key is None else _tags(step, key) for step in steps)
+        self._types = {}
+
+    def __call__(self, value):
+        try:
+            candidates, tagged, untagged = self._types[type(value)]
+        except KeyError:
+            candidates, tagged, untagged = self._add(type(value))
+        if tagged is None:
+            return candidates
+        # ``get()`` doesn't trigger ``__missing__`` of ``defaultdict``
+        tag = value.get(self.key, _missing)
+        if tag is _missing:
+            return candidates
+        try:
+            return tagged.get(tag, untagged)
+        except TypeError:  # Unhashable tag
+            return candidates
+
+    def _add(self, kind):
+        # Returns ``(candidates, tagged, untagged)`` entry of value type,
+        # where ``tagged`` maps discriminator values to candidates
+        candidates = tuple(
+            num
+            for num, accepts in enumerate(self.accepts)
+            if accepts is None
+            or (issubclass(kind, accepts[0]) and not issubclass(kind, accepts[1]))
+        )
+        # Discriminator is looked up only in mappings,
+        # values of other types, e.g. ``None`` accepted by nullable ``Dict``,
+        # are dispatched by type only
+        tagged = untagged = None
+        if issubclass(kind, Mapping) and any(
+            self.tags[num] is not None for num in candidates
+        ):
+            tagged = {}
+            for num in candidates:
+                for tag in self.tags[num] or ():
+                    tagged[tag] = tuple(
+                        other
+                        for other in candidates
+                        if self.tags[other] is None or tag in self.tags[other]
+                    )
+            untagged = tuple(num for num in candidates if self.tags[num] is None)
+        entry = candidates, tagged, untagged
+        if len(self._types) < MAX_TYPES:
+            self._types[kind] = entry
+        return entry
+
+
+def _tags(validator, key):
+    # Returns frozenset of values of discriminator key,
+    # that can be accepted by ``Dict`` validator,
+    # or ``None`` if the key is not constrained
+    validator = unwrap(validator)
+    if _kind(validator) != "Dict" or validator.schema is None:
+        return None
+    if key not in validator.schema:
+        return None
+    if validator.dispose is not None and key in validator.dispose:
+        return None
+    if validator.multikeys is not None and key in validator.multikeys:
+        return None
+    return _options(validator.schema[key])
+
+
+def _options(validator):
+    # Returns frozenset of values accepted by validator,
+    # or ``None`` if they are not limited
+    validator = unwrap(validator)
+    kind = _kind(validator)
+    if kind == "Const":
+        values = [validator.value]
+    elif kind in ("Str", "Int", "Type") and validator.options is not None:
+        if kind == "Str" and validator.encoding is not None:
+            return None  # Bytes are decoded before check of options
+        if kind in ("Int", "Type") and validator.coerce:
+            return None
+        values = list(validator.options)
+        if validator.nullable:
+            values.append(None)
+    elif kind == "Cached":
+        return _options(validator.validator)
+    else:
+        return None
+    try:
+        return frozenset(values)
+    except TypeError:  # Unhashable constant
+        return None
@@ -1,26 +1,61 @@
-from .errors import (
-    ValidationError,
-    ConditionError,
-    InvalidTypeError,
-    OptionsError,
-    MinValueError,
-    MaxValueError,
-    FloatValueError,
-    StrDecodeError,
-    MinLengthError,
-    MaxLengthError,
-    TupleLengthError,
-    PatternMatchError,
-    DatetimeParseError,
-    DatetimeTypeError,
-    RecursionMaxDepthError,
-    MappingKeyError,
-    ForbiddenKeyError,
-    MissingKeyError,
-    SchemaError,
-)
-from .markers import Extra, EXTRA_KEY, EXTRA_VALUE, Step
-from .formatter import Formatter, format_error
+try:
+    from .cy import (
+        __impl__,
+        ValidationError,
+        ConditionError,
+        InvalidTypeError,
+        OptionsError,
+        MinValueError,
+        MaxValueError,
+        FloatValueError,
+        StrDecodeError,
+        MinLengthError,
+        MaxLengthError,
+        TupleLengthError,
+        PatternMatchError,
+        DatetimeParseError,
+        DatetimeTypeError,
+        RecursionMaxDepthError,
+        MappingKeyError,
+        ForbiddenKeyError,
+        MissingKeyError,
+        SchemaError,
+        Extra,
+        EXTRA_KEY,
+        EXTRA_VALUE,
+        Step,
+        Formatter,
+        format_error,
+    )
+except ImportError:  # pragma: no cover
+    from .py import (  # type: ignore
+        __impl__,
+        ValidationError,
+        ConditionError,
+        InvalidTypeError,
+        OptionsError,
+        MinValueError,
+        MaxValueError,
+        FloatValueError,
+        StrDecodeError,
+        MinLengthError,
+        MaxLengthError,
+        TupleLengthError,
+        PatternMatchError,
+        DatetimeParseError,
+        DatetimeTypeError,
+        RecursionMaxDepthError,
+        MappingKeyError,
+        ForbiddenKeyError,
+        MissingKeyError,
+        SchemaError,
+        Extra,
+        EXTRA_KEY,
+        EXTRA_VALUE,
+        Step,
+        Formatter,
+        format_error,
+    )
 
 
 __all__ = [
@@ -50,3 +85,12 @@ __all__ = [
     "Formatter",
     "format_error",
 ]
+
+__impl__ = __impl__
+
+# Expose classes by the package name regardless of implementation,
+# so that tracebacks and pickled errors do not depend on it.
+for _name in __all__:
+    _obj = globals()[_name]
+    if isinstance(_obj, type):
+        _obj.__module__ = __name__
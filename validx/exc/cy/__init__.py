@@ -0,0 +1,54 @@
+from .errors import (
+    ValidationError,
+    ConditionError,
+    InvalidTypeError,
+    OptionsError,
+    MinValueError,
+    MaxValueError,
+    FloatValueError,
+    StrDecodeError,
+    MinLengthError,
+    MaxLengthError,
+    TupleLengthError,
+    PatternMatchError,
+    DatetimeParseError,
+    DatetimeTypeError,
+    RecursionMaxDepthError,
+    MappingKeyError,
+    ForbiddenKeyError,
+    MissingKeyError,
+    SchemaError,
+)
+from .markers import Extra, EXTRA_KEY, EXTRA_VALUE, Step
+from .formatter import Formatter, format_error
+
+
+__impl__ = "Cython"
+
+__all__ = [
+    "ValidationError",
+    "ConditionError",
+    "InvalidTypeError",
+    "OptionsError",
+    "MinValueError",
+    "MaxValueError",
+    "FloatValueError",
+    "StrDecodeError",
+    "MinLengthError",
+    "MaxLengthError",
+    "TupleLengthError",
+    "PatternMatchError",
+    "DatetimeParseError",
+    "DatetimeTypeError",
+    "RecursionMaxDepthError",
+    "MappingKeyError",
+    "ForbiddenKeyError",
+    "MissingKeyError",
+    "SchemaError",
+    "Extra",
+    "EXTRA_KEY",
+    "EXTRA_VALUE",
+    "Step",
+    "Formatter",
+    "format_error",
+]
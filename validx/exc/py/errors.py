@@ -1,6 +1,6 @@
 from collections import deque
 
-from ..compat.colabc import Sequence
+from ...compat.colabc import Sequence
 
 
 class ValidationError(ValueError, Sequence):
@@ -72,15 +72,43 @@ class ValidationError(ValueError, Sequence):
 
     """
 
-    __slots__ = ("context",)
+    # Context is stored as a chain of ``(node, rest)`` pairs,
+    # which is converted to ``deque`` on first access to ``context`` property.
+    # So that failure path does not allocate a deque for each error,
+    # and adding context costs a single tuple.
+    __slots__ = ("_context",)
 
     def __init__(self, context=None, *args, **kw):
-        self.context = context or deque()
+        self._context = context or None
+        if type(context) is tuple:
+            # Tuple of nodes is not mistaken for the chain
+            self._context = deque(context)
         for slot, value in dict(zip(self.__slots__[1:], args), **kw).items():
             setattr(self, slot, value)
-        super(ValidationError, self).__init__(
-            *(getattr(self, slot) for slot in self.__slots__)
-        )
+
+    @property
+    def context(self):
+        context = self._context
+        if context is None:
+            context = self._context = deque()
+        elif type(context) is tuple:
+            nodes = deque()
+            while context is not None:
+                node, context = context
+                nodes.append(node)
+            context = self._context = nodes
+        return context
+
+    @context.setter
+    def context(self, value):
+        self._context = deque(value) if type(value) is tuple else value
+
+    @property
+    def args(self):
+        # Arguments are not passed to ``ValueError.__init__``,
+        # so they are built on access
+        params = tuple(getattr(self, slot) for slot in self.__slots__[1:])
+        return (self.context,) + params
 
     def add_context(self, node):
         """
@@ -112,7 +140,11 @@ class ValidationError(ValueError, Sequence):
             deque(['foo'])
 
         """
-        self.context.appendleft(node)
+        context = self._context
+        if context is None or type(context) is tuple:
+            self._context = (node, context)
+        else:
+            context.appendleft(node)
         return self
 
     def __getitem__(self, index):
@@ -124,13 +156,13 @@ class ValidationError(ValueError, Sequence):
         return 1
 
     def __iter__(self):
-        yield self
+        return iter((self,))
 
     def sort(self, key=None, reverse=False):
         pass
 
     def __repr__(self):
-        if self.context:
+        if self._context:
             return "<%s: %s>" % (self.format_context(), self.format_error())
         else:
             return "<%s>" % self.format_error()
@@ -141,11 +173,17 @@ class ValidationError(ValueError, Sequence):
     def __eq__(self, other):
         if type(self) is not type(other):
             return False
-        for slot in self.__slots__:
+        if self.context != other.context:
+            return False
+        for slot in self.__slots__[1:]:
             if getattr(self, slot) != getattr(other, slot):
                 return False
         return True
 
+    def __reduce__(self):
+        state = dict((slot, getattr(self, slot)) for slot in self.__slots__[1:])
+        return self.__class__, (self.context,), state
+
     def format_context(self):
         def context():
             for node in self.context:
@@ -177,6 +215,13 @@ class ConditionError(ValidationError):
 
     __slots__ = ValidationError.__slots__ + ("expected", "actual")
 
+    def __init__(self, context=None, expected=None, actual=None):
+        self._context = context or None
+        if type(context) is tuple:
+            self._context = deque(context)
+        self.expected = expected
+        self.actual = actual
+
 
 class InvalidTypeError(ConditionError):
     """
@@ -400,8 +445,8 @@ class MappingKeyError(ValidationError):
 
     def __init__(self, context=None, key=None):
         if context is not None and not isinstance(context, deque):
-            context = deque([context])
-        super(MappingKeyError, self).__init__(context)
+            context = (context, None)
+        self._context = context or None
         if key is not None:
             self.add_context(key)
 
@@ -445,8 +490,7 @@ class SchemaError(ValidationError):
         return len(self.errors)
 
     def __iter__(self):
-        for error in self.errors:
-            yield error
+        return iter(self.errors)
 
     def sort(self, key=None, reverse=False):
         if key is None:
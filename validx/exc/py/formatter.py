@@ -1,7 +1,7 @@
 # coding: utf-8
 
 from . import errors
-from ..compat.types import basestr
+from ...compat.types import basestr
 
 
 class Formatter(object):
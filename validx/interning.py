@@ -0,0 +1,181 @@
+"""
+Interning of Validators
+
+Validators are immutable, and they are compared and hashed
+by their parameters,
+so structurally identical validators can be shared.
+While interning is enabled,
+:meth:`validx.py.Validator.load` (and so ``clone()``)
+returns a shared instance for each loaded validator,
+that is equal to a previously loaded one.
+Since nested validators are loaded first,
+identical sub-trees of thousands of schemas
+end up as a single set of instances.
+
+Validators are looked up by their types and types of their parameters,
+so that, for instance, ``Const(True)`` and ``Const(1)``
+are not shared, even though they are equal.
+Validators with alias are not interned,
+because each of them is added into instance registry.
+Neither is :class:`validx.py.Cached` validator,
+because each instance has its own cache.
+
+Interned validators are kept in process-wide table
+until :func:`clear` is called.
+
+..  testsetup:: interning
+
+    from validx import Validator, interning
+
+..  testcleanup:: interning
+
+    interning.disable()
+    interning.clear()
+
+..  doctest:: interning
+
+    >>> interning.enable()
+    >>> schemas = [
+    ...     Validator.load({
+    ...         "__class__": "Dict",
+    ...         "schema": {
+    ...             "id": {"__class__": "Int", "min": 0},
+    ...             "name": {"__class__": "Str", "maxlen": 255},
+    ...         },
+    ...     })
+    ...     for _ in range(100)
+    ... ]
+    >>> schemas[0] is schemas[99]
+    True
+    >>> info = interning.report()
+    >>> info.lookups, info.hits, info.currsize
+    (300, 297, 3)
+    >>> info.saved > 0
+    True
+
+"""
+
+import sys
+from collections import namedtuple
+from threading import Lock
+
+from .compat.colabc import Mapping
+from .compat.types import chars
+from .compiler import _kind
+
+__all__ = ["enable", "disable", "enabled", "intern", "report", "clear"]
+
+
+InternInfo = namedtuple("InternInfo", ["lookups", "hits", "currsize", "saved"])
+
+_lock = Lock()
+_table = {}  # type: dict
+_stats = {"enabled": False, "lookups": 0, "hits": 0, "saved": 0}
+
+
+def enable():
+    """Enable interning of loaded validators."""
+    _stats["enabled"] = True
+
+
+def disable():
+    """Disable interning of loaded validators."""
+    _stats["enabled"] = False
+
+
+def enabled():
+    """Check, whether interning of loaded validators is enabled."""
+    return _stats["enabled"]
+
+
+def intern(validator):
+    """
+    Get shared instance of validator
+
+    :param Validator validator:
+        validator to intern.
+
+    :returns:
+        previously interned validator, that is equal to the passed one,
+        or the passed validator itself,
+        which is interned for subsequent calls.
+
+    """
+    if _kind(validator) == "Cached":
+        return validator
+    try:
+        key = _key(validator)
+    except TypeError:  # Unhashable parameter
+        return validator
+    with _lock:
+        _stats["lookups"] += 1
+        shared = _table.setdefault(key, validator)
+        if shared is not validator:
+            _stats["hits"] += 1
+            _stats["saved"] += _sizeof(validator)
+        return shared
+
+
+def report():
+    """
+    Get interning statistics.
+
+    :returns:
+        named tuple ``InternInfo(lookups, hits, currsize, saved)``,
+        where ``hits`` is number of validators replaced by shared ones,
+        ``currsize`` is number of interned validators,
+        and ``saved`` is approximate size in bytes
+        of the replaced validators.
+
+    """
+    with _lock:
+        return InternInfo(
+            _stats["lookups"], _stats["hits"], len(_table), _stats["saved"]
+        )
+
+
+def clear():
+    """Clear table of interned validators and its statistics."""
+    with _lock:
+        _table.clear()
+        _stats["lookups"] = 0
+        _stats["hits"] = 0
+        _stats["saved"] = 0
+
+
+def _key(value):
+    # Hashable key, that tells apart equal values of different types,
+    # e.g. ``True`` and ``1``, at any level of nesting
+    if hasattr(value, "params"):
+        return type(value), tuple((slot, _key(item)) for slot, item in value.params())
+    if isinstance(value, Mapping):
+        return (
+            type(value),
+            frozenset((_key(key), _key(item)) for key, item in value.items()),
+        )
+    if isinstance(value, (tuple, list)):
+        return type(value), tuple(_key(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_key(item) for item in value)
+    hash(value)
+    return type(value), value
+
+
+def _sizeof(validator):
+    # Size of instance and containers of its parameters,
+    # nested validators are interned on their own, so they are not counted
+    return sys.getsizeof(validator) + sum(
+        _sizeof_param(value) for slot, value in validator.params()
+    )
+
+
+def _sizeof_param(value):
+    if hasattr(value, "params") or isinstance(value, chars):
+        return 0
+    if isinstance(value, Mapping):
+        return sys.getsizeof(value) + sum(
+            _sizeof_param(item) for item in value.values()
+        )
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return sys.getsizeof(value) + sum(_sizeof_param(item) for item in value)
+    return 0
@@ -0,0 +1,120 @@
+"""
+Introspection of Validators
+
+Helpers shared by modules, which walk validator trees
+instead of calling validators, such as :mod:`validx.dispatch`,
+:mod:`validx.patch`, and JSON decoders of :mod:`validx.json`.
+
+"""
+
+from array import array as _array
+
+from . import arrays
+from .compat.colabc import Sequence, Mapping
+from .compat.types import chars, string
+from .compiler import _kind
+
+__all__ = ["accepts", "registry", "unwrap"]
+
+
+NoneType = type(None)
+
+
+def unwrap(validator):
+    """
+    Get original validator of profiler probe
+
+    :param Validator validator:
+        validator, that can be a probe of :mod:`validx.profiler`.
+
+    :returns:
+        original validator of the probe, or the validator itself.
+
+    Probes of profiler are transparent,
+    so that profiled ``OneOf`` tries the same steps as the original one.
+
+    """
+    from .profiler import Probe
+
+    if isinstance(validator, Probe):
+        return validator._validator
+    return validator
+
+
+def accepts(validator):
+    """
+    Get types of values accepted by validator
+
+    :param Validator validator:
+        validator to inspect.
+
+    :returns:
+        pair ``(types, excluded)``,
+        where value is accepted if it is an instance of ``types``,
+        but not of ``excluded``,
+        or ``None`` if the validator can accept value of any type,
+        see ``__call__`` of the validators.
+
+    """
+    validator = unwrap(validator)
+    kind = _kind(validator)
+    excluded = ()
+    if kind in ("Int", "Float"):
+        if validator.coerce:
+            return None
+        types = (int, float)
+    elif kind == "Str":
+        types = (string,) if validator.encoding is None else (string, bytes)
+    elif kind == "Bytes":
+        if validator.buffer:
+            return None
+        types = (bytes,)
+    elif kind == "Bool":
+        types = (bool,)
+        if validator.coerce_str:
+            types += (string,)
+        if validator.coerce_int:
+            types += (int,)
+    elif kind == "List":
+        types = (list, tuple, Sequence)
+        if arrays.numpy is not None:
+            types += (arrays.numpy.ndarray, _array, memoryview)
+        excluded = chars
+    elif kind == "Tuple":
+        types = (list, tuple, Sequence)
+        excluded = chars
+    elif kind == "Dict":
+        types = (dict, Mapping)
+    elif kind == "Type":
+        if validator.coerce:
+            return None
+        types = (validator.tp,)
+    elif kind == "AllOf":
+        return accepts(validator.steps[0])
+    elif kind in ("Cached", "Lazy"):
+        return accepts(validator.validator)
+    else:
+        return None
+    if validator.nullable:
+        types += (NoneType,)
+    return types, excluded
+
+
+def registry(validator):
+    """
+    Get instance registry of the same implementation as validator
+
+    :param Validator validator:
+        validator of ``validx.py`` or ``validx.cy`` package.
+
+    :returns:
+        ``validx.py.instances`` or ``validx.cy.instances`` module.
+
+    """
+    from . import py
+
+    if isinstance(validator, py.Validator):
+        return py.instances
+    from . import cy
+
+    return cy.instances
@@ -0,0 +1,65 @@
+"""
+Validation of JSON Documents
+
+Function :func:`loads` parses JSON document and validates it in one pass,
+that is driven by the validator tree,
+instead of building the whole document by :func:`json.loads`
+and walking it again by the validator.
+
+``Dict`` and ``List`` validators, and ``LazyRef`` ones referring to them,
+are walked through, so that:
+
+*   a value of a forbidden or disposed key,
+    and a container, which type is not accepted by its validator,
+    are skipped without building it;
+*   a string, that is longer than ``maxlen`` of its ``Str`` validator,
+    is rejected without decoding it;
+*   a list is rejected as soon as number of its items exceeds ``maxlen``,
+    like :meth:`validx.py.List.iter_validate` does,
+    and a dict is rejected as soon as number of its keys exceeds ``maxlen``;
+*   a container with ``fail_fast`` flag stops parsing on the first error,
+    and the rest of the document is not parsed,
+    unless an outer container needs to continue.
+
+Any other value is parsed by the scanner of :mod:`json`,
+and validated by its validator as a whole.
+Errors are the same, as ``validator(json.loads(data))`` raises,
+except early rejected lists and dicts,
+and dicts with duplicate keys, whose values are validated one by one.
+Skipped values are checked only for balanced brackets and closed strings,
+and if the document is rejected early,
+the rest of it is not checked at all.
+
+..  testsetup:: json
+
+    from validx import Dict, List, Int, Str
+    from validx.json import loads
+
+..  doctest:: json
+
+    >>> schema = Dict({"id": Int(), "tags": List(Str(maxlen=8), maxlen=2)})
+    >>> loads(schema, b'{"id": 1, "tags": ["a", "b"]}') == {"id": 1, "tags": ["a", "b"]}
+    True
+    >>> loads(schema, b'{"id": 1, "tags": ["a", "b", "c", "d"]}')
+    Traceback (most recent call last):
+        ...
+    validx.exc.SchemaError: <SchemaError(errors=[
+        <tags: MaxLengthError(expected=2, actual=3)>
+    ])>
+    >>> loads(schema, b'{"id": {"x": [1, 2, 3]}, "tags": ["abcdefghi"], "x": []}')
+    Traceback (most recent call last):
+        ...
+    validx.exc.SchemaError: <SchemaError(errors=[
+        <id: InvalidTypeError(expected=<class 'int'>, actual=<class 'dict'>)>,
+        <tags.0: MaxLengthError(expected=8, actual=9)>,
+        <x: ForbiddenKeyError()>
+    ])>
+
+"""
+
+try:
+    from .cy.decoder import loads
+except ImportError:  # pragma: no cover
+    from .py.decoder import loads  # type: ignore
+
+__all__ = ["loads"]
@@ -0,0 +1,253 @@
+"""
+Lazy Validation
+
+Validator :class:`validx.py.Lazy` validates shape of a dict immediately,
+i.e. its type, keys, and length,
+and returns read-only mapping :class:`LazyDict`,
+that validates each value on first access, and memoizes the result.
+Values validated by ``Dict`` validators are lazy dicts too,
+so a handler, that reads a couple of fields from a huge document,
+validates only these fields.
+
+Errors of values are raised on access as :class:`validx.exc.SchemaError`
+with context relative to the lazy validator,
+i.e. the same context, that the errors have,
+when the dict is validated as a whole.
+Failed values are not memoized,
+so each access raises the error again.
+
+..  testsetup:: lazy
+
+    from validx import Lazy, Dict, List, Int, Str
+
+..  doctest:: lazy
+
+    >>> schema = Lazy(Dict({
+    ...     "id": Int(),
+    ...     "user": Dict({"name": Str(), "age": Int(min=0)}),
+    ...     "tags": List(Str()),
+    ... }))
+    >>> event = schema({
+    ...     "id": 1,
+    ...     "user": {"name": "Alice", "age": -1},
+    ...     "tags": ["a", "b"],
+    ... })
+    >>> event["id"]
+    1
+    >>> event["user"]["name"]
+    'Alice'
+    >>> event["user"]["age"]
+    Traceback (most recent call last):
+        ...
+    validx.exc.SchemaError: <SchemaError(errors=[
+        <user.age: MinValueError(expected=0, actual=-1)>
+    ])>
+
+    >>> schema({"id": 1, "tags": []})
+    Traceback (most recent call last):
+        ...
+    validx.exc.SchemaError: <SchemaError(errors=[
+        <user: MissingKeyError()>
+    ])>
+
+"""
+
+from . import exc
+from .compat.colabc import Mapping
+from .compiler import _kind
+
+__all__ = ["validate", "LazyDict"]
+
+
+def validate(validator, value, context=None):
+    """
+    Validate shape of value
+
+    :param Dict validator:
+        validator of the value.
+
+    :param value:
+        value to validate.
+
+    :param dict context:
+        validation context,
+        it is kept by the result to validate values on access.
+
+    :returns:
+        :class:`LazyDict` or ``None``,
+        if the value is ``None`` and the validator is nullable.
+
+    :raises ValidationError:
+        the same errors of type, keys and length,
+        as the validator raises.
+
+    """
+    if context is None:
+        context = {}
+    return _validate_shape(validator, value, context, ())
+
+
+def _validate_shape(validator, value, context, path):
+    # See ``Dict.__call__``, values are stored into ``LazyDict`` as is,
+    # along with their validators
+    if value is None and validator.nullable:
+        return value
+    if not isinstance(value, (dict, Mapping)):
+        raise exc.InvalidTypeError(expected=Mapping, actual=type(value))
+
+    schema = validator.schema
+    extra = validator.extra
+    dispose = validator.dispose
+    multikeys = validator.multikeys
+    fail_fast = validator.fail_fast
+
+    pending = {}
+    errors = []
+    getall = None
+    if multikeys is not None:
+        # See ``Dict.__call__`` for supported multidict interfaces
+        getall = getattr(value, "getall", None) or getattr(value, "getlist", None)
+
+    for key, val in value.items():
+        if dispose is not None and key in dispose:
+            continue
+        if getall is not None and key in multikeys:
+            val = getall(key)
+        if schema is not None and key in schema:
+            pending[key] = (schema[key], val, None)
+        elif extra is not None:
+            try:
+                key = extra[0](key, context)
+            except exc.ValidationError as e:
+                errors.extend(e.add_context(exc.EXTRA_KEY).add_context(key))
+                if fail_fast:
+                    break
+                continue
+            pending[key] = (extra[1], val, exc.EXTRA_VALUE)
+        else:
+            errors.append(exc.ForbiddenKeyError(key))
+            if fail_fast:
+                break
+
+    if not (errors and fail_fast):
+        # Factories of default values are built on ``Dict`` initialization,
+        # see ``_missing_keys()`` in ``validx.py.containers``
+        for key, item, default in validator._missing:
+            if key in pending:
+                continue
+            if default is not None:
+                pending[key] = (item, default(), None)
+            else:
+                errors.append(exc.MissingKeyError(key))
+                if fail_fast:
+                    break
+
+    if errors:
+        raise exc.SchemaError(errors)
+
+    length = len(pending)
+    if validator.minlen is not None and length < validator.minlen:
+        raise exc.MinLengthError(expected=validator.minlen, actual=length)
+    if validator.maxlen is not None and length > validator.maxlen:
+        raise exc.MaxLengthError(expected=validator.maxlen, actual=length)
+
+    return LazyDict(pending, context, path)
+
+
+class LazyDict(Mapping):
+    """
+    Read-only Mapping of Lazily Validated Values
+
+    It is returned by :class:`validx.py.Lazy` validator,
+    and should not be created directly.
+    Checks of keys, i.e. ``in`` operator, ``len()`` and iteration,
+    don't validate values.
+    Access to values, including ``items()``, ``values()``,
+    and comparison, validates them.
+
+    """
+
+    __slots__ = ("_pending", "_result", "_context", "_path")
+
+    def __init__(self, pending, context, path):
+        # Pending maps keys to ``(validator, raw value, marker)``,
+        # where marker is additional node of error context
+        self._pending = pending
+        self._result = {}
+        self._context = context
+        self._path = path
+
+    def __getitem__(self, key):
+        try:
+            return self._result[key]
+        except KeyError:
+            pass
+        validator, value, marker = self._pending[key]
+        try:
+            value = self._validate(validator, value, key, marker)
+        except exc.ValidationError as e:
+            if marker is not None:
+                e = e.add_context(marker)
+            e = e.add_context(key)
+            for node in reversed(self._path):
+                e = e.add_context(node)
+            raise exc.SchemaError(list(e))
+        self._result[key] = value
+        return value
+
+    def _validate(self, validator, value, key, marker):
+        # Nested dicts are validated lazily too,
+        # their path includes marker, as the context of errors above does
+        kind = _kind(validator)
+        if kind == "Lazy":
+            validator = validator.validator
+            kind = "Dict"
+        if kind == "Dict":
+            path = self._path + ((key,) if marker is None else (key, marker))
+            return _validate_shape(validator, value, self._context, path)
+        return validator(value, self._context)
+
+    def __contains__(self, key):
+        return key in self._pending
+
+    def __iter__(self):
+        return iter(self._pending)
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __repr__(self):
+        items = []
+        for key in self._pending:
+            if key in self._result:
+                items.append("%r: %r" % (key, self._result[key]))
+            else:
+                items.append("%r: ..." % (key,))
+        return "<LazyDict({%s})>" % ", ".join(items)
+
+    def resolve(self):
+        """
+        Validate all values.
+
+        :returns:
+            dict of validated values,
+            where nested lazy dicts are resolved too.
+
+        :raises SchemaError:
+            with errors of all invalid values.
+
+        """
+        result = {}
+        errors = []
+        for key in self._pending:
+            try:
+                value = self[key]
+                if isinstance(value, LazyDict):
+                    value = value.resolve()
+            except exc.SchemaError as e:
+                errors.extend(e)
+                continue
+            result[key] = value
+        if errors:
+            raise exc.SchemaError(errors)
+        return result
@@ -0,0 +1,110 @@
+"""
+Memoization Helpers
+
+Helpers of :class:`validx.py.Cached` validator.
+
+Values are turned into cache keys by :func:`freeze`.
+Type of each value is a part of its key,
+so that ``1``, ``1.0``, and ``True`` are cached separately:
+
+*   scalars of known immutable types (numbers, strings, dates, etc)
+    are used as is;
+*   lists, tuples, and dicts are converted into tuples of frozen items,
+    keeping their order, so that results and errors of the cached
+    validator keep the order too;
+*   sets and frozensets are converted into frozensets of frozen items;
+*   any other value is not cacheable,
+    because it can be mutated behind cache back.
+
+Results are stored as copiers, see :mod:`validx.defaults`,
+so that each call of the cached validator returns a fresh copy,
+and the caller can safely mutate it.
+
+"""
+
+import time
+from collections import namedtuple
+from copy import deepcopy
+from functools import partial
+
+from .compat.colabc import Mapping
+from .defaults import factory, _scalars
+
+__all__ = ["freeze", "copier", "depends_on_time", "clock", "CacheInfo"]
+
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "bypasses", "maxsize", "currsize"]
+)
+
+
+# Clock of cache entries expiration,
+# Python 2.7 has no ``time.monotonic``
+clock = getattr(time, "monotonic", time.time)
+
+
+def freeze(value):
+    """
+    Make cache key of value
+
+    :raises TypeError:
+        if the value is not cacheable.
+
+    """
+    kind = type(value)
+    if kind in _scalars:
+        return kind, value
+    if kind in (list, tuple):
+        return kind, tuple([freeze(item) for item in value])
+    if kind is dict:
+        return kind, tuple([(freeze(key), freeze(item)) for key, item in value.items()])
+    if kind in (set, frozenset):
+        return kind, frozenset([freeze(item) for item in value])
+    raise TypeError("Value of type %r is not cacheable" % kind)
+
+
+def copier(value):
+    """
+    Make function, that returns a fresh copy of value
+
+    Unlike :func:`validx.defaults.factory`,
+    callable values are copied rather than called.
+
+    """
+    if callable(value):
+        return partial(deepcopy, value)
+    return factory(value)
+
+
+def depends_on_time(validator):
+    """
+    Check, whether results of validator depend on current time
+
+    :returns:
+        ``True`` if the validator or any of its nested validators
+        has ``relmin`` or ``relmax`` parameter,
+        i.e. it is :class:`validx.py.Date` or :class:`validx.py.Datetime`
+        with limits relative to the current date or time.
+
+    """
+    for name, value in validator.params():
+        if name in ("relmin", "relmax"):
+            return True
+        for nested in _validators(value):
+            if depends_on_time(nested):
+                return True
+    return False
+
+
+def _validators(value):
+    # Yields validators nested into parameter value
+    if hasattr(value, "params"):
+        yield value
+    elif isinstance(value, tuple):
+        for item in value:
+            for nested in _validators(item):
+                yield nested
+    elif isinstance(value, Mapping):
+        for item in value.values():
+            for nested in _validators(item):
+                yield nested
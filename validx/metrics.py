@@ -0,0 +1,370 @@
+"""
+Metrics
+
+Function :func:`enable` replaces validators registered in
+:ref:`instance registry <reference-instance-registry>`
+by metered proxies, that report each validation to a sink:
+its duration and error, if any.
+So validators are metered wherever they are resolved by alias,
+i.e. by ``instances.get()``, ``LazyRef``, and ``Validator.load()``,
+without changes of call sites.
+References to validators taken before :func:`enable` are not metered,
+neither are validators registered after it.
+Function :func:`disable` puts the original validators back,
+and makes proxies stop reporting,
+so that references to them, taken while metering is enabled,
+e.g. by loaded schemas, are not metered either.
+
+Sink is any object implementing :class:`Sink` interface.
+The built-in one, :class:`Aggregator`, collects counters of validations
+and errors by their class, and histogram of latency per alias.
+Each thread writes to its own shard, so no locks are taken on hot path.
+The collected metrics can be dumped in Prometheus text exposition format.
+
+..  testsetup:: metrics
+
+    from validx import Dict, Int, instances
+    from validx.metrics import Aggregator, enable, disable
+
+..  testcleanup:: metrics
+
+    disable()
+    instances.clear()
+
+..  doctest:: metrics
+
+    >>> Dict({"x": Int(min=0)}, alias="point")
+    <Dict(schema=frozendict({'x': <Int(min=0)>}))>
+    >>> sink = Aggregator(buckets=[0.001, 1.0])
+    >>> enable(sink)
+    ['point']
+
+    >>> point = instances.get("point")
+    >>> point({"x": 1})
+    {'x': 1}
+    >>> point({"x": -1})
+    Traceback (most recent call last):
+        ...
+    validx.exc.SchemaError: <SchemaError(errors=[
+        <x: MinValueError(expected=0, actual=-1)>
+    ])>
+
+    >>> print(sink.expose())  # doctest: +ELLIPSIS
+    # HELP validx_validations_total Number of validations.
+    # TYPE validx_validations_total counter
+    validx_validations_total{alias="point"} 2
+    # HELP validx_errors_total Number of validation errors by class.
+    # TYPE validx_errors_total counter
+    validx_errors_total{alias="point",error="MinValueError"} 1
+    # HELP validx_duration_seconds Duration of validation.
+    # TYPE validx_duration_seconds histogram
+    validx_duration_seconds_bucket{alias="point",le="0.001"} 2
+    validx_duration_seconds_bucket{alias="point",le="1.0"} 2
+    validx_duration_seconds_bucket{alias="point",le="+Inf"} 2
+    validx_duration_seconds_sum{alias="point"} ...
+    validx_duration_seconds_count{alias="point"} 2
+
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+
+from . import exc
+from .proxies import Proxy, proxy_class
+
+__all__ = ["Sink", "Aggregator", "enable", "disable"]
+
+
+# Python 2.7 has no ``time.perf_counter``
+_timer = getattr(time, "perf_counter", time.time)
+
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class Sink(object):
+    """
+    Metrics Sink Interface
+
+    Sink receives each validation made by metered validator.
+    It is called on hot path, so it should be as cheap as possible,
+    and it should be safe to call it from multiple threads.
+
+    """
+
+    def observe(self, alias, duration, error):
+        """
+        Observe validation.
+
+        :param str alias:
+            alias of validator.
+
+        :param float duration:
+            duration of validation in seconds.
+
+        :param ValidationError error:
+            raised error or ``None``, if the value is valid.
+
+        """
+        raise NotImplementedError  # pragma: no cover
+
+
+class Aggregator(Sink):
+    """
+    In-process Metrics Aggregator
+
+    :param iterable buckets:
+        upper bounds of latency histogram buckets in seconds,
+        bucket ``+Inf`` is added implicitly.
+        Defaults to ``validx.metrics.DEFAULT_BUCKETS``,
+        which spans from 10 microseconds to 1 second.
+
+    Each error of :class:`validx.exc.SchemaError` is counted,
+    so there can be more errors than failed validations.
+
+    """
+
+    def __init__(self, buckets=None):
+        self.buckets = tuple(sorted(DEFAULT_BUCKETS if buckets is None else buckets))
+        self._local = threading.local()
+        self._shards = []
+
+    def observe(self, alias, duration, error):
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            self._shards.append(shard)
+        stats = shard.get(alias)
+        if stats is None:
+            stats = shard[alias] = _Stats(len(self.buckets) + 1)
+        stats.count += 1
+        stats.sum += duration
+        stats.buckets[bisect_left(self.buckets, duration)] += 1
+        if error is not None:
+            errors = stats.errors
+            for e in error:
+                name = e.__class__.__name__
+                errors[name] = errors.get(name, 0) + 1
+
+    def collect(self):
+        """
+        Merge metrics collected by all threads.
+
+        :returns:
+            dict of ``alias: metrics``,
+            where ``metrics`` is a dict with keys:
+
+            *   ``count`` -- number of validations;
+            *   ``sum`` -- total duration of validations;
+            *   ``buckets`` -- list of ``(upper_bound, count)`` pairs,
+                where ``count`` is cumulative;
+            *   ``errors`` -- dict of error class name to number of errors.
+
+        """
+        merged = {}
+        for shard in list(self._shards):
+            for alias, stats in list(shard.items()):
+                total = merged.get(alias)
+                if total is None:
+                    total = merged[alias] = _Stats(len(self.buckets) + 1)
+                total.count += stats.count
+                total.sum += stats.sum
+                for num, count in enumerate(stats.buckets):
+                    total.buckets[num] += count
+                for name, count in list(stats.errors.items()):
+                    total.errors[name] = total.errors.get(name, 0) + count
+
+        result = OrderedDict()
+        for alias, stats in sorted(merged.items()):
+            cumulative = 0
+            buckets = []
+            for bound, count in zip(self.buckets + (float("inf"),), stats.buckets):
+                cumulative += count
+                buckets.append((bound, cumulative))
+            result[alias] = {
+                "count": stats.count,
+                "sum": stats.sum,
+                "buckets": buckets,
+                "errors": dict(stats.errors),
+            }
+        return result
+
+    def expose(self, prefix="validx"):
+        """
+        Dump metrics in Prometheus text exposition format.
+
+        :param str prefix:
+            prefix of metric names.
+
+        :returns:
+            text of exposition.
+
+        """
+        metrics = self.collect()
+        lines = [
+            "# HELP %s_validations_total Number of validations." % prefix,
+            "# TYPE %s_validations_total counter" % prefix,
+        ]
+        for alias, stats in metrics.items():
+            lines.append(
+                '%s_validations_total{alias="%s"} %d'
+                % (prefix, _escape(alias), stats["count"])
+            )
+        lines.extend(
+            [
+                "# HELP %s_errors_total Number of validation errors by class." % prefix,
+                "# TYPE %s_errors_total counter" % prefix,
+            ]
+        )
+        for alias, stats in metrics.items():
+            for name, count in sorted(stats["errors"].items()):
+                lines.append(
+                    '%s_errors_total{alias="%s",error="%s"} %d'
+                    % (prefix, _escape(alias), name, count)
+                )
+        lines.extend(
+            [
+                "# HELP %s_duration_seconds Duration of validation." % prefix,
+                "# TYPE %s_duration_seconds histogram" % prefix,
+            ]
+        )
+        for alias, stats in metrics.items():
+            for bound, count in stats["buckets"]:
+                lines.append(
+                    '%s_duration_seconds_bucket{alias="%s",le="%s"} %d'
+                    % (prefix, _escape(alias), _bound(bound), count)
+                )
+            lines.append(
+                '%s_duration_seconds_sum{alias="%s"} %r'
+                % (prefix, _escape(alias), stats["sum"])
+            )
+            lines.append(
+                '%s_duration_seconds_count{alias="%s"} %d'
+                % (prefix, _escape(alias), stats["count"])
+            )
+        return "\n".join(lines)
+
+
+class _Stats(object):
+    __slots__ = ("count", "sum", "buckets", "errors")
+
+    def __init__(self, size):
+        self.count = 0
+        self.sum = 0.0
+        self.buckets = [0] * size
+        self.errors = {}
+
+
+def _escape(value):
+    # See label values in Prometheus text exposition format
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _bound(value):
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+def enable(sink, aliases=None):
+    """
+    Meter registered validators
+
+    :param Sink sink:
+        sink to report validations to.
+
+    :param iterable aliases:
+        aliases of validators to meter,
+        defaults to all registered ones.
+
+    :returns:
+        list of metered aliases.
+
+    Validators, that are already metered, are switched to the new sink.
+
+    """
+    if aliases is not None:
+        aliases = set(aliases)
+    result = []
+    for registry in _registries():
+        for alias, instance in registry.items():
+            if aliases is not None and alias not in aliases:
+                continue
+            if not isinstance(instance, Meter):
+                registry.put(alias, proxy_class(Meter, instance)(alias, instance))
+            _sinks[alias] = sink
+            result.append(alias)
+    return sorted(set(result))
+
+
+def disable():
+    """Put original validators back into registry"""
+    _sinks.clear()
+    for registry in _registries():
+        for alias, instance in registry.items():
+            if isinstance(instance, Meter):
+                registry.put(alias, instance._validator)
+
+
+def _registries():
+    from .py import instances
+
+    result = [instances]
+    try:
+        from .cy import instances
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        result.append(instances)
+    return result
+
+
+# Sinks of metered aliases, proxies look them up on each call,
+# so that they follow ``enable()`` and ``disable()``
+_sinks = {}  # type: dict
+
+
+class Meter(Proxy):
+    __slots__ = ()
+    slots = ("_alias", "_validator")
+
+    def __init__(self, alias, validator):
+        setattr = object.__setattr__
+        setattr(self, "_alias", alias)
+        setattr(self, "_validator", validator)
+
+    def __call__(self, value, __context=None):
+        sink = _sinks.get(self._alias)
+        if sink is None:
+            return self._validator(value, __context)
+        start = _timer()
+        try:
+            result = self._validator(value, __context)
+        except exc.ValidationError as e:
+            sink.observe(self._alias, _timer() - start, e)
+            raise
+        sink.observe(self._alias, _timer() - start, None)
+        return result
+
+    def __repr__(self):
+        return repr(self._validator)
+
+    def dump(self):
+        return self._validator.dump()
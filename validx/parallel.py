@@ -0,0 +1,179 @@
+"""
+Parallel Validation
+
+Function :func:`validate_many` splits values into chunks,
+and validates them by :meth:`validx.py.Validator.validate_many`
+in a pool of worker processes or threads.
+
+Process pool is the right choice for CPU bound validation
+of large collections.
+Validator is pickled and shipped to each worker process once,
+on worker initialization,
+while values, results and errors are pickled for each chunk.
+Thread pool does not pay for pickling,
+but it scales only when validation releases the GIL,
+e.g. on free-threaded builds of CPython.
+Iterables are consumed lazily,
+only a few chunks per worker are in flight at once.
+
+Lazy references are resolved in worker processes by alias,
+so the referenced validators should be registered there too,
+i.e. defined on import of a module,
+or the processes should be forked.
+
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+
+from . import arrays
+from . import exc
+from .compat.colabc import Sequence
+
+__all__ = ["validate_many"]
+
+
+_modes = ("collect", "raise", "skip")
+_backends = ("process", "thread")
+
+# Number of chunks per worker, that are submitted ahead
+_READ_AHEAD = 2
+
+# Validator of the current worker process, see ``_setup``
+_validator = None
+
+
+def validate_many(
+    validator, values, workers=None, backend="process", chunksize=1000, errors="collect"
+):
+    """
+    Validate many values in parallel
+
+    :param Validator validator:
+        validator to apply to each value.
+
+    :param iterable values:
+        values to validate.
+        Sequences and arrays are sliced into chunks,
+        other iterables are consumed chunk by chunk.
+
+    :param int workers:
+        number of workers, defaults to number of CPUs.
+
+    :param str backend:
+        ``"process"`` or ``"thread"``.
+
+    :param int chunksize:
+        number of values validated by worker at once.
+
+    :param str errors:
+        errors handling mode, see :meth:`validx.py.Validator.validate_many`.
+
+    :returns:
+        tuple ``(results, errors)``,
+        the same as of :meth:`validx.py.Validator.validate_many`,
+        i.e. index of invalid value in ``values``
+        is used as the first node of error context.
+
+    :raises SchemaError:
+        with errors of the first invalid value,
+        if ``errors == "raise"``.
+
+    """
+    if errors not in _modes:
+        raise ValueError(
+            "Expected errors to be one of 'collect', 'raise' or 'skip', got %r"
+            % (errors,)
+        )
+    if backend not in _backends:
+        raise ValueError(
+            "Expected backend to be one of 'process' or 'thread', got %r" % (backend,)
+        )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Expected workers to be positive, got %r" % (workers,))
+    if chunksize < 1:
+        raise ValueError("Expected chunksize to be positive, got %r" % (chunksize,))
+
+    if backend == "process":
+        executor = ProcessPoolExecutor(
+            workers, initializer=_setup, initargs=(validator,)
+        )
+        function = partial(_validate_chunk, errors=errors)
+    else:
+        executor = ThreadPoolExecutor(workers)
+        function = partial(_validate, validator, errors=errors)
+
+    results = []
+    collected = []
+    for chunk_results, chunk_errors in _imap(
+        executor, function, _chunks(values, chunksize), workers
+    ):
+        results.extend(chunk_results)
+        collected.extend(chunk_errors)
+    return results, collected
+
+
+def _imap(executor, function, chunks, workers):
+    # Yields results of the function applied to ``(offset, chunk)`` pairs,
+    # in order of the chunks, while only a few chunks per worker are in flight,
+    # so that memory usage does not depend on number of chunks
+    pending = deque()
+    with executor:
+        try:
+            for offset, chunk in chunks:
+                pending.append(executor.submit(function, offset, chunk))
+                if len(pending) > workers * _READ_AHEAD:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+def _chunks(values, chunksize):
+    # Yields ``(offset, chunk)`` pairs,
+    # slicing keeps chunks of NumPy arrays vectorizable.
+    if isinstance(values, Sequence) or arrays.is_array(values):
+        for offset in range(0, len(values), chunksize):
+            yield offset, values[offset : offset + chunksize]
+        return
+    iterator = iter(values)
+    offset = 0
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield offset, chunk
+        offset += len(chunk)
+
+
+def _validate(validator, offset, chunk, errors):
+    # Index of value in chunk is shifted to its index in the whole input
+    try:
+        results, errors = validator.validate_many(chunk, errors)
+    except exc.SchemaError as e:
+        for error in e:
+            error.context[0] += offset
+        raise
+    for error in errors:
+        error.context[0] += offset
+    return results, errors
+
+
+# Functions below run in worker processes, out of sight of coverage
+
+
+def _setup(validator):  # pragma: no cover
+    global _validator
+    _validator = validator
+
+
+def _validate_chunk(offset, chunk, errors):  # pragma: no cover
+    return _validate(_validator, offset, chunk, errors)
@@ -0,0 +1,471 @@
+"""
+Incremental Validation
+
+Method ``revalidate()`` of validators applies JSON Patch (:rfc:`6902`)
+to an already validated value,
+and validates only the changed parts of it.
+
+The patch is applied to a copy of the value,
+that shares all untouched dicts, lists, and tuples with the original one,
+i.e. containers along the changed paths are copied,
+and the original value is left intact.
+Then the validator tree is walked along the changed paths:
+
+*   values added by the patch are validated by their validators;
+*   keys of changed dicts are checked,
+    i.e. new keys are validated as extra ones or reported as forbidden,
+    missing keys are filled by defaults or reported as missing,
+    and length of the dicts is checked;
+*   length and uniqueness of items of changed lists are checked,
+    and so is length of changed tuples.
+
+Nested validators of ``Dict``, ``List``, ``Tuple``,
+``LazyRef``, and ``Cached`` validators are walked through.
+Any other validator, including ``AllOf``, ``OneOf``, and custom ones,
+validates its changed value as a whole.
+It relies on validated values being valid inputs of their validators,
+which is true for built-in validators.
+
+..  testsetup:: patch
+
+    from validx import Dict, List, Int, Str
+
+..  doctest:: patch
+
+    >>> schema = Dict({
+    ...     "name": Str(),
+    ...     "items": List(Dict({"sku": Str(), "qty": Int(min=1)})),
+    ... })
+    >>> old = schema({"name": "x", "items": [{"sku": "a", "qty": 1}]})
+    >>> new = schema.revalidate(old, [
+    ...     {"op": "add", "path": "/items/-", "value": {"sku": "b", "qty": 2}},
+    ... ])
+    >>> new["items"]
+    [{'sku': 'a', 'qty': 1}, {'sku': 'b', 'qty': 2}]
+    >>> new["items"][0] is old["items"][0]
+    True
+    >>> old["items"]
+    [{'sku': 'a', 'qty': 1}]
+
+    >>> schema.revalidate(old, [
+    ...     {"op": "replace", "path": "/items/0/qty", "value": 0},
+    ...     {"op": "remove", "path": "/name"},
+    ... ])
+    Traceback (most recent call last):
+        ...
+    validx.exc.SchemaError: <SchemaError(errors=[
+        <items.0.qty: MinValueError(expected=1, actual=0)>,
+        <name: MissingKeyError()>
+    ])>
+
+"""
+
+from collections import OrderedDict
+
+from . import exc
+from .compat.colabc import Mapping
+from .compat.types import string
+from .compiler import _kind
+from .introspection import registry
+
+__all__ = ["revalidate", "parse_pointer"]
+
+
+def revalidate(validator, value, patch):
+    """
+    Validate patched value
+
+    :param Validator validator:
+        validator, that validated the value.
+
+    :param value:
+        validated value.
+
+    :param iterable patch:
+        JSON Patch, i.e. sequence of operations,
+        each of them is a dict with keys ``op``, ``path``,
+        and ``value`` or ``from``, depending on the operation.
+        Operations ``add``, ``remove``, ``replace``,
+        ``move``, ``copy``, and ``test`` are supported.
+
+    :returns:
+        patched and validated value.
+
+    :raises ValueError:
+        if the patch is malformed, or cannot be applied to the value.
+
+    :raises SchemaError:
+        with errors of the changed values and their containers.
+
+    """
+    walker = _Walker(validator, value)
+    for operation in patch:
+        walker.apply(operation)
+    return walker.finish()
+
+
+def parse_pointer(pointer):
+    """
+    Parse JSON Pointer (:rfc:`6901`)
+
+    :param str pointer:
+        pointer to parse.
+
+    :returns:
+        tuple of reference tokens.
+
+    :raises ValueError:
+        if the pointer is malformed.
+
+    """
+    if not isinstance(pointer, string):
+        raise ValueError("Expected pointer to be a string, got %r" % (pointer,))
+    if not pointer:
+        return ()
+    if not pointer.startswith("/"):
+        raise ValueError("Expected pointer to start with '/', got %r" % (pointer,))
+    return tuple(
+        token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")
+    )
+
+
+class _Raw(object):
+    # Marks value added by the patch, that has to be validated as a whole
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _Walker(object):
+    def __init__(self, validator, value):
+        self.validator = validator
+        self.root = value
+        # Containers copied by the walker, that can be changed in place,
+        # they are kept by reference, so that their ids are not reused
+        self.owned = {}
+        # Keys and indexes of changed items of owned containers,
+        # dicts are used as ordered sets
+        self.changed = {}
+        self.context = {}
+        self.errors = []
+
+    # Applying the patch
+    # ==================
+
+    def apply(self, operation):
+        if not isinstance(operation, Mapping):
+            raise ValueError("Expected operation to be a dict, got %r" % (operation,))
+        op = operation.get("op")
+        path = parse_pointer(self.field(operation, "path"))
+        if op == "add":
+            self.add(path, _Raw(self.field(operation, "value")))
+        elif op == "remove":
+            self.remove(path)
+        elif op == "replace":
+            self.replace(path, _Raw(self.field(operation, "value")))
+        elif op == "move":
+            source = parse_pointer(self.field(operation, "from"))
+            if path[: len(source)] == source and path != source:
+                raise ValueError("Cannot move %r into itself" % (operation["from"],))
+            value = self.get(source)
+            self.remove(source)
+            self.add(path, _Raw(value))
+        elif op == "copy":
+            source = parse_pointer(self.field(operation, "from"))
+            self.add(path, _Raw(self.get(source)))
+        elif op == "test":
+            if self.get(path) != self.field(operation, "value"):
+                raise ValueError("Test of %r failed" % (operation["path"],))
+        else:
+            raise ValueError("Unsupported operation %r" % (op,))
+
+    def field(self, operation, name):
+        try:
+            return operation[name]
+        except KeyError:
+            raise ValueError("Operation %r has no %r" % (operation, name))
+
+    def add(self, path, raw):
+        if not path:
+            self.root = raw
+            return
+        parent = self.own(path[:-1])
+        key = path[-1]
+        if isinstance(parent, dict):
+            parent[key] = raw
+        elif key == "-":
+            parent.append(raw)
+            key = len(parent) - 1
+        else:
+            key = self.index(parent, key, path, extra=1)
+            parent.insert(key, raw)
+            self.shift(parent, key, 1)
+        self.changed[id(parent)][key] = True
+
+    def remove(self, path):
+        if not path:
+            raise ValueError("Cannot remove the root value")
+        parent = self.own(path[:-1])
+        key = path[-1]
+        if isinstance(parent, dict):
+            if key not in parent:
+                raise ValueError("Path %r does not exist" % (_format(path),))
+            del parent[key]
+            self.changed[id(parent)].pop(key, None)
+        else:
+            key = self.index(parent, key, path)
+            del parent[key]
+            self.shift(parent, key, -1)
+
+    def replace(self, path, raw):
+        # Replaced key keeps its position in dict,
+        # so that changed keys are validated in the same order as by ``Dict``
+        if path:
+            parent = self.own(path[:-1])
+            key = path[-1]
+            if isinstance(parent, dict) and key in parent:
+                parent[key] = raw
+                self.changed[id(parent)][key] = True
+                return
+            self.remove(path)
+        self.add(path, raw)
+
+    def get(self, path):
+        # Returns copy of value, that doesn't share owned containers,
+        # so that the value can be safely added into another place
+        node = self.root
+        for num, key in enumerate(path):
+            node = self.child(_unwrap(node), key, path[: num + 1])
+        return self.strip(node)
+
+    def own(self, path):
+        # Returns container at the path,
+        # copying containers along the path, unless they're already owned
+        node = self.root = self.copy(self.root, path)
+        for num, key in enumerate(path):
+            container = _unwrap(node)
+            child = self.copy(self.child(container, key, path[: num + 1]), path)
+            if not isinstance(container, dict):
+                key = int(key)
+            container[key] = child
+            self.changed[id(container)][key] = True
+            node = child
+        return _unwrap(node)
+
+    def copy(self, node, path):
+        container = _unwrap(node)
+        if id(container) in self.owned:
+            return node
+        if isinstance(container, Mapping):
+            container = dict(container)
+        elif isinstance(container, (list, tuple)):
+            container = list(container)
+        else:
+            raise ValueError("Path %r does not exist" % (_format(path),))
+        self.owned[id(container)] = container
+        self.changed[id(container)] = {}
+        if isinstance(node, _Raw):
+            node.value = container
+            return node
+        return container
+
+    def child(self, container, key, path):
+        if isinstance(container, Mapping):
+            try:
+                return container[key]
+            except KeyError:
+                pass
+        elif isinstance(container, (list, tuple)):
+            return container[self.index(container, key, path)]
+        raise ValueError("Path %r does not exist" % (_format(path),))
+
+    def index(self, container, key, path, extra=0):
+        # See array indexes of JSON Pointer
+        if key.isdigit() and (key == "0" or not key.startswith("0")):
+            index = int(key)
+            if index < len(container) + extra:
+                return index
+        raise ValueError("Path %r does not exist" % (_format(path),))
+
+    def shift(self, container, index, delta):
+        # Keeps changed indexes of list in sync with its items,
+        # when an item is inserted or deleted at the index
+        self.changed[id(container)] = dict(
+            (num + delta if num >= index else num, True)
+            for num in self.changed[id(container)]
+            if num != index or delta > 0
+        )
+
+    def strip(self, node):
+        # Returns value without ``_Raw`` markers and owned containers
+        node = _unwrap(node)
+        if id(node) not in self.owned:
+            return node
+        if isinstance(node, dict):
+            return dict((key, self.strip(val)) for key, val in node.items())
+        return [self.strip(val) for val in node]
+
+    # Validation of changes
+    # =====================
+
+    def finish(self):
+        result = self.visit(self.validator, self.root, ())
+        if self.errors:
+            raise exc.SchemaError(self.errors)
+        return result
+
+    def fail(self, error, path):
+        for node in reversed(path):
+            error = error.add_context(node)
+        self.errors.extend(error)
+
+    def validate(self, validator, value, path):
+        try:
+            return validator(value, self.context)
+        except exc.ValidationError as e:
+            self.fail(e, path)
+
+    def visit(self, validator, node, path):
+        if isinstance(node, _Raw):
+            return self.validate(validator, self.strip(node), path)
+        if id(node) not in self.owned:
+            return node  # Untouched value
+        kind = _kind(validator)
+        if kind == "Cached":
+            return self.visit(validator.validator, node, path)
+        if kind == "LazyRef":
+            return self.visit_lazyref(validator, node, path)
+        if kind == "Dict" and isinstance(node, dict):
+            return self.visit_dict(validator, node, path)
+        if kind == "List" and isinstance(node, list):
+            return self.visit_list(validator, node, path)
+        if kind == "Tuple" and isinstance(node, list):
+            return self.visit_tuple(validator, node, path)
+        return self.validate(validator, self.strip(node), path)
+
+    def visit_lazyref(self, validator, node, path):
+        # See ``LazyRef.__call__``
+        instance = registry(validator).get(validator.use)
+        if validator.maxdepth is None:
+            return self.visit(instance, node, path)
+        key = validator.use + ".recursion_depth"
+        depth = self.context.setdefault(key, 0) + 1
+        if depth > validator.maxdepth:
+            error = exc.RecursionMaxDepthError(
+                expected=validator.maxdepth, actual=depth
+            )
+            return self.fail(error, path)
+        self.context[key] = depth
+        try:
+            return self.visit(instance, node, path)
+        finally:
+            self.context[key] -= 1
+
+    def visit_dict(self, validator, node, path):
+        # See ``Dict.__call__``, changed keys are visited in order of the dict,
+        # so that errors are the same, as if the whole dict is validated
+        schema = validator.schema
+        extra = validator.extra
+        dispose = validator.dispose
+        fail_fast = validator.fail_fast
+
+        failed = len(self.errors)
+        result = dict(node)
+        changed = self.changed[id(node)]
+        for key in [key for key in node if key in changed]:
+            val = node[key]
+            if schema is not None and key in schema:
+                result[key] = self.visit(schema[key], val, path + (key,))
+                if fail_fast and len(self.errors) > failed:
+                    break
+                continue
+            del result[key]
+            if dispose is not None and key in dispose:
+                continue
+            elif extra is not None:
+                new_key = key
+                if isinstance(val, _Raw):
+                    try:
+                        new_key = extra[0](key, self.context)
+                    except exc.ValidationError as e:
+                        self.fail(e.add_context(exc.EXTRA_KEY), path + (key,))
+                        if fail_fast:
+                            break
+                path_val = path + (new_key, exc.EXTRA_VALUE)
+                result[new_key] = self.visit(extra[1], val, path_val)
+            else:
+                self.fail(exc.ForbiddenKeyError(key), path)
+            if fail_fast and len(self.errors) > failed:
+                break
+
+        if schema is not None and not (fail_fast and len(self.errors) > failed):
+            # Factories of default values are built on ``Dict`` initialization
+            for key, item, default in validator._missing:
+                if key in node:
+                    continue
+                if default is None:
+                    self.fail(exc.MissingKeyError(key), path)
+                else:
+                    result[key] = self.visit(item, _Raw(default()), path + (key,))
+                if fail_fast and len(self.errors) > failed:
+                    break
+
+        if len(self.errors) > failed:
+            return result
+        length = len(result)
+        if validator.minlen is not None and length < validator.minlen:
+            self.fail(
+                exc.MinLengthError(expected=validator.minlen, actual=length), path
+            )
+        if validator.maxlen is not None and length > validator.maxlen:
+            self.fail(
+                exc.MaxLengthError(expected=validator.maxlen, actual=length), path
+            )
+        return result
+
+    def visit_list(self, validator, node, path):
+        # See ``List.__call__``
+        failed = len(self.errors)
+        result = list(node)
+        for num in sorted(self.changed[id(node)]):
+            result[num] = self.visit(validator.item, node[num], path + (num,))
+            if validator.fail_fast and len(self.errors) > failed:
+                break
+        if len(self.errors) > failed:
+            return result
+        if validator.unique:
+            result = list(OrderedDict.fromkeys(result))
+        length = len(result)
+        if validator.minlen is not None and length < validator.minlen:
+            self.fail(
+                exc.MinLengthError(expected=validator.minlen, actual=length), path
+            )
+        if validator.maxlen is not None and length > validator.maxlen:
+            self.fail(
+                exc.MaxLengthError(expected=validator.maxlen, actual=length), path
+            )
+        return result
+
+    def visit_tuple(self, validator, node, path):
+        # See ``Tuple.__call__``
+        if len(validator.items) != len(node):
+            error = exc.TupleLengthError(
+                expected=len(validator.items), actual=len(node)
+            )
+            return self.fail(error, path)
+        failed = len(self.errors)
+        result = []
+        for num, (item, val) in enumerate(zip(validator.items, node)):
+            result.append(self.visit(item, val, path + (num,)))
+            if validator.fail_fast and len(self.errors) > failed:
+                break
+        return tuple(result)
+
+
+def _unwrap(node):
+    return node.value if isinstance(node, _Raw) else node
+
+
+def _format(path):
+    return "".join("/" + str(key).replace("~", "~0").replace("/", "~1") for key in path)
@@ -0,0 +1,98 @@
+"""
+Compiled Patterns Cache
+
+Regular expressions used by :class:`validx.py.Str` validators
+are compiled once on validator initialization,
+and the compiled patterns are shared across all validators
+via process-wide LRU cache.
+
+So that thousands of schemas with the same pattern
+hold a single compiled object,
+and the validation does not go through the small internal cache
+of :mod:`re` module.
+
+"""
+
+import re
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+__all__ = ["compile", "cache_info", "cache_clear", "cache_resize"]
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_lock = Lock()
+_cache = OrderedDict()  # type: OrderedDict
+_stats = {"hits": 0, "misses": 0, "maxsize": 4096}
+
+
+def compile(pattern):
+    """
+    Compile regular expression using shared cache.
+
+    :param str pattern:
+        regular expression.
+
+    :returns:
+        compiled pattern, i.e. result of ``re.compile(pattern)``.
+
+    """
+    with _lock:
+        try:
+            # Re-insert the pattern to mark it as recently used
+            result = _cache.pop(pattern)
+        except KeyError:
+            pass
+        else:
+            _cache[pattern] = result
+            _stats["hits"] += 1
+            return result
+    result = re.compile(pattern)
+    with _lock:
+        _stats["misses"] += 1
+        _cache[pattern] = result
+        while len(_cache) > _stats["maxsize"]:
+            _cache.popitem(last=False)
+    return result
+
+
+def cache_info():
+    """
+    Get cache statistics.
+
+    :returns:
+        named tuple ``CacheInfo(hits, misses, maxsize, currsize)``.
+
+    """
+    with _lock:
+        return CacheInfo(
+            _stats["hits"], _stats["misses"], _stats["maxsize"], len(_cache)
+        )
+
+
+def cache_clear():
+    """Clear cache and its statistics."""
+    with _lock:
+        _cache.clear()
+        _stats["hits"] = 0
+        _stats["misses"] = 0
+
+
+def cache_resize(maxsize):
+    """
+    Change cache size limit.
+
+    :param int maxsize:
+        maximum number of compiled patterns to keep.
+
+    Least recently used patterns are evicted,
+    if the cache exceeds the new limit.
+
+    """
+    if maxsize < 1:
+        raise ValueError("Cache size should be positive, got %r" % maxsize)
+    with _lock:
+        _stats["maxsize"] = maxsize
+        while len(_cache) > maxsize:
+            _cache.popitem(last=False)
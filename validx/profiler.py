@@ -0,0 +1,255 @@
+"""
+Profiler
+
+Function :func:`profile` makes an instrumented copy of a validator tree,
+where each node is wrapped by a probe,
+that records number of calls, number of failures,
+cumulative and self time of the node.
+The original tree is left intact,
+so there is no overhead at all, when profiling is not used,
+neither in pure Python nor in Cython implementation.
+
+Nodes are keyed by their path in the schema,
+that uses the same syntax as :meth:`validx.exc.ValidationError.format_context`,
+except that items of lists and extra keys of dicts are denoted by ``*``.
+The root node has empty path.
+
+Nested validators of ``List``, ``Tuple``, ``Dict``, ``AllOf``,
+and ``OneOf`` are instrumented recursively.
+Any other validator, including ``LazyRef`` and custom ones,
+is profiled as a single node.
+
+..  testsetup:: profiler
+
+    from validx import Dict, List, Int, Str
+    from validx.profiler import profile
+
+..  doctest:: profiler
+
+    >>> schema = Dict({"x": Int(min=0), "y": List(Str(maxlen=3))})
+    >>> p = profile(schema)
+    >>> p({"x": 1, "y": ["a", "b"]}) == {"x": 1, "y": ["a", "b"]}
+    True
+    >>> [(row["path"], row["calls"]) for row in p.as_list()]
+    [('', 1), ('x', 1), ('y', 1), ('y.*', 2)]
+    >>> print(p.report())  # doctest: +SKIP
+    path    calls  failures     total, s      self, s
+    ''          1         0     0.000021     0.000008
+    y.*         2         0     0.000004     0.000004
+    y           1         0     0.000008     0.000004
+    x           1         0     0.000002     0.000002
+
+Probes are not thread-safe,
+so each thread should use its own instrumented copy.
+
+"""
+
+import time
+from collections import OrderedDict
+
+from . import exc
+from .compat.types import string
+from .compiler import _kind
+from .proxies import Proxy, proxy_class
+
+__all__ = ["profile", "Profile"]
+
+
+# Python 2.7 has no ``time.perf_counter``
+_timer = getattr(time, "perf_counter", time.time)
+
+_columns = ("calls", "failures", "total", "self")
+
+
+def profile(validator):
+    """
+    Make instrumented copy of validator
+
+    :param Validator validator:
+        validator to profile.
+
+    :returns:
+        :class:`Profile` object.
+
+    """
+    return Profile(validator)
+
+
+class Profile(object):
+    """
+    Profile of Validator
+
+    :param Validator validator:
+        validator to profile.
+
+    Instrumented copy of the validator is available
+    via ``validator`` attribute,
+    and can be used in place of the original one,
+    e.g. by :meth:`validx.py.Validator.validate_many`.
+
+    """
+
+    def __init__(self, validator):
+        self.stats = OrderedDict()
+        self._stack = []
+        self.validator = self._wrap(validator, ())
+
+    def __call__(self, value, context=None):
+        """Validate value by instrumented validator"""
+        return self.validator(value, context)
+
+    def reset(self):
+        """Reset collected stats"""
+        for stats in self.stats.values():
+            stats[:] = [0, 0, 0.0, 0.0]
+
+    def as_list(self):
+        """
+        Get collected stats
+
+        :returns:
+            list of dicts in schema order,
+            with keys ``path``, ``calls``, ``failures``,
+            ``total`` and ``self``,
+            where the last two are times in seconds.
+            The result is ready to be dumped into JSON.
+
+        """
+        result = []
+        for path, stats in self.stats.items():
+            row = OrderedDict(path=path)
+            row.update(zip(_columns, stats))
+            result.append(row)
+        return result
+
+    def report(self, sort="self", limit=None):
+        """
+        Format collected stats as a table
+
+        :param str sort:
+            column to sort rows by in descending order,
+            one of ``"calls"``, ``"failures"``, ``"total"``, or ``"self"``.
+
+        :param int limit:
+            maximum number of rows.
+
+        :returns:
+            table as a string.
+
+        """
+        if sort not in _columns:
+            raise ValueError(
+                "Expected sort to be one of 'calls', 'failures', 'total' or 'self', "
+                "got %r" % (sort,)
+            )
+        rows = sorted(self.as_list(), key=lambda row: row[sort], reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+        paths = [row["path"] or "''" for row in rows]
+        width = max([len(path) for path in paths] + [len("path")])
+        lines = [
+            "%-*s %8s %9s %12s %12s"
+            % (width, "path", "calls", "failures", "total, s", "self, s")
+        ]
+        for path, row in zip(paths, rows):
+            lines.append(
+                "%-*s %8d %9d %12.6f %12.6f"
+                % (
+                    width,
+                    path,
+                    row["calls"],
+                    row["failures"],
+                    row["total"],
+                    row["self"],
+                )
+            )
+        return "\n".join(lines)
+
+    def _wrap(self, validator, path):
+        # Returns probe of validator with instrumented nested validators,
+        # the node is registered before its children to keep schema order
+        self.stats[_format(path)] = [0, 0, 0.0, 0.0]
+        kind = _kind(validator)
+        if kind == "List":
+            params = dict(validator.params())
+            params["item"] = self._wrap(validator.item, path + ("*",))
+            validator = validator.__class__(**params)
+        elif kind == "Tuple":
+            params = dict(validator.params())
+            params["items"] = tuple(
+                self._wrap(item, path + (str(num),))
+                for num, item in enumerate(validator.items)
+            )
+            validator = validator.__class__(**params)
+        elif kind == "Dict":
+            params = dict(validator.params())
+            if validator.schema is not None:
+                params["schema"] = OrderedDict(
+                    (key, self._wrap(item, path + (_node(key),)))
+                    for key, item in validator.schema.items()
+                )
+            if validator.extra is not None:
+                params["extra"] = (
+                    self._wrap(validator.extra[0], path + ("*", repr(exc.EXTRA_KEY))),
+                    self._wrap(validator.extra[1], path + ("*", repr(exc.EXTRA_VALUE))),
+                )
+            validator = validator.__class__(**params)
+        elif kind in ("AllOf", "OneOf"):
+            params = dict(validator.params())
+            params["steps"] = tuple(
+                self._wrap(step, path + (repr(exc.Step(num)),))
+                for num, step in enumerate(validator.steps)
+            )
+            validator = validator.__class__(**params)
+        return proxy_class(Probe, validator)(self, _format(path), validator)
+
+    def _call(self, path, validator, value, context):
+        # Time spent in nested probes is pushed onto the stack,
+        # so that it is subtracted from self time of the current node
+        stack = self._stack
+        stack.append(0.0)
+        failed = False
+        start = _timer()
+        try:
+            return validator(value, context)
+        except exc.ValidationError:
+            failed = True
+            raise
+        finally:
+            elapsed = _timer() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            stats = self.stats[path]
+            stats[0] += 1
+            stats[1] += failed
+            stats[2] += elapsed
+            stats[3] += elapsed - nested
+
+
+def _node(key):
+    # See ``ValidationError.format_context``
+    if isinstance(key, string) and "." in key:
+        return "[%s]" % key
+    return str(key)
+
+
+def _format(path):
+    return ".".join(path)
+
+
+class Probe(Proxy):
+    __slots__ = ()
+    slots = ("_profile", "_path", "_validator")
+
+    def __init__(self, profile, path, validator):
+        setattr = object.__setattr__
+        setattr(self, "_profile", profile)
+        setattr(self, "_path", path)
+        setattr(self, "_validator", validator)
+
+    def __call__(self, value, __context=None):
+        return self._profile._call(self._path, self._validator, value, __context)
+
+    def __repr__(self):
+        return "<Probe(%s: %r)>" % (self._path or "''", self._validator)
@@ -0,0 +1,72 @@
+"""
+Proxies of Validators
+
+Profiler and metrics substitute validators by proxies,
+which call the original validator kept in ``_validator`` slot.
+Proxy is defined as a mixin of :class:`Proxy`,
+and its concrete class is derived from the mixin
+and from base validator class of the same implementation
+as the original validator,
+so that it passes contracts of parent validators.
+
+Proxies are equal, if they are of the same class,
+and their original validators are equal.
+
+"""
+
+__all__ = ["Proxy", "proxy_class"]
+
+
+class Proxy(object):
+    """
+    Base Mixin of Proxies
+
+    Concrete class gets ``__slots__`` from ``slots`` attribute of the mixin,
+    which should include ``_validator``.
+
+    """
+
+    __slots__ = ()
+    slots = ("_validator",)  # type: tuple
+
+    def __eq__(self, other):
+        if self.__class__ is not other.__class__:
+            return False
+        return self._validator == other._validator
+
+    def __hash__(self):
+        return hash((self.__class__, self._validator))
+
+
+_classes = {}  # type: dict
+
+
+def proxy_class(mixin, validator):
+    """
+    Get concrete class of proxy
+
+    :param type mixin:
+        subclass of :class:`Proxy`.
+
+    :param Validator validator:
+        original validator.
+
+    :returns:
+        class derived from ``mixin`` and ``py.Validator``,
+        or from ``mixin`` and ``cy.Validator``.
+
+    """
+    from . import py
+
+    base = py.Validator
+    if not isinstance(validator, base):
+        from . import cy
+
+        base = cy.Validator
+    try:
+        return _classes[mixin, base]
+    except KeyError:
+        pass
+    result = type(mixin.__name__, (mixin, base), {"__slots__": mixin.slots})
+    _classes[mixin, base] = result
+    return result
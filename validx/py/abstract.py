@@ -1,5 +1,8 @@
+import sys
 from warnings import warn
 
+from .. import exc
+from .. import interning
 from . import classes, instances
 from ..compat.abc import ABC, abstractmethod
 from ..compat.colabc import Mapping, Sequence, Container
@@ -60,11 +63,25 @@ class Validator(ABC):
             other.params()
         )
 
+    def __hash__(self):
+        # Structural hash, that is consistent with ``__eq__``,
+        # unhashable parameters are left to ``__eq__``
+        def params():
+            for slot, value in self.params():
+                try:
+                    yield slot, hash(value)
+                except TypeError:
+                    yield slot, None
+
+        return hash((self.__class__, tuple(params())))
+
     def __reduce__(self):
         return (_load_recurcive, (self.dump(),))
 
     def params(self):
         for slot in self.__slots__:
+            if slot.startswith("_"):
+                continue  # Private state, derived from params
             value = getattr(self, slot)
             if value is not None and value is not False:
                 yield slot, value
@@ -149,6 +166,9 @@ class Validator(ABC):
             ... })
             <Int(min=-100, max=100)>
 
+        Structurally identical validators can be loaded as a shared instance,
+        see :mod:`validx.interning`.
+
         """
         assert isinstance(params, dict), "Expected %r, got %r" % (dict, type(params))
         assert "__class__" in params or "__use__" in params or "__clone__" in params, (
@@ -226,6 +246,170 @@ class Validator(ABC):
         """
         return self.load(self.dump(), update, unset, **kw)
 
+    def validate_many(self, values, errors="collect"):
+        """
+        Validate many values.
+
+        :param iterable values:
+            values to validate.
+
+        :param str errors:
+            how to handle validation errors:
+
+            *   ``"collect"`` -- collect errors of all invalid values;
+            *   ``"raise"`` -- raise error on the first invalid value;
+            *   ``"skip"`` -- silently skip invalid values.
+
+        :returns:
+            tuple ``(results, errors)``,
+            where ``results`` is a list of validated values,
+            excluding invalid ones,
+            and ``errors`` is a list of collected errors.
+
+        :raises SchemaError:
+            with errors of the first invalid value,
+            if ``errors == "raise"``.
+
+        Index of invalid value is used as the first node of error context.
+
+        ..  testsetup:: validate_many
+
+            from validx import Int
+
+        ..  doctest:: validate_many
+
+            >>> results, errors = Int(min=0).validate_many([1, -2, 3, "4"])
+            >>> results
+            [1, 3]
+            >>> errors  # doctest: +NORMALIZE_WHITESPACE
+            [<1: MinValueError(expected=0, actual=-2)>,
+             <3: InvalidTypeError(expected=<class 'int'>, actual=<class 'str'>)>]
+
+        """
+        if errors not in ("collect", "raise", "skip"):
+            raise ValueError(
+                "Expected errors to be one of 'collect', 'raise' or 'skip', got %r"
+                % (errors,)
+            )
+        collect = errors == "collect"
+        fail = errors == "raise"
+        results = []
+        errors = []
+        context = {}
+        append = results.append
+        for num, value in enumerate(values):
+            if context:
+                context.clear()
+            try:
+                append(self(value, context))
+            except exc.ValidationError as e:
+                if fail:
+                    raise exc.SchemaError(list(e.add_context(num)))
+                if collect:
+                    errors.extend(e.add_context(num))
+        return results, errors
+
+    def compile(self):
+        """
+        Compile validator.
+
+        ..  testsetup:: compile
+
+            from validx import Dict, Int, Str
+
+        ..  doctest:: compile
+
+            >>> schema = Dict({"x": Int(min=0), "y": Str(maxlen=10)})
+            >>> validate = schema.compile()
+            >>> validate({"x": 1, "y": "foo"}) == {"x": 1, "y": "foo"}
+            True
+
+
+        The method generates source code of a single function,
+        that is equivalent to the validator,
+        and returns the function.
+        See :func:`validx.compiler.compile`.
+
+        """
+        from ..compiler import compile
+
+        return compile(self)
+
+    def avalidate(self, value, budget=1000, concurrency=1):
+        """
+        Validate value asynchronously.
+
+        :param value:
+            value to validate.
+
+        :param int budget:
+            number of items of lists, tuples, and dicts
+            to validate between yields to event loop.
+
+        :param int concurrency:
+            maximum number of list items validated concurrently,
+            if item validator has asynchronous steps.
+
+        :returns:
+            awaitable, that returns validated value.
+
+        ..  testsetup:: avalidate
+
+            import asyncio
+            from validx import List, Int
+
+        ..  doctest:: avalidate
+
+            >>> v = List(Int(min=0))
+            >>> asyncio.run(v.avalidate(list(range(100000)), budget=100))[-1]
+            99999
+
+        Requires Python 3.5 or later,
+        see :mod:`validx.aio` for details.
+
+        """
+        if sys.version_info < (3, 5):  # pragma: no cover
+            raise RuntimeError("Asynchronous validation requires Python 3.5+")
+        from ..aio import validate
+
+        return validate(self, value, budget, concurrency)
+
+    def revalidate(self, value, patch):
+        """
+        Validate patched value.
+
+        :param value:
+            value, that is already validated by the validator.
+
+        :param iterable patch:
+            JSON Patch operations to apply to the value.
+
+        :returns:
+            new validated value,
+            that shares unchanged containers with the passed one.
+
+        ..  testsetup:: revalidate
+
+            from validx import Dict, Int
+
+        ..  doctest:: revalidate
+
+            >>> v = Dict({"x": Int(min=0), "y": Dict({"z": Int()})})
+            >>> old = v({"x": 1, "y": {"z": 2}})
+            >>> new = v.revalidate(old, [{"op": "replace", "path": "/x", "value": 3}])
+            >>> new == {"x": 3, "y": {"z": 2}}
+            True
+            >>> new["y"] is old["y"]
+            True
+
+        Only changed values and their containers are validated,
+        see :mod:`validx.patch` for details.
+
+        """
+        from ..patch import revalidate
+
+        return revalidate(self, value, patch)
+
 
 def _load_recurcive(params, update=None, unset=None, path=()):
     path_key = ".".join(path)
@@ -250,7 +434,10 @@ def _load_recurcive(params, update=None, unset=None, path=()):
         if "__class__" in result:
             classname = result.pop("__class__")
             class_ = classes.get(classname)
-            return class_(**result)
+            instance = class_(**result)
+            if interning.enabled() and "alias" not in result:
+                instance = interning.intern(instance)
+            return instance
         if "__clone__" in result:
             alias = result.pop("__clone__")
             instance = instances.get(alias)
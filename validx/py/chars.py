@@ -1,7 +1,6 @@
-import re
-
 from .. import exc
 from .. import contracts
+from .. import patterns
 from ..compat.types import string
 from . import abstract
 
@@ -53,7 +52,15 @@ class Str(abstract.Validator):
 
     """
 
-    __slots__ = ("nullable", "encoding", "minlen", "maxlen", "pattern", "options")
+    __slots__ = (
+        "nullable",
+        "encoding",
+        "minlen",
+        "maxlen",
+        "pattern",
+        "options",
+        "_match",
+    )
 
     def __init__(
         self,
@@ -82,6 +89,7 @@ class Str(abstract.Validator):
         setattr(self, "maxlen", maxlen)
         setattr(self, "pattern", pattern)
         setattr(self, "options", options)
+        setattr(self, "_match", patterns.compile(pattern).match if pattern else None)
 
         self._register(alias, replace)
 
@@ -101,7 +109,7 @@ class Str(abstract.Validator):
             raise exc.MinLengthError(expected=self.minlen, actual=length)
         if self.maxlen is not None and length > self.maxlen:
             raise exc.MaxLengthError(expected=self.maxlen, actual=length)
-        if self.pattern and not re.match(self.pattern, value):
+        if self._match is not None and not self._match(value):
             raise exc.PatternMatchError(expected=self.pattern, actual=value)
         if self.options is not None and value not in self.options:
             raise exc.OptionsError(expected=self.options, actual=value)
@@ -122,10 +130,19 @@ class Bytes(abstract.Validator):
     :param int maxlen:
         upper length limit.
 
+    :param bool buffer:
+        accept any object, that supports buffer protocol,
+        i.e. ``bytearray``, ``memoryview``, ``mmap``, etc.
+        Such objects are not copied,
+        validator returns ``memoryview`` of them,
+        ``memoryview`` objects are returned as is.
+        Their length is measured in bytes.
+
 
     :raises InvalidTypeError:
         * if ``value is None`` and ``not self.nullable``;
-        * if ``not isinstance(value, bytes)``.
+        * if ``not isinstance(value, bytes)`` and ``not self.buffer``;
+        * if value does not support buffer protocol and ``self.buffer``.
 
     :raises MinLengthError:
         if ``len(value) < self.minlen``.
@@ -135,28 +152,44 @@ class Bytes(abstract.Validator):
 
     """
 
-    __slots__ = ("nullable", "minlen", "maxlen")
+    __slots__ = ("nullable", "minlen", "maxlen", "buffer")
 
     def __init__(
-        self, nullable=False, minlen=None, maxlen=None, alias=None, replace=False
+        self,
+        nullable=False,
+        minlen=None,
+        maxlen=None,
+        buffer=False,
+        alias=None,
+        replace=False,
     ):
         nullable = contracts.expect_flag(self, "nullable", nullable)
         minlen = contracts.expect_length(self, "minlen", minlen, nullable=True)
         maxlen = contracts.expect_length(self, "maxlen", maxlen, nullable=True)
+        buffer = contracts.expect_flag(self, "buffer", buffer)
 
         setattr = object.__setattr__
         setattr(self, "nullable", nullable)
         setattr(self, "minlen", minlen)
         setattr(self, "maxlen", maxlen)
+        setattr(self, "buffer", buffer)
 
         self._register(alias, replace)
 
     def __call__(self, value, __context=None):
         if value is None and self.nullable:
             return value
-        if not isinstance(value, bytes):
+        if isinstance(value, bytes):
+            length = len(value)
+        elif not self.buffer:
             raise exc.InvalidTypeError(expected=bytes, actual=type(value))
-        length = len(value)
+        else:
+            if not isinstance(value, memoryview):
+                try:
+                    value = memoryview(value)
+                except TypeError:
+                    raise exc.InvalidTypeError(expected=bytes, actual=type(value))
+            length = value.nbytes
         if self.minlen is not None and length < self.minlen:
             raise exc.MinLengthError(expected=self.minlen, actual=length)
         if self.maxlen is not None and length > self.maxlen:
@@ -27,12 +27,14 @@ class Bytes(abstract.Validator):
     nullable: t.Optional[bool]
     minlen: t.Optional[int]
     maxlen: t.Optional[int]
+    buffer: t.Optional[bool]
     def __init__(
         self,
         *,
         nullable: bool = None,
         minlen: int = None,
         maxlen: int = None,
+        buffer: bool = None,
         alias: str = None,
         replace: bool = False,
     ) -> None: ...
@@ -1,10 +1,14 @@
-from copy import deepcopy
+from collections import OrderedDict
 
+from .. import arrays
+from .. import columnar
 from .. import contracts
+from .. import defaults
 from .. import exc
-from ..compat.colabc import Sequence, Mapping
+from ..compat.colabc import Sequence, Mapping, Iterable
 from ..compat.types import chars
 from . import abstract
+from .numbers import Int, Float
 
 
 class List(abstract.Validator):
@@ -27,6 +31,9 @@ class List(abstract.Validator):
     :param bool unique:
         drop duplicate items.
 
+    :param bool fail_fast:
+        stop validation on the first invalid item.
+
 
     :raises InvalidTypeError:
         if ``not isinstance(value, (list, tuple))``.
@@ -39,11 +46,18 @@ class List(abstract.Validator):
 
     :raises SchemaError:
         with all errors,
-        raised by item validator.
+        raised by item validator,
+        or with errors of the first invalid item, if ``self.fail_fast``.
+
+
+    NumPy arrays, ``array.array`` and ``memoryview`` objects
+    are passed to :meth:`Validator.validate_many` of item validator,
+    so numeric arrays are validated in one pass,
+    see :mod:`validx.arrays`.
 
     """
 
-    __slots__ = ("item", "nullable", "minlen", "maxlen", "unique")
+    __slots__ = ("item", "nullable", "minlen", "maxlen", "unique", "fail_fast")
 
     def __init__(
         self,
@@ -52,6 +66,7 @@ class List(abstract.Validator):
         minlen=None,
         maxlen=None,
         unique=False,
+        fail_fast=False,
         alias=None,
         replace=False,
     ):
@@ -60,6 +75,7 @@ class List(abstract.Validator):
         minlen = contracts.expect_length(self, "minlen", minlen, nullable=True)
         maxlen = contracts.expect_length(self, "maxlen", maxlen, nullable=True)
         unique = contracts.expect_flag(self, "unique", unique)
+        fail_fast = contracts.expect_flag(self, "fail_fast", fail_fast)
 
         setattr = object.__setattr__
         setattr(self, "item", item)
@@ -67,6 +83,7 @@ class List(abstract.Validator):
         setattr(self, "minlen", minlen)
         setattr(self, "maxlen", maxlen)
         setattr(self, "unique", unique)
+        setattr(self, "fail_fast", fail_fast)
 
         self._register(alias, replace)
 
@@ -76,29 +93,46 @@ class List(abstract.Validator):
 
         if value is None and self.nullable:
             return value
-        if not isinstance(value, (list, tuple)):
-            if not isinstance(value, Sequence) or isinstance(value, chars):
-                raise exc.InvalidTypeError(expected=Sequence, actual=type(value))
-
-        result = []
-        errors = []
-        if self.unique:
-            unique = set()
-
-        for num, val in enumerate(value):
-            try:
-                val = self.item(val, __context)
-            except exc.ValidationError as e:
-                errors.extend(ne.add_context(num) for ne in e)
-                continue
+        if (
+            not isinstance(value, (list, tuple))
+            and isinstance(self.item, (Int, Float))
+            and arrays.numeric(value) is not None
+        ):
+            # Numeric arrays are validated by item validator in one pass,
+            # it does not use context
+            result, errors = self.item.validate_many(
+                value, "raise" if self.fail_fast else "collect"
+            )
+            if errors:
+                raise exc.SchemaError(errors)
             if self.unique:
-                if val in unique:
+                result = list(OrderedDict.fromkeys(result))
+        else:
+            if not isinstance(value, (list, tuple)) and not arrays.is_array(value):
+                if not isinstance(value, Sequence) or isinstance(value, chars):
+                    raise exc.InvalidTypeError(expected=Sequence, actual=type(value))
+
+            result = []
+            errors = []
+            if self.unique:
+                unique = set()
+
+            for num, val in enumerate(value):
+                try:
+                    val = self.item(val, __context)
+                except exc.ValidationError as e:
+                    errors.extend(e.add_context(num))
+                    if self.fail_fast:
+                        break
                     continue
-                unique.add(val)
-            result.append(val)
+                if self.unique:
+                    if val in unique:
+                        continue
+                    unique.add(val)
+                result.append(val)
 
-        if errors:
-            raise exc.SchemaError(errors)
+            if errors:
+                raise exc.SchemaError(errors)
 
         length = len(result)
         if self.minlen is not None and length < self.minlen:
@@ -108,6 +142,94 @@ class List(abstract.Validator):
 
         return result
 
+    def iter_validate(self, values, unique_window=None):
+        """
+        Validate items lazily.
+
+        :param iterable values:
+            values to validate, any iterable including generators.
+
+        :param int unique_window:
+            if it is specified and ``self.unique`` is set,
+            only the specified number of recently seen distinct items
+            is remembered to drop duplicates,
+            so the memory usage is bounded.
+
+        :returns:
+            iterator of validated items.
+
+        :raises InvalidTypeError:
+            if ``values`` is not iterable or it is a string.
+
+        :raises SchemaError:
+            with errors of the first invalid item,
+            its index is used as the first node of error context.
+
+        :raises MaxLengthError:
+            as soon as number of items exceeds ``self.maxlen``,
+            ``actual`` is equal to ``self.maxlen + 1`` in this case.
+
+        :raises MinLengthError:
+            if ``values`` is exhausted
+            and number of items is less than ``self.minlen``.
+
+        ..  testsetup:: iter_validate
+
+            from validx import List, Int
+
+        ..  doctest:: iter_validate
+
+            >>> v = List(Int(), maxlen=3)
+            >>> items = v.iter_validate(iter([1, 2.0, 3, 4]))
+            >>> next(items), next(items), next(items)
+            (1, 2, 3)
+            >>> next(items)
+            Traceback (most recent call last):
+                ...
+            validx.exc.MaxLengthError: <MaxLengthError(expected=3, actual=4)>
+
+        """
+        unique_window = contracts.expect_length(
+            self, "unique_window", unique_window, nullable=True
+        )
+        if values is None and self.nullable:
+            return iter(())
+        if not isinstance(values, Iterable) or isinstance(values, chars):
+            raise exc.InvalidTypeError(expected=Iterable, actual=type(values))
+        return self._iter_validate(values, unique_window)
+
+    def _iter_validate(self, values, unique_window):
+        context = {}
+        length = 0
+        if self.unique:
+            unique = set() if unique_window is None else OrderedDict()
+
+        for num, val in enumerate(values):
+            try:
+                val = self.item(val, context)
+            except exc.ValidationError as e:
+                raise exc.SchemaError(list(e.add_context(num)))
+            if self.unique:
+                if val in unique:
+                    if unique_window is not None:
+                        # Mark the item as recently seen
+                        del unique[val]
+                        unique[val] = None
+                    continue
+                if unique_window is None:
+                    unique.add(val)
+                else:
+                    unique[val] = None
+                    if len(unique) > unique_window:
+                        unique.popitem(last=False)
+            length += 1
+            if self.maxlen is not None and length > self.maxlen:
+                raise exc.MaxLengthError(expected=self.maxlen, actual=length)
+            yield val
+
+        if self.minlen is not None and length < self.minlen:
+            raise exc.MinLengthError(expected=self.minlen, actual=length)
+
 
 class Tuple(abstract.Validator):
     """
@@ -120,6 +242,9 @@ class Tuple(abstract.Validator):
     :param bool nullable:
         accept ``None`` as a valid value.
 
+    :param bool fail_fast:
+        stop validation on the first invalid member.
+
 
     :raises InvalidTypeError:
         if ``not isinstance(value, (list, tuple))``.
@@ -129,26 +254,31 @@ class Tuple(abstract.Validator):
 
     :raises SchemaError:
         with all errors,
-        raised by member validators.
+        raised by member validators,
+        or with errors of the first invalid member, if ``self.fail_fast``.
 
     """
 
-    __slots__ = ("items", "nullable")
+    __slots__ = ("items", "nullable", "fail_fast")
 
     def __init__(self, *args, **kw):
         # Python 2.7 complains on key-word only arguments
         kw.setdefault("items", args)
         self.__init(**kw)
 
-    def __init(self, items=None, nullable=False, alias=None, replace=False):
+    def __init(
+        self, items=None, nullable=False, fail_fast=False, alias=None, replace=False
+    ):
         items = contracts.expect_sequence(
             self, "items", items, item_type=abstract.Validator
         )
         nullable = contracts.expect_flag(self, "nullable", nullable)
+        fail_fast = contracts.expect_flag(self, "fail_fast", fail_fast)
 
         setattr = object.__setattr__
         setattr(self, "items", items)
         setattr(self, "nullable", nullable)
+        setattr(self, "fail_fast", fail_fast)
 
         self._register(alias, replace)
 
@@ -171,7 +301,9 @@ class Tuple(abstract.Validator):
             try:
                 val = self.items[num](val, __context)
             except exc.ValidationError as e:
-                errors.extend(ne.add_context(num) for ne in e)
+                errors.extend(e.add_context(num))
+                if self.fail_fast:
+                    break
                 continue
             result.append(val)
 
@@ -220,6 +352,9 @@ class Dict(abstract.Validator):
         ``val = value.getall(key)`` or ``val = value.getlist(key)``.
     :type multikeys: list or tuple
 
+    :param bool fail_fast:
+        stop validation on the first error.
+
 
     :raises InvalidTypeError:
         if ``not isinstance(value, collections.abc.Mapping)``.
@@ -234,7 +369,8 @@ class Dict(abstract.Validator):
         with all errors,
         raised by schema validators,
         extra validators,
-        and missing required and forbidden extra keys.
+        and missing required and forbidden extra keys,
+        or with the first error only, if ``self.fail_fast``.
 
     :note:
         on error raised by ``extra`` validators,
@@ -269,6 +405,10 @@ class Dict(abstract.Validator):
         "optional",
         "dispose",
         "multikeys",
+        "fail_fast",
+        "_validators",
+        "_simple",
+        "_missing",
     )
 
     def __init__(
@@ -282,6 +422,7 @@ class Dict(abstract.Validator):
         optional=None,
         dispose=None,
         multikeys=None,
+        fail_fast=False,
         alias=None,
         replace=False,
     ):
@@ -315,6 +456,7 @@ class Dict(abstract.Validator):
         multikeys = contracts.expect_container(
             self, "multikeys", multikeys, nullable=True, empty=True
         )
+        fail_fast = contracts.expect_flag(self, "fail_fast", fail_fast)
 
         setattr = object.__setattr__
         setattr(self, "schema", schema)
@@ -326,6 +468,20 @@ class Dict(abstract.Validator):
         setattr(self, "optional", optional)
         setattr(self, "dispose", dispose)
         setattr(self, "multikeys", multikeys)
+        setattr(self, "fail_fast", fail_fast)
+
+        # Schema validators are looked up in a plain ``dict``,
+        # and validation strategy is chosen once, see ``__call__``.
+        setattr(self, "_validators", None if schema is None else dict(schema.items()))
+        setattr(
+            self,
+            "_simple",
+            schema is not None
+            and extra is None
+            and dispose is None
+            and multikeys is None,
+        )
+        setattr(self, "_missing", _missing_keys(self))
 
         self._register(alias, replace)
 
@@ -340,62 +496,85 @@ class Dict(abstract.Validator):
 
         result = {}
         errors = []
-        getall = None
-        if self.multikeys is not None:
-            # If value is a multidict, specified keys should be treated
-            # as sequences, not as scalars.  The following popular multidict
-            # interfaces are supported:
-            #   multidict (value.getall)
-            #   webob.multidict (value.getall)
-            #   werkzeug.datastructures.MultiDict (value.getlist)
-            getall = getattr(value, "getall", None) or getattr(value, "getlist", None)
-
-        for key, val in value.items():
-            if self.dispose is not None and key in self.dispose:
-                continue
-            if getall is not None and key in self.multikeys:
-                val = getall(key)
-            if self.schema is not None and key in self.schema:
-                try:
-                    val = self.schema[key](val, __context)
-                except exc.ValidationError as e:
-                    errors.extend(ne.add_context(key) for ne in e)
-            elif self.extra is not None:
-                try:
-                    key = self.extra[0](key, __context)
-                except exc.ValidationError as e:
-                    errors.extend(
-                        ne.add_context(exc.EXTRA_KEY).add_context(key) for ne in e
-                    )
+        if self._simple:
+            # Schema only: a single lookup per key,
+            # and missing keys are not searched, if all keys are matched.
+            validators = self._validators
+            for key, val in value.items():
+                validator = validators.get(key)
+                if validator is None:
+                    errors.append(exc.ForbiddenKeyError(key))
+                    if self.fail_fast:
+                        break
+                    continue
                 try:
-                    val = self.extra[1](val, __context)
+                    val = validator(val, __context)
                 except exc.ValidationError as e:
-                    errors.extend(
-                        ne.add_context(exc.EXTRA_VALUE).add_context(key) for ne in e
-                    )
-            else:
-                errors.append(exc.ForbiddenKeyError(key))
-            result[key] = val
-
-        if self.schema is not None:
-            for key, validator in self.schema.items():
-                if key in result:
+                    errors.extend(e.add_context(key))
+                    if self.fail_fast:
+                        break
+                result[key] = val
+            missing = len(result) < len(validators)
+        else:
+            missing = self.schema is not None
+            getall = None
+            if self.multikeys is not None:
+                # If value is a multidict, specified keys should be treated
+                # as sequences, not as scalars.  The following popular multidict
+                # interfaces are supported:
+                #   multidict (value.getall)
+                #   webob.multidict (value.getall)
+                #   werkzeug.datastructures.MultiDict (value.getlist)
+                getall = getattr(value, "getall", None) or getattr(
+                    value, "getlist", None
+                )
+
+            for key, val in value.items():
+                if self.dispose is not None and key in self.dispose:
                     continue
-                if self.defaults is not None:
+                if getall is not None and key in self.multikeys:
+                    val = getall(key)
+                if self.schema is not None and key in self.schema:
                     try:
-                        default = self.defaults[key]
-                    except KeyError:
-                        pass
-                    else:
-                        default = default() if callable(default) else deepcopy(default)
-                        try:
-                            result[key] = validator(default, __context)
-                        except exc.ValidationError as e:
-                            errors.extend(ne.add_context(key) for ne in e)
-                        continue
-                if self.optional is not None and key in self.optional:
+                        val = self.schema[key](val, __context)
+                    except exc.ValidationError as e:
+                        errors.extend(e.add_context(key))
+                        if self.fail_fast:
+                            break
+                elif self.extra is not None:
+                    try:
+                        key = self.extra[0](key, __context)
+                    except exc.ValidationError as e:
+                        errors.extend(e.add_context(exc.EXTRA_KEY).add_context(key))
+                        if self.fail_fast:
+                            break
+                    try:
+                        val = self.extra[1](val, __context)
+                    except exc.ValidationError as e:
+                        errors.extend(e.add_context(exc.EXTRA_VALUE).add_context(key))
+                        if self.fail_fast:
+                            break
+                else:
+                    errors.append(exc.ForbiddenKeyError(key))
+                    if self.fail_fast:
+                        break
+                result[key] = val
+
+        if missing and not (errors and self.fail_fast):
+            for key, validator, default in self._missing:
+                if key in result:
                     continue
-                errors.append(exc.MissingKeyError(key))
+                if default is None:
+                    errors.append(exc.MissingKeyError(key))
+                    if self.fail_fast:
+                        break
+                    continue
+                try:
+                    result[key] = validator(default(), __context)
+                except exc.ValidationError as e:
+                    errors.extend(e.add_context(key))
+                    if self.fail_fast:
+                        break
 
         if errors:
             raise exc.SchemaError(errors)
@@ -407,3 +586,72 @@ class Dict(abstract.Validator):
             raise exc.MaxLengthError(expected=self.maxlen, actual=length)
 
         return result
+
+    def validate_columns(self, columns, errors="collect"):
+        """
+        Validate columns.
+
+        :param Mapping columns:
+            mapping of keys to columns,
+            i.e. sequences of values of the key in each row.
+            Number of rows is defined by the first column.
+
+        :param str errors:
+            how to handle validation errors of rows,
+            see :meth:`Validator.validate_many`.
+
+        :returns:
+            tuple ``(results, errors)``,
+            where ``results`` is a dict of validated columns,
+            excluding invalid rows,
+            and ``errors`` is a list of collected errors.
+
+        :raises InvalidTypeError:
+            if ``not isinstance(columns, Mapping)``.
+
+        :raises SchemaError:
+            *   regardless of ``errors``,
+                if a column is unknown, missing, it is not a sequence,
+                or its length differs from the number of rows;
+            *   with errors of the first invalid row,
+                if ``errors == "raise"``.
+
+        :raises MinLengthError:
+            if number of columns is less than ``self.minlen``.
+
+        :raises MaxLengthError:
+            if number of columns is greater than ``self.maxlen``.
+
+        Row index is used as the first node of error context,
+        see :mod:`validx.columnar` for details.
+
+        ..  testsetup:: validate_columns
+
+            from validx import Dict, Int, Str
+
+        ..  doctest:: validate_columns
+
+            >>> v = Dict({"x": Int(min=0), "y": Str()}, defaults={"y": "-"})
+            >>> results, errors = v.validate_columns({"x": [1, -2, 3]})
+            >>> results == {"x": [1, 3], "y": ["-", "-"]}
+            True
+            >>> errors
+            [<1.x: MinValueError(expected=0, actual=-2)>]
+
+        """
+        return columnar.validate(self, columns, errors)
+
+
+def _missing_keys(validator):
+    # Returns ``(key, validator, default)`` for each non-optional key in schema
+    # order, where ``default`` is a function returning default value,
+    # or ``None`` if the key is required.
+    if validator.schema is None:
+        return ()
+    result = []
+    for key, item in validator.schema.items():
+        if validator.defaults is not None and key in validator.defaults:
+            result.append((key, item, defaults.factory(validator.defaults[key])))
+        elif validator.optional is None or key not in validator.optional:
+            result.append((key, item, None))
+    return tuple(result)
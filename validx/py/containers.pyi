@@ -1,5 +1,6 @@
 import typing as t
 from . import abstract
+from ..exc import ValidationError
 
 class List(abstract.Validator):
     __slots__: t.Tuple[str, ...]
@@ -8,6 +9,7 @@ class List(abstract.Validator):
     minlen: t.Optional[int]
     maxlen: t.Optional[int]
     unique: t.Optional[bool]
+    fail_fast: t.Optional[bool]
     def __init__(
         self,
         item: abstract.Validator,
@@ -16,18 +18,24 @@ class List(abstract.Validator):
         minlen: int = None,
         maxlen: int = None,
         unique: bool = None,
+        fail_fast: bool = None,
         alias: str = None,
         replace: bool = False,
     ) -> None: ...
+    def iter_validate(
+        self, values: t.Iterable[t.Any], unique_window: int = None
+    ) -> t.Iterator[t.Any]: ...
 
 class Tuple(abstract.Validator):
     __slots__: t.Tuple[str, ...]
     items: t.List[abstract.Validator]
     nullable: t.Optional[bool]
+    fail_fast: t.Optional[bool]
     def __init__(
         self,
         *items: abstract.Validator,
         nullable: bool = None,
+        fail_fast: bool = None,
         alias: str = None,
         replace: bool = False,
     ) -> None: ...
@@ -43,6 +51,7 @@ class Dict(abstract.Validator):
     optional: t.Optional[t.Container]
     dispose: t.Optional[t.Container]
     multikeys: t.Optional[t.Container]
+    fail_fast: t.Optional[bool]
     def __init__(
         self,
         schema: t.Dict[t.Any, abstract.Validator] = None,
@@ -55,6 +64,10 @@ class Dict(abstract.Validator):
         optional: t.Container = None,
         dispose: t.Container = None,
         multikeys: t.Container = None,
+        fail_fast: bool = None,
         alias: str = None,
         replace: bool = False,
     ) -> None: ...
+    def validate_columns(
+        self, columns: t.Mapping[t.Any, t.Sequence], errors: str = "collect"
+    ) -> t.Tuple[t.Dict[t.Any, t.List[t.Any]], t.List[ValidationError]]: ...
@@ -0,0 +1,358 @@
+from __future__ import absolute_import
+
+import json
+import re
+from json.decoder import scanstring
+from json.scanner import make_scanner
+
+from .. import exc
+from ..compat.types import string
+from ..compiler import _kind
+from ..defaults import factory
+from ..introspection import accepts, registry
+
+__all__ = ["loads"]
+
+
+JSONDecodeError = getattr(json, "JSONDecodeError", ValueError)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SPACES = " \t\n\r"
+
+# Strings without escapes and control characters,
+# their length is the same before and after decoding
+_PLAIN = re.compile(r'"[^"\\\x00-\x1f]*"')
+
+# Tokens, that have to be tracked to skip containers:
+# strings (which can contain brackets) and brackets
+_TOKENS = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]', re.DOTALL)
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+_scan = make_scanner(json.JSONDecoder())
+
+_detect_encoding = getattr(json, "detect_encoding", lambda data: "utf-8")
+
+
+def loads(validator, data, context=None):
+    """
+    Parse and validate JSON document
+
+    :param Validator validator:
+        validator of the document.
+
+    :param data:
+        JSON document, ``str``, ``bytes``, or ``bytearray``,
+        bytes are decoded the same way :func:`json.loads` does.
+
+    :param dict context:
+        validation context.
+
+    :returns:
+        validated document.
+
+    :raises ValueError:
+        (:class:`json.JSONDecodeError` on Python 3)
+        if the document is malformed.
+
+    :raises ValidationError:
+        if the document is invalid.
+
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode(_detect_encoding(data), "surrogatepass")
+    elif not isinstance(data, string):
+        raise TypeError(
+            "Expected data to be str, bytes or bytearray, got %r" % (type(data),)
+        )
+    elif data.startswith(u"\ufeff"):
+        raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)", data, 0)
+    if context is None:
+        context = {}
+    parser = _Parser(data, context)
+    try:
+        result = parser.parse(validator, parser.space(0))
+    except exc.ValidationError:
+        if parser.end is not None:
+            parser.finish()
+        raise
+    parser.finish()
+    return result
+
+
+class _Parser(object):
+    def __init__(self, text, context):
+        self.text = text
+        self.context = context
+        # Index of the end of the last parsed value,
+        # or ``None``, if parsing of containers has been stopped
+        # at ``self.pos`` by their validators,
+        # where ``self.unclosed`` is number of the stopped containers
+        self.end = 0
+        self.pos = 0
+        self.unclosed = 0
+
+    # Parsing
+    # =======
+
+    def space(self, idx):
+        if self.text[idx : idx + 1] in _SPACES:
+            return _WHITESPACE.match(self.text, idx).end()
+        return idx
+
+    def next(self):
+        # Returns the end of the last parsed value,
+        # stopped containers are skipped
+        if self.end is None:
+            self.end = self.skip_open(self.pos, self.unclosed)
+        return self.end
+
+    def stop(self):
+        # Stops parsing of container after the last parsed value
+        if self.end is None:
+            self.unclosed += 1
+        else:
+            self.pos = self.end
+            self.unclosed = 1
+            self.end = None
+
+    def finish(self):
+        end = self.space(self.end)
+        if end != len(self.text):
+            raise JSONDecodeError("Extra data", self.text, end)
+
+    def parse(self, validator, idx):
+        # Parses value at the index, sets ``self.end``,
+        # and returns the value validated by the validator
+        text = self.text
+        char = text[idx : idx + 1]
+        kind = _kind(validator)
+        if kind == "LazyRef":
+            return self.parse_lazyref(validator, idx)
+        if char == "{":
+            if kind == "Dict":
+                return self.parse_dict(validator, idx)
+            return self.parse_container(validator, idx, {})
+        if char == "[":
+            if kind == "List":
+                return self.parse_list(validator, idx)
+            return self.parse_container(validator, idx, [])
+        if char == '"' and kind == "Str" and validator.maxlen is not None:
+            match = _PLAIN.match(text, idx)
+            if match is not None and match.end() - idx - 2 > validator.maxlen:
+                self.end = match.end()
+                raise exc.MaxLengthError(
+                    expected=validator.maxlen, actual=match.end() - idx - 2
+                )
+        value = self.scan(idx)
+        return validator(value, self.context)
+
+    def scan(self, idx):
+        try:
+            value, self.end = _scan(self.text, idx)
+        except StopIteration as e:
+            raise JSONDecodeError("Expecting value", self.text, e.value)
+        return value
+
+    def parse_container(self, validator, idx, empty):
+        # Container, which type is not accepted by validator,
+        # is skipped, and the empty one of the same type
+        # makes the validator raise the same error
+        types = accepts(validator)
+        if types is not None and (
+            not isinstance(empty, types[0]) or isinstance(empty, types[1])
+        ):
+            self.end = self.skip_open(idx + 1, 1)
+            return validator(empty, self.context)
+        return validator(self.scan(idx), self.context)
+
+    def parse_lazyref(self, validator, idx):
+        # See ``LazyRef.__call__``
+        instance = registry(validator).get(validator.use)
+        if validator.maxdepth is None:
+            return self.parse(instance, idx)
+        context = self.context
+        try:
+            key = validator.use + ".recursion_depth"
+            depth = context.setdefault(key, 0) + 1
+            if depth > validator.maxdepth:
+                self.end = self.skip(idx)
+                raise exc.RecursionMaxDepthError(
+                    expected=validator.maxdepth, actual=depth
+                )
+            context[key] = depth
+            return self.parse(instance, idx)
+        finally:
+            context[key] -= 1
+
+    def parse_list(self, validator, idx):
+        # See ``List.__call__``
+        text = self.text
+        item = validator.item
+        maxlen = validator.maxlen
+        fail_fast = validator.fail_fast
+        unique = set() if validator.unique else None
+
+        result = []
+        errors = []
+        idx = self.space(idx + 1)
+        if text[idx : idx + 1] == "]":
+            idx += 1
+        else:
+            num = 0
+            while True:
+                try:
+                    val = self.parse(item, idx)
+                except exc.ValidationError as e:
+                    errors.extend(e.add_context(num))
+                    if fail_fast:
+                        self.stop()
+                        raise exc.SchemaError(errors)
+                else:
+                    if unique is None or val not in unique:
+                        if unique is not None:
+                            unique.add(val)
+                        result.append(val)
+                        if maxlen is not None and len(result) > maxlen and not errors:
+                            self.stop()
+                            raise exc.MaxLengthError(expected=maxlen, actual=maxlen + 1)
+                idx = self.space(self.next())
+                char = text[idx : idx + 1]
+                if char == "]":
+                    idx += 1
+                    break
+                if char != ",":
+                    raise JSONDecodeError("Expecting ',' delimiter", text, idx)
+                idx = self.space(idx + 1)
+                num += 1
+        self.end = idx
+
+        if errors:
+            raise exc.SchemaError(errors)
+
+        length = len(result)
+        if validator.minlen is not None and length < validator.minlen:
+            raise exc.MinLengthError(expected=validator.minlen, actual=length)
+        return result
+
+    def parse_dict(self, validator, idx):
+        # See ``Dict.__call__``
+        text = self.text
+        context = self.context
+        schema = validator.schema
+        extra = validator.extra
+        dispose = validator.dispose
+        maxlen = validator.maxlen
+        fail_fast = validator.fail_fast
+
+        result = {}
+        errors = []
+        idx = self.space(idx + 1)
+        if text[idx : idx + 1] == "}":
+            idx += 1
+        else:
+            while True:
+                if text[idx : idx + 1] != '"':
+                    raise JSONDecodeError(
+                        "Expecting property name enclosed in double quotes", text, idx
+                    )
+                key, idx = scanstring(text, idx + 1)
+                idx = self.space(idx)
+                if text[idx : idx + 1] != ":":
+                    raise JSONDecodeError("Expecting ':' delimiter", text, idx)
+                idx = self.end = self.space(idx + 1)
+                failed = len(errors)
+                if dispose is not None and key in dispose:
+                    self.end = self.skip(idx)
+                elif schema is not None and key in schema:
+                    try:
+                        result[key] = self.parse(schema[key], idx)
+                    except exc.ValidationError as e:
+                        errors.extend(e.add_context(key))
+                        result[key] = None
+                elif extra is not None:
+                    try:
+                        key = extra[0](key, context)
+                    except exc.ValidationError as e:
+                        errors.extend(e.add_context(exc.EXTRA_KEY).add_context(key))
+                    if not (errors and fail_fast):
+                        try:
+                            result[key] = self.parse(extra[1], idx)
+                        except exc.ValidationError as e:
+                            errors.extend(
+                                e.add_context(exc.EXTRA_VALUE).add_context(key)
+                            )
+                            result[key] = None
+                else:
+                    errors.append(exc.ForbiddenKeyError(key))
+                    if not fail_fast:
+                        self.end = self.skip(idx)
+                if len(errors) > failed and fail_fast:
+                    self.stop()
+                    raise exc.SchemaError(errors)
+                if maxlen is not None and len(result) > maxlen and not errors:
+                    self.stop()
+                    raise exc.MaxLengthError(expected=maxlen, actual=maxlen + 1)
+                idx = self.space(self.next())
+                char = text[idx : idx + 1]
+                if char == "}":
+                    idx += 1
+                    break
+                if char != ",":
+                    raise JSONDecodeError("Expecting ',' delimiter", text, idx)
+                idx = self.space(idx + 1)
+        self.end = idx
+
+        if schema is not None and not (errors and fail_fast):
+            # See ``lazy._validate_shape``
+            defaults = validator.defaults
+            optional = validator.optional
+            for key, item in schema.items():
+                if key in result:
+                    continue
+                if defaults is not None and key in defaults:
+                    try:
+                        result[key] = item(factory(defaults[key])(), context)
+                    except exc.ValidationError as e:
+                        errors.extend(e.add_context(key))
+                        if fail_fast:
+                            break
+                elif optional is None or key not in optional:
+                    errors.append(exc.MissingKeyError(key))
+                    if fail_fast:
+                        break
+
+        if errors:
+            raise exc.SchemaError(errors)
+
+        length = len(result)
+        if validator.minlen is not None and length < validator.minlen:
+            raise exc.MinLengthError(expected=validator.minlen, actual=length)
+        return result
+
+    # Skipping
+    # ========
+
+    def skip(self, idx):
+        # Returns the end of value at the index without building it
+        char = self.text[idx : idx + 1]
+        if char in ("{", "["):
+            return self.skip_open(idx + 1, 1)
+        if char == '"':
+            match = _STRING.match(self.text, idx)
+            if match is None:
+                raise JSONDecodeError("Unterminated string", self.text, idx)
+            return match.end()
+        self.scan(idx)
+        return self.end
+
+    def skip_open(self, idx, depth):
+        # Returns the end of containers opened before the index
+        for match in _TOKENS.finditer(self.text, idx):
+            token = match.group()
+            if token in ("[", "{"):
+                depth += 1
+            elif token in ("]", "}"):
+                depth -= 1
+                if not depth:
+                    return match.end()
+        raise JSONDecodeError("Unterminated container", self.text, idx)
@@ -78,6 +78,18 @@ def get(alias):
         raise KeyError("Instance '%s' is not registered" % alias)
 
 
+def items():
+    """
+    List registered validators
+
+
+    :returns:
+        list of ``(alias, instance)`` pairs.
+
+    """
+    return list(_instances.items())
+
+
 def clear():
     """Clear the registry"""
     _instances.clear()
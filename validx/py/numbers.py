@@ -1,5 +1,6 @@
 import math
 
+from .. import arrays
 from .. import contracts
 from .. import exc
 from ..compat.types import numbers
@@ -100,6 +101,20 @@ class Int(abstract.Validator):
             raise exc.OptionsError(expected=self.options, actual=value)
         return value
 
+    def validate_many(self, values, errors="collect"):
+        """
+        Validate many values.
+
+        Same as :meth:`Validator.validate_many`,
+        but numeric arrays are validated in one pass,
+        see :mod:`validx.arrays`.
+
+        """
+        result = arrays.validate_int(self, values, errors)
+        if result is None:
+            result = super(Int, self).validate_many(values, errors)
+        return result
+
 
 class Float(abstract.Validator):
     """
@@ -205,3 +220,17 @@ class Float(abstract.Validator):
         if self.max is not None and value > self.max:
             raise exc.MaxValueError(expected=self.max, actual=value)
         return value
+
+    def validate_many(self, values, errors="collect"):
+        """
+        Validate many values.
+
+        Same as :meth:`Validator.validate_many`,
+        but numeric arrays are validated in one pass,
+        see :mod:`validx.arrays`.
+
+        """
+        result = arrays.validate_float(self, values, errors)
+        if result is None:
+            result = super(Float, self).validate_many(values, errors)
+        return result
@@ -1,4 +1,5 @@
 from .. import contracts
+from .. import dispatch
 from .. import exc
 from . import abstract
 
@@ -62,10 +63,22 @@ class OneOf(abstract.Validator):
     :param Validator \\*steps:
         nested validators.
 
+    :param bool fail_fast:
+        keep errors of the last failed step only,
+        instead of accumulating errors of all steps.
+
+    :param str discriminator:
+        key of dicts, that tells ``Dict`` steps apart,
+        if it's not specified, it is detected automatically.
+        Steps are dispatched by type of value and by discriminator,
+        so that only steps, which can accept the value, are tried,
+        see :mod:`validx.dispatch`.
+
     :raises SchemaError:
         if all steps are failed,
         so it contains all errors,
-        raised by each step.
+        raised by each step
+        (or by the last one, if ``self.fail_fast``).
 
     :note:
         it uses :class:`validx.exc.Step` marker to indicate,
@@ -73,20 +86,34 @@ class OneOf(abstract.Validator):
 
     """
 
-    __slots__ = ("steps",)
+    __slots__ = ("steps", "fail_fast", "discriminator", "_dispatch")
 
     def __init__(self, *args, **kw):
         # Python 2.7 complains on key-word only arguments
         kw.setdefault("steps", args)
         self.__init(**kw)
 
-    def __init(self, steps=None, alias=None, replace=False):
+    def __init(
+        self,
+        steps=None,
+        fail_fast=False,
+        discriminator=None,
+        alias=None,
+        replace=False,
+    ):
         steps = contracts.expect_sequence(
             self, "steps", steps, item_type=abstract.Validator
         )
+        fail_fast = contracts.expect_flag(self, "fail_fast", fail_fast)
+        discriminator = contracts.expect_basestr(
+            self, "discriminator", discriminator, nullable=True
+        )
 
         setattr = object.__setattr__
         setattr(self, "steps", steps)
+        setattr(self, "fail_fast", fail_fast)
+        setattr(self, "discriminator", discriminator)
+        setattr(self, "_dispatch", dispatch.build(steps, discriminator))
 
         self._register(alias, replace)
 
@@ -94,11 +121,29 @@ class OneOf(abstract.Validator):
         if __context is None:
             __context = {}  # Setup context, if it's top level call
 
+        failed = None
+        if self._dispatch is not None:
+            # Other steps are known to fail,
+            # they are only called below to collect their errors
+            failed = {}
+            for num in self._dispatch(value):
+                try:
+                    return self.steps[num](value, __context)
+                except exc.ValidationError as e:
+                    failed[num] = e
+
         errors = []
         for num, step in enumerate(self.steps):
-            try:
-                return step(value, __context)
-            except exc.ValidationError as e:
-                errors.extend(ne.add_context(exc.Step(num)) for ne in e)
+            if failed is not None and num in failed:
+                error = failed[num]
+            else:
+                try:
+                    return step(value, __context)
+                except exc.ValidationError as e:
+                    error = e
+            if self.fail_fast:
+                errors = list(error.add_context(exc.Step(num)))
+            else:
+                errors.extend(error.add_context(exc.Step(num)))
         if errors:
             raise exc.SchemaError(errors)
@@ -1,6 +1,13 @@
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+
 from .. import exc
 from .. import contracts
+from .. import lazy
+from .. import memo
 from . import abstract, instances
+from .containers import Dict
 
 
 class LazyRef(abstract.Validator):
@@ -39,7 +46,7 @@ class LazyRef(abstract.Validator):
         >>> schema({"bar": {"bar": {"foo": 1}}})
         Traceback (most recent call last):
             ...
-        validx.exc.errors.SchemaError: <SchemaError(errors=[
+        validx.exc.SchemaError: <SchemaError(errors=[
             <bar.bar: RecursionMaxDepthError(expected=1, actual=2)>
         ])>
 
@@ -255,3 +262,197 @@ class Any(abstract.Validator):
 
     def __call__(self, value, __context=None):
         return value
+
+
+class Cached(abstract.Validator):
+    """
+    Memoizing Validator
+
+    It caches results of nested validator for repeated values,
+    see :mod:`validx.memo` for cacheable values.
+    Other values are validated as usual.
+    Nested validators depending on current time,
+    i.e. ``Date`` and ``Datetime`` with ``relmin`` or ``relmax``,
+    are not cached at all.
+
+    Cache lookup costs about a microsecond for scalars,
+    and grows with size of the value,
+    since the value is converted into a key on each call.
+    So caching pays off for expensive validators,
+    e.g. long strings matched against patterns
+    or custom validators making lookups,
+    rather than for small dicts of built-in validators.
+
+    ..  testsetup:: cached
+
+        from validx import Cached, Str
+
+    ..  doctest:: cached
+
+        >>> schema = Cached(Str(options=["DE", "FR", "US"]), maxsize=100)
+        >>> schema("US")
+        'US'
+        >>> schema("US")
+        'US'
+        >>> schema.cache_info()
+        CacheInfo(hits=1, misses=1, bypasses=0, maxsize=100, currsize=1)
+
+    :param Validator validator:
+        validator to cache results of.
+
+    :param int maxsize:
+        maximum number of cached values,
+        the least recently used ones are evicted.
+
+    :param float ttl:
+        time to live of cached values in seconds.
+
+    :param bool cache_errors:
+        cache validation errors too.
+
+    """
+
+    __slots__ = (
+        "validator",
+        "maxsize",
+        "ttl",
+        "cache_errors",
+        "_cache",
+        "_lock",
+        "_stats",
+        "_bypass",
+    )
+
+    def __init__(
+        self,
+        validator,
+        maxsize=1024,
+        ttl=None,
+        cache_errors=False,
+        alias=None,
+        replace=False,
+    ):
+        validator = contracts.expect(
+            self, "validator", validator, types=abstract.Validator
+        )
+        maxsize = contracts.expect_length(self, "maxsize", maxsize)
+        ttl = contracts.expect(
+            self, "ttl", ttl, nullable=True, types=(int, float), not_types=bool
+        )
+        cache_errors = contracts.expect_flag(self, "cache_errors", cache_errors)
+
+        setattr = object.__setattr__
+        setattr(self, "validator", validator)
+        setattr(self, "maxsize", maxsize)
+        setattr(self, "ttl", ttl)
+        setattr(self, "cache_errors", cache_errors)
+
+        # Cache maps frozen values to ``(expires, copier, error)`` entries,
+        # and its order is the order of usage,
+        # the lock guards the cache and its statistics.
+        setattr(self, "_cache", OrderedDict())
+        setattr(self, "_lock", Lock())
+        setattr(self, "_stats", [0, 0, 0])  # Hits, misses, bypasses
+        setattr(self, "_bypass", memo.depends_on_time(validator))
+
+        self._register(alias, replace)
+
+    def __call__(self, value, __context=None):
+        if not self._bypass:
+            try:
+                key = memo.freeze(value)
+            except TypeError:
+                pass
+            else:
+                return self._cached_call(key, value, __context)
+        with self._lock:
+            self._stats[2] += 1
+        return self.validator(value, __context)
+
+    def _cached_call(self, key, value, context):
+        # Lookup and update of the cache are locked, but validation is not,
+        # so concurrent misses of the same key just validate the value twice
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is not None and (entry[0] is None or entry[0] > memo.clock()):
+                self._cache[key] = entry  # Mark as the most recently used
+                self._stats[0] += 1
+            else:
+                entry = None
+                self._stats[1] += 1
+        if entry is not None:
+            if entry[2] is not None:
+                raise deepcopy(entry[2])
+            return entry[1]()
+
+        expires = None if self.ttl is None else memo.clock() + self.ttl
+        try:
+            result = self.validator(value, context)
+        except exc.ValidationError as e:
+            if self.cache_errors:
+                self._store(key, (expires, None, deepcopy(e)))
+            raise
+        copier = memo.copier(result)
+        self._store(key, (expires, copier, None))
+        return copier()
+
+    def _store(self, key, entry):
+        cache = self._cache
+        with self._lock:
+            cache[key] = entry
+            while len(cache) > self.maxsize:
+                cache.popitem(last=False)
+
+    def cache_info(self):
+        """
+        Get cache statistics.
+
+        :returns:
+            named tuple
+            ``CacheInfo(hits, misses, bypasses, maxsize, currsize)``,
+            where ``bypasses`` is number of values validated without cache.
+
+        """
+        with self._lock:
+            hits, misses, bypasses = self._stats
+            currsize = len(self._cache)
+        return memo.CacheInfo(hits, misses, bypasses, self.maxsize, currsize)
+
+    def cache_clear(self):
+        """Clear cache and its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._stats[:] = [0, 0, 0]
+
+
+class Lazy(abstract.Validator):
+    """
+    Lazy Validator
+
+    It validates type, keys, and length of dict immediately,
+    and returns read-only mapping,
+    that validates each value on first access,
+    see :mod:`validx.lazy`.
+    It pays off, when only a few values of large dict are used.
+
+
+    :param Dict validator:
+        validator of dict.
+
+    :raises ValidationError:
+        errors of type, keys, and length, raised by the validator.
+
+    """
+
+    __slots__ = ("validator",)
+
+    def __init__(self, validator, alias=None, replace=False):
+        validator = contracts.expect(self, "validator", validator, types=Dict)
+
+        setattr = object.__setattr__
+        setattr(self, "validator", validator)
+
+        self._register(alias, replace)
+
+    def __call__(self, value, __context=None):
+        return lazy.validate(self.validator, value, __context)
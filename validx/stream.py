@@ -0,0 +1,232 @@
+"""
+Validation of JSON Lines
+
+Function :func:`validate_lines` validates a file of JSON Lines
+(also known as NDJSON), i.e. a file, each line of which is a JSON document.
+Lines are read lazily, parsed and validated by :func:`validx.json.loads`
+chunk by chunk, and passed to sinks in order:
+
+*   valid records are passed to ``valid`` sink;
+*   errors of invalid records are passed to ``invalid`` sink as reports,
+    i.e. dicts ``{"line": ..., "context": ..., "error": ...}``,
+    where ``line`` is a number of the line starting from one,
+    ``context`` and ``error`` are formatted by
+    :meth:`validx.exc.ValidationError.format_context` and
+    :meth:`validx.exc.ValidationError.format_error`,
+    or ``context`` is empty and ``error`` is a message of
+    :class:`json.JSONDecodeError`, if the line is malformed.
+
+Chunks are validated in a pool of worker processes or threads,
+like :func:`validx.parallel.validate_many` does,
+only a few chunks per worker are in flight at once,
+so memory usage does not depend on size of the file.
+Function :func:`writer` makes a sink, that writes JSON Lines too.
+
+..  testsetup:: stream
+
+    import io
+    from validx import Dict, Int
+    from validx.stream import validate_lines, writer
+
+..  doctest:: stream
+
+    >>> schema = Dict({"id": Int(min=0)})
+    >>> source = io.BytesIO(b'{"id": 1}\\n{"id": -1}\\n\\n{"id": 2, "x": 1}\\n{"id"\\n')
+    >>> valid = io.StringIO()
+    >>> report = []
+    >>> validate_lines(
+    ...     schema, source, valid=writer(valid), invalid=report.append, workers=0
+    ... )
+    (1, 3)
+    >>> print(valid.getvalue())
+    {"id": 1}
+    <BLANKLINE>
+    >>> for item in report:
+    ...     print(item["line"], item["context"], item["error"])
+    2 id MinValueError(expected=0, actual=-1)
+    4 x ForbiddenKeyError()
+    5  Expecting ':' delimiter: line 1 column 6 (char 5)
+
+"""
+
+import json
+import mmap as _mmap
+import os
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from . import exc
+from .compat.types import basestr
+from .json import loads
+from .parallel import _backends, _chunks, _imap
+
+__all__ = ["validate_lines", "writer"]
+
+
+# Validator of the current worker process, see ``_setup``
+_validator = None
+
+
+def validate_lines(
+    validator,
+    source,
+    valid=None,
+    invalid=None,
+    workers=None,
+    backend="process",
+    chunksize=1000,
+    mmap=False,
+):
+    """
+    Validate JSON Lines
+
+    :param Validator validator:
+        validator of each line.
+
+    :param source:
+        path to the file, or the file opened in binary mode.
+
+    :param callable valid:
+        sink of valid records, they are dropped by default.
+
+    :param callable invalid:
+        sink of error reports, they are dropped by default.
+
+    :param int workers:
+        number of workers, defaults to number of CPUs,
+        ``0`` stands for validation in the calling thread.
+
+    :param str backend:
+        ``"process"`` or ``"thread"``.
+
+    :param int chunksize:
+        number of lines validated by worker at once.
+
+    :param bool mmap:
+        read the file via memory map,
+        its pages are counted into resident memory of the process,
+        but they are backed by the file and can be reclaimed by OS.
+
+    :returns:
+        tuple ``(valid, invalid)`` of numbers of valid and invalid records,
+        blank lines are skipped and not counted.
+
+    """
+    if backend not in _backends:
+        raise ValueError(
+            "Expected backend to be one of 'process' or 'thread', got %r" % (backend,)
+        )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError("Expected workers to be non-negative, got %r" % (workers,))
+    if chunksize < 1:
+        raise ValueError("Expected chunksize to be positive, got %r" % (chunksize,))
+
+    if isinstance(source, basestr):
+        with open(source, "rb") as file:
+            return validate_lines(
+                validator, file, valid, invalid, workers, backend, chunksize, mmap
+            )
+    if mmap:
+        with _mmap.mmap(source.fileno(), 0, access=_mmap.ACCESS_READ) as mapped:
+            return validate_lines(
+                validator, mapped, valid, invalid, workers, backend, chunksize
+            )
+
+    lines = iter(source.readline, b"")
+    counts = [0, 0]
+    if not workers:
+        for offset, chunk in _chunks(lines, chunksize):
+            _dispatch(_validate(validator, offset, chunk), valid, invalid, counts)
+        return tuple(counts)
+
+    if backend == "process":
+        executor = ProcessPoolExecutor(
+            workers, initializer=_setup, initargs=(validator,)
+        )
+        function = _validate_chunk
+    else:
+        executor = ThreadPoolExecutor(workers)
+        function = partial(_validate, validator)
+
+    results = _imap(executor, function, _chunks(lines, chunksize), workers)
+    with closing(results):
+        for chunk_results in results:
+            _dispatch(chunk_results, valid, invalid, counts)
+    return tuple(counts)
+
+
+def writer(file):
+    """
+    Make sink writing JSON Lines
+
+    :param file:
+        file opened in text mode.
+
+    :returns:
+        callable, that writes its argument to the file
+        as a line of JSON.
+
+    """
+
+    def write(record):
+        file.write(json.dumps(record))
+        file.write("\n")
+
+    return write
+
+
+def _dispatch(results, valid, invalid, counts):
+    # Passes results of chunk to sinks,
+    # ``results`` are ``(is_valid, value_or_reports)`` pairs
+    for is_valid, result in results:
+        if is_valid:
+            counts[0] += 1
+            if valid is not None:
+                valid(result)
+        else:
+            counts[1] += 1
+            if invalid is not None:
+                for report in result:
+                    invalid(report)
+
+
+def _validate(validator, offset, chunk):
+    # Blank lines are skipped, trailing whitespace is stripped
+    # to keep positions of decoding errors within the line,
+    # errors are formatted into reports within worker,
+    # so that they are cheap to pickle
+    results = []
+    for number, line in enumerate(chunk, offset + 1):
+        line = line.rstrip()
+        if not line:
+            continue
+        try:
+            results.append((True, loads(validator, line)))
+        except exc.ValidationError as e:
+            results.append((False, [_report(number, error) for error in e]))
+        except ValueError as e:
+            results.append((False, [{"line": number, "context": "", "error": str(e)}]))
+    return results
+
+
+def _report(number, error):
+    return {
+        "line": number,
+        "context": error.format_context(),
+        "error": error.format_error(),
+    }
+
+
+# Functions below run in worker processes, out of sight of coverage
+
+
+def _setup(validator):  # pragma: no cover
+    global _validator
+    _validator = validator
+
+
+def _validate_chunk(offset, chunk):  # pragma: no cover
+    return _validate(_validator, offset, chunk)